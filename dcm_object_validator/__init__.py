@@ -11,7 +11,16 @@ from dcm_common.services import DefaultView, ReportView
 from dcm_common.services import extensions
 
 from dcm_object_validator.config import AppConfig
-from dcm_object_validator.views import ValidationView
+from dcm_object_validator.views import (
+    ValidationView,
+    ReportRecordsView,
+    MetricsView,
+    LoadStatusView,
+)
+from dcm_object_validator.metrics import REGISTRY
+from dcm_object_validator.plugins.validation.checkpoint import (
+    cleanup_checkpoints,
+)
 
 
 def app_factory(
@@ -36,6 +45,10 @@ def app_factory(
     app = Flask(__name__)
     app.config.from_object(config)
 
+    # remove checkpoints of failed or aborted jobs
+    if config.CHECKPOINT_DIR is not None:
+        cleanup_checkpoints(config.CHECKPOINT_DIR, config.CHECKPOINT_MAX_AGE)
+
     # create OrchestratedView-class
     view = ValidationView(config)
     # and register job-types with the worker-pool
@@ -74,5 +87,19 @@ def app_factory(
         ReportView(config).get_blueprint(),
         url_prefix="/"
     )
+    app.register_blueprint(
+        ReportRecordsView(config).get_blueprint(),
+        url_prefix="/"
+    )
+    app.register_blueprint(
+        LoadStatusView(config, ready=ready).get_blueprint(),
+        url_prefix="/"
+    )
+    if config.METRICS:
+        REGISTRY.configure(config.METRICS_DIR)
+        app.register_blueprint(
+            MetricsView(config).get_blueprint(),
+            url_prefix="/"
+        )
 
     return app
@@ -19,6 +19,7 @@ from dcm_object_validator.plugins import (
     IntegrityPlugin,
     BagItIntegrityPlugin,
 )
+from dcm_object_validator.plugins.validation.ordering import ORDERS
 
 
 def plugin_ok(plugin: type[PluginInterface]) -> bool:
@@ -69,6 +70,158 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
         JHOVEFidoMIMETypeBagItPlugin,
     ]
 
+    # ------ REPORTS ------
+    REPORT_PUSH_INTERVAL = float(
+        os.environ.get("REPORT_PUSH_INTERVAL") or 1
+    )
+    COMPACT_RECORDS = (int(os.environ.get("COMPACT_RECORDS") or 0)) == 1
+    TIMING_SLOWEST_RECORDS = int(
+        os.environ.get("TIMING_SLOWEST_RECORDS") or 10
+    )
+    REPORT_STORE_DIR = (
+        Path(os.environ.get("REPORT_STORE_DIR"))
+        if "REPORT_STORE_DIR" in os.environ
+        else None
+    )
+    REPORT_STORE_RETENTION = int(
+        os.environ.get("REPORT_STORE_RETENTION") or 1000
+    )
+
+    # ------ RECORDS ------
+    RECORD_ORDER = os.environ.get("RECORD_ORDER") or "discovery"
+
+    # ------ SYNCHRONOUS VALIDATION ------
+    SYNC_VALIDATION = (int(os.environ.get("SYNC_VALIDATION") or 0)) == 1
+    SYNC_VALIDATION_MAX_SIZE = int(
+        os.environ.get("SYNC_VALIDATION_MAX_SIZE") or 10485760
+    )
+    SYNC_VALIDATION_TIMEOUT = float(
+        os.environ.get("SYNC_VALIDATION_TIMEOUT") or 10
+    )
+
+    # ------ SHARDING ------
+    SHARDING = (int(os.environ.get("SHARDING") or 0)) == 1
+    SHARDING_SHARD_SIZE = int(os.environ.get("SHARDING_SHARD_SIZE") or 10000)
+    SHARDING_TIMEOUT = float(os.environ.get("SHARDING_TIMEOUT") or 10)
+    SHARDING_POLL_INTERVAL = float(
+        os.environ.get("SHARDING_POLL_INTERVAL") or 1
+    )
+
+    # ------ SCHEDULING ------
+    SCHEDULING_DIR = (
+        Path(os.environ.get("SCHEDULING_DIR"))
+        if "SCHEDULING_DIR" in os.environ
+        else None
+    )
+    SCHEDULING_EXPRESS_MAX_FILES = int(
+        os.environ.get("SCHEDULING_EXPRESS_MAX_FILES") or 100
+    )
+    SCHEDULING_EXPRESS_MAX_SIZE = int(
+        os.environ.get("SCHEDULING_EXPRESS_MAX_SIZE") or 104857600
+    )
+    SCHEDULING_EXPRESS_CAPACITY = (
+        int(os.environ["SCHEDULING_EXPRESS_CAPACITY"])
+        if "SCHEDULING_EXPRESS_CAPACITY" in os.environ
+        else None
+    )
+    SCHEDULING_BULK_CAPACITY = (
+        int(os.environ["SCHEDULING_BULK_CAPACITY"])
+        if "SCHEDULING_BULK_CAPACITY" in os.environ
+        else None
+    )
+    SCHEDULING_STAT_LIMIT = int(
+        os.environ.get("SCHEDULING_STAT_LIMIT") or 100000
+    )
+    SCHEDULING_RETRY_AFTER = int(
+        os.environ.get("SCHEDULING_RETRY_AFTER") or 60
+    )
+
+    # ------ ADMISSION CONTROL ------
+    ADMISSION_MAX_QUEUE_DEPTH = (
+        int(os.environ["ADMISSION_MAX_QUEUE_DEPTH"])
+        if "ADMISSION_MAX_QUEUE_DEPTH" in os.environ
+        else None
+    )
+    ADMISSION_MAX_QUEUED_BYTES = (
+        int(os.environ["ADMISSION_MAX_QUEUED_BYTES"])
+        if "ADMISSION_MAX_QUEUED_BYTES" in os.environ
+        else None
+    )
+
+    # ------ LOAD STATUS ------
+    # defaults to the number of orchestration workers (see `__init__`)
+    LOAD_STATUS_WORKERS = (
+        int(os.environ["LOAD_STATUS_WORKERS"])
+        if "LOAD_STATUS_WORKERS" in os.environ
+        else None
+    )
+    LOAD_STATUS_WINDOW = float(os.environ.get("LOAD_STATUS_WINDOW") or 60)
+
+    # ------ ESTIMATION ------
+    ESTIMATION_FILE = (
+        Path(os.environ.get("ESTIMATION_FILE"))
+        if "ESTIMATION_FILE" in os.environ
+        else None
+    )
+    ESTIMATION_DECAY = float(os.environ.get("ESTIMATION_DECAY") or 0.9)
+
+    # ------ CHECKPOINTS ------
+    CHECKPOINT_DIR = (
+        Path(os.environ.get("CHECKPOINT_DIR"))
+        if "CHECKPOINT_DIR" in os.environ
+        else None
+    )
+    CHECKPOINT_MAX_AGE = float(
+        os.environ.get("CHECKPOINT_MAX_AGE") or 604800
+    )
+
+    # ------ RESOURCE LIMITS ------
+    RECORD_TIMEOUT = (
+        float(os.environ["RECORD_TIMEOUT"])
+        if "RECORD_TIMEOUT" in os.environ
+        else None
+    )
+    JOB_TIMEOUT = (
+        float(os.environ["JOB_TIMEOUT"])
+        if "JOB_TIMEOUT" in os.environ
+        else None
+    )
+    TOOL_MEMORY_LIMIT = (
+        int(os.environ["TOOL_MEMORY_LIMIT"])
+        if "TOOL_MEMORY_LIMIT" in os.environ
+        else None
+    )
+
+    # ------ METRICS ------
+    METRICS = (int(os.environ.get("METRICS") or 0)) == 1
+    METRICS_DIR = (
+        Path(os.environ.get("METRICS_DIR"))
+        if "METRICS_DIR" in os.environ
+        else None
+    )
+
+    # ------ PROFILING ------
+    PROFILING_DIR = (
+        Path(os.environ.get("PROFILING_DIR"))
+        if "PROFILING_DIR" in os.environ
+        else None
+    )
+    PROFILING_MEMORY = (int(os.environ.get("PROFILING_MEMORY") or 0)) == 1
+    PROFILING_RECORDS = (int(os.environ.get("PROFILING_RECORDS") or 0)) == 1
+    PROFILING_RETENTION = int(os.environ.get("PROFILING_RETENTION") or 10)
+
+    # ------ TRACING ------
+    TRACING_DIR = (
+        Path(os.environ.get("TRACING_DIR"))
+        if "TRACING_DIR" in os.environ
+        else None
+    )
+    TRACING_SAMPLE_RATE = float(os.environ.get("TRACING_SAMPLE_RATE") or 1)
+    TRACING_RECORD_SAMPLE_RATE = float(
+        os.environ.get("TRACING_RECORD_SAMPLE_RATE") or 1
+    )
+    TRACING_RETENTION = int(os.environ.get("TRACING_RETENTION") or 100)
+
     # ------ IDENTIFY ------
     API_DOCUMENT = (
         Path(dcm_object_validator_api.__file__).parent / "openapi.yaml"
@@ -78,6 +231,12 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
     )
 
     def __init__(self) -> None:
+        if self.RECORD_ORDER not in ORDERS:
+            raise ValueError(
+                f"Unknown RECORD_ORDER '{self.RECORD_ORDER}' (expected one "
+                + f"of {ORDERS})."
+            )
+
         # load additional identification plugins and initialize
         self.identification_plugins = load_plugins(self.IDENTIFICATION_PLUGINS)
         if self.ADDITIONAL_IDENTIFICATION_PLUGINS_DIR is not None:
@@ -100,6 +259,9 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
 
         super().__init__()
 
+        if self.LOAD_STATUS_WORKERS is None:
+            self.LOAD_STATUS_WORKERS = self.ORCHESTRATION_PROCESSES or 1
+
     def set_identity(self) -> None:
         super().set_identity()
         self.CONTAINER_SELF_DESCRIPTION["description"] = (
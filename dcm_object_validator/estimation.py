@@ -0,0 +1,249 @@
+"""
+Duration-estimates for validation jobs based on the historical
+throughput of plugins.
+"""
+
+from typing import Optional
+from collections.abc import Iterable
+from pathlib import Path
+from datetime import datetime, timezone
+from time import time
+import fcntl
+import json
+import os
+
+from dcm_object_validator.scheduling import JobCost
+
+
+# accumulated (exponentially weighted) sums of the least-squares fit
+_SUMS = ("rr", "rs", "ss", "rd", "sd")
+
+
+def file_size(path: Path) -> int:
+    """Returns the size of the file at `path` (0 if not available)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+class ThroughputModel:
+    """
+    Per-plugin model for the duration of plugin-invocations based on
+    previous invocations. The duration is modeled as
+    `records * time_per_record + size * time_per_byte` and fitted with
+    exponentially weighted least squares. The model is stored in a
+    JSON-file that can be shared by multiple processes.
+
+    Keyword arguments:
+    file -- path to the model file
+    decay -- weight of the previous observations when adding a new
+             observation
+             (default 0.9)
+    """
+
+    def __init__(self, file: Path, decay: float = 0.9) -> None:
+        self.file = file
+        self.decay = decay
+
+    def load(self) -> dict[str, dict[str, float]]:
+        """Returns the accumulated sums by plugin."""
+        try:
+            return json.loads(self.file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def observe(
+        self, plugin: str, records: int, size: int, duration: float
+    ) -> None:
+        """Adds an observation for `plugin`."""
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        with open(
+            self.file.with_suffix(".lock"), "w", encoding="utf-8"
+        ) as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)  # released when closed
+            model = self.load()
+            sums = {
+                k: v * self.decay
+                for k, v in model.get(plugin, dict.fromkeys(_SUMS, 0)).items()
+            }
+            sums["rr"] += records * records
+            sums["rs"] += records * size
+            sums["ss"] += size * size
+            sums["rd"] += records * duration
+            sums["sd"] += size * duration
+            model[plugin] = sums
+            tmp = self.file.with_suffix(".tmp")
+            tmp.write_text(json.dumps(model), encoding="utf-8")
+            os.replace(tmp, self.file)
+
+    @staticmethod
+    def fit(sums: dict[str, float]) -> Optional[tuple[float, float]]:
+        """
+        Returns time per record and time per byte fitted to `sums` (or
+        `None` if there is no usable observation). If records and size
+        are (almost) proportional in all observations, the entire
+        duration is attributed to the records.
+        """
+        rr, rs, ss, rd, sd = (sums[k] for k in _SUMS)
+        det = rr * ss - rs**2
+        if det > 1e-9 * rr * ss:
+            per_record = (rd * ss - sd * rs) / det
+            per_byte = (sd * rr - rd * rs) / det
+            if per_record >= 0 and per_byte >= 0:
+                return per_record, per_byte
+        if rr > 0:
+            return max(0.0, rd / rr), 0.0
+        if ss > 0:
+            return 0.0, max(0.0, sd / ss)
+        return None
+
+    def coefficients(
+        self, plugins: Iterable[str]
+    ) -> dict[str, tuple[float, float]]:
+        """
+        Returns time per record and time per byte for those `plugins`
+        that have been observed before.
+        """
+        model = self.load()
+        coefficients = {}
+        for plugin in plugins:
+            if plugin in model:
+                fitted = self.fit(model[plugin])
+                if fitted is not None:
+                    coefficients[plugin] = fitted
+        return coefficients
+
+
+def predict(
+    coefficients: dict[str, tuple[float, float]], plugin: str, cost: JobCost
+) -> Optional[float]:
+    """
+    Returns the predicted duration (in seconds) of processing `cost` with
+    `plugin` (or `None` if unknown).
+    """
+    if plugin not in coefficients:
+        return None
+    per_record, per_byte = coefficients[plugin]
+    return cost.files * per_record + cost.size * per_byte
+
+
+class ProgressTracker:
+    """
+    Tracks the processed records and bytes of a job and writes the
+    processed bytes and an estimated time of completion (based on
+    `ThroughputModel`-coefficients) into the job's progress.
+
+    Keyword arguments:
+    progress -- progress of the job's report (see `ValidationProgress`)
+    plugins -- names of the plugins of the job in order of execution
+    cost -- estimated cost of the job's target; used for plugins that
+            have not planned their records yet (see `plan`)
+    coefficients -- coefficients of the plugins (see
+                    `ThroughputModel.coefficients`)
+                    (default None)
+    """
+
+    def __init__(
+        self,
+        progress,
+        plugins: list[str],
+        cost: JobCost,
+        coefficients: Optional[dict[str, tuple[float, float]]] = None,
+    ) -> None:
+        self.progress = progress
+        self.pending = list(plugins)
+        self.cost = cost
+        self.coefficients = coefficients or {}
+        self.processed_bytes = 0
+        self.plugin: Optional[str] = None
+        self.planned: Optional[JobCost] = None
+        self.measured = JobCost()
+        self.remaining = JobCost()
+
+    def start(self, plugin: str) -> None:
+        """Starts tracking (the next invocation of) `plugin`."""
+        if plugin in self.pending:
+            self.pending.remove(plugin)
+        self.plugin = plugin
+        self.planned = None
+        self.measured = JobCost()
+        self.remaining = JobCost(self.cost.files, self.cost.size)
+        self.update()
+
+    def plan(self, sizes: list[int]) -> None:
+        """Registers records (by file size) of the current plugin."""
+        if self.planned is None:
+            self.planned = JobCost()
+            self.remaining = JobCost()
+        for cost in (self.planned, self.remaining):
+            cost.files += len(sizes)
+            cost.size += sum(sizes)
+        self.update()
+
+    def advance(self, size: int) -> None:
+        """Registers a processed record of `size` bytes."""
+        self.measured.files += 1
+        self.measured.size += size
+        self.skip(size)
+
+    def skip(self, size: int) -> None:
+        """
+        Registers a record of `size` bytes that has been completed
+        without being processed (e.g., restored from a checkpoint or
+        aborted due to a timeout). The record counts as progress but
+        invalidates the processed cost (see `finish`).
+        """
+        self.processed_bytes += size
+        self.remaining.files = max(0, self.remaining.files - 1)
+        self.remaining.size = max(0, self.remaining.size - size)
+        self.update()
+
+    def finish(self) -> Optional[JobCost]:
+        """
+        Stops tracking the current plugin and returns its processed
+        cost (the planned records or, if the plugin has not planned its
+        records, the job's estimated cost). Returns `None` if not all
+        planned records have been registered via `advance` (e.g., some
+        have been restored from a checkpoint or have been cut short by
+        a time budget), since the plugin's duration then does not
+        correspond to the processed cost.
+        """
+        if self.planned is None:
+            processed = self.cost
+        elif self.measured.files == self.planned.files:
+            processed = self.measured
+        else:
+            processed = None
+        self.plugin = None
+        self.remaining = JobCost()
+        self.update()
+        return processed
+
+    def predict_remaining(self) -> Optional[float]:
+        """
+        Returns the predicted remaining duration (in seconds) or `None`
+        if unknown.
+        """
+        predictions = [
+            predict(self.coefficients, plugin, cost)
+            for plugin, cost in (
+                [(self.plugin, self.remaining)] if self.plugin else []
+            )
+            + [(plugin, self.cost) for plugin in self.pending]
+        ]
+        if None in predictions:
+            return None
+        return sum(predictions)
+
+    def update(self) -> None:
+        """Writes the current state into `progress`."""
+        self.progress.processed_bytes = self.processed_bytes
+        remaining = self.predict_remaining()
+        self.progress.eta = (
+            None
+            if remaining is None
+            else datetime.fromtimestamp(
+                time() + remaining, timezone.utc
+            ).isoformat()
+        )
@@ -3,10 +3,14 @@
 from typing import Mapping
 from pathlib import Path
 
-from data_plumber_http import Property, Object, Url
+from data_plumber_http import Property, Object, Boolean, String, Url
 from dcm_common.services.handlers import TargetPath, PluginType, UUID
 
-from dcm_object_validator.models import ValidationConfig, Target
+from dcm_object_validator.models import (
+    ValidationConfig,
+    ReportConfig,
+    Target,
+)
 from dcm_object_validator.plugins.validation import ValidationPlugin
 
 
@@ -36,13 +40,68 @@ def get_validate_handler(
                             acceptable_context=["validation"],
                         )
                     ),
+                    Property(
+                        "report", default=lambda **kwargs: ReportConfig()
+                    ): Object(
+                        model=ReportConfig,
+                        properties={
+                            Property("verbosity"): String(
+                                enum=["full", "errors-only", "summary"]
+                            ),
+                            Property("timing"): Boolean(),
+                        },
+                        accept_only=["verbosity", "timing"],
+                    ),
                 },
-                accept_only=["target", "plugins"],
+                accept_only=["target", "plugins", "report"],
             ),
             Property("token"): UUID(),
             Property("callbackUrl", name="callback_url"): Url(
                 schemes=["http", "https"]
             ),
+            Property("sync", default=lambda **kwargs: False): Boolean(),
+        },
+        accept_only=["validation", "token", "callbackUrl", "sync"],
+    ).assemble()
+
+
+def get_report_stream_handler():
+    """
+    Returns handler for the query of the '/report/stream'-endpoint.
+    """
+    return Object(
+        properties={Property("token", required=True): String()},
+        accept_only=["token"],
+    ).assemble()
+
+
+def get_report_records_handler():
+    """
+    Returns handler for the query of the '/report/records'-endpoint.
+    """
+    return Object(
+        properties={
+            Property("token", required=True): String(),
+            Property("plugin"): String(),
+            Property("success"): String(enum=["true", "false"]),
+            Property("valid"): String(enum=["true", "false"]),
+            Property("pathPrefix", name="path_prefix"): String(),
+            Property("offset", default=lambda **kwargs: "0"): String(
+                pattern=r"^[0-9]+$"
+            ),
+            Property("limit"): String(pattern=r"^[0-9]+$"),
+            Property(
+                "format", name="format_", default=lambda **kwargs: "json"
+            ): String(enum=["json", "ndjson"]),
         },
-        accept_only=["validation", "token", "callbackUrl"],
+        accept_only=[
+            "token",
+            "plugin",
+            "success",
+            "valid",
+            "pathPrefix",
+            "offset",
+            "limit",
+            "format",
+        ],
     ).assemble()
@@ -0,0 +1,361 @@
+"""
+Process-local collection of metrics with file-based aggregation
+across processes (exposed in the Prometheus text-format).
+
+Every process collects metrics in the module-level `REGISTRY`. If
+enabled via `Registry.configure`, the registry regularly writes a
+snapshot into a shared directory (one file per process). The
+snapshots of all processes are aggregated with `aggregate`. Snapshots
+of processes that no longer exist are folded into a persistent archive
+in the same directory (such that counters remain monotonic).
+"""
+
+from typing import Optional
+from collections.abc import Iterable
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+import bisect
+import fcntl
+import json
+import os
+
+
+# default histogram-buckets (in seconds)
+BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30,
+    60, 300, 1800,
+)  # fmt: skip
+
+# metric-name: (type, description)
+METRICS = {
+    "validator_jobs_total": (
+        "counter",
+        "Number of completed validation jobs.",
+    ),
+    "validator_job_duration_seconds": (
+        "histogram",
+        "Duration of validation jobs.",
+    ),
+    "validator_queue_wait_seconds": (
+        "histogram",
+        "Time between submission and start of validation jobs.",
+    ),
+    "validator_plugin_duration_seconds": (
+        "histogram",
+        "Duration of plugin-invocations.",
+    ),
+    "validator_records_total": (
+        "counter",
+        "Number of processed records.",
+    ),
+    "validator_record_duration_seconds": (
+        "histogram",
+        "Time spent per processed record.",
+    ),
+    "validator_checkpoint_hits_total": (
+        "counter",
+        "Number of records that have been restored from a checkpoint.",
+    ),
+    "validator_checkpoint_misses_total": (
+        "counter",
+        "Number of records that have not been found in a checkpoint.",
+    ),
+    "validator_hashed_bytes_total": (
+        "counter",
+        "Number of bytes processed for checksum-calculation.",
+    ),
+    "validator_tool_duration_seconds": (
+        "histogram",
+        "Duration of external tool-invocations (e.g., JHOVE or fido).",
+    ),
+    "validator_tool_cpu_seconds_total": (
+        "counter",
+        "CPU time (by mode) spent in external tool-invocations.",
+    ),
+    "validator_tool_max_rss_bytes": (
+        "gauge",
+        "Peak resident set size of a single external tool-invocation.",
+    ),
+}
+
+
+def _key(name: str, labels: Optional[dict[str, str]]) -> str:
+    return json.dumps([name, labels or {}], sort_keys=True)
+
+
+class Registry:
+    """
+    Thread-safe registry for counters, maxima (gauges), and histograms
+    of a single process. Collecting values is a no-op until the
+    registry has been enabled via `configure`.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.directory: Optional[Path] = None
+        self.interval = 1.0
+        self._lock = Lock()
+        self._counters: dict[str, float] = {}
+        self._maxima: dict[str, float] = {}
+        self._histograms: dict[str, list] = {}
+        self._last_write = None
+
+    def configure(
+        self, directory: Optional[Path], interval: float = 1.0
+    ) -> None:
+        """
+        Enables the registry.
+
+        Keyword arguments:
+        directory -- shared directory for snapshots; if `None`, metrics
+                     are only collected in memory
+        interval -- minimum interval (in seconds) between writing
+                    snapshots
+                    (default 1.0)
+        """
+        self.enabled = True
+        self.directory = directory
+        self.interval = interval
+
+    def inc(
+        self,
+        name: str,
+        value: float = 1,
+        labels: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Increments counter `name` (with `labels`) by `value`."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        self._maybe_write()
+
+    def maximum(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[dict[str, str]] = None,
+    ) -> None:
+        """
+        Sets gauge `name` (with `labels`) to `value` if it exceeds the
+        current value.
+        """
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._maxima[key] = max(self._maxima.get(key, value), value)
+        self._maybe_write()
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Records `value` in histogram `name` (with `labels`)."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.setdefault(
+                key, [[0] * (len(BUCKETS) + 1), 0.0, 0]
+            )
+            histogram[0][bisect.bisect_left(BUCKETS, value)] += 1
+            histogram[1] += value
+            histogram[2] += 1
+        self._maybe_write()
+
+    @property
+    def snapshot(self) -> dict:
+        """Returns JSON-serializable snapshot of all metrics."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "maxima": dict(self._maxima),
+                "histograms": {
+                    k: [list(v[0]), v[1], v[2]]
+                    for k, v in self._histograms.items()
+                },
+            }
+
+    def _maybe_write(self) -> None:
+        if self.directory is None:
+            return
+        if (
+            self._last_write is not None
+            and monotonic() - self._last_write < self.interval
+        ):
+            return
+        self.write()
+
+    def write(self) -> None:
+        """
+        Writes snapshot to the shared directory (if configured).
+        """
+        if self.directory is None:
+            return
+        self._last_write = monotonic()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file = self.directory / f"{os.getpid()}.json"
+        tmp = file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.snapshot), encoding="utf-8")
+        os.replace(tmp, file)
+
+
+REGISTRY = Registry()
+
+
+def merge(snapshots: Iterable[dict]) -> dict:
+    """
+    Returns the sum of all `snapshots` (or the maximum in case of
+    maxima).
+    """
+    result = {"counters": {}, "maxima": {}, "histograms": {}}
+    for snapshot in snapshots:
+        for key, value in snapshot.get("counters", {}).items():
+            result["counters"][key] = result["counters"].get(key, 0) + value
+        for key, value in snapshot.get("maxima", {}).items():
+            result["maxima"][key] = max(
+                result["maxima"].get(key, value), value
+            )
+        for key, (buckets, sum_, count) in snapshot.get(
+            "histograms", {}
+        ).items():
+            if key not in result["histograms"]:
+                result["histograms"][key] = [list(buckets), sum_, count]
+                continue
+            histogram = result["histograms"][key]
+            histogram[0] = [a + b for a, b in zip(histogram[0], buckets)]
+            histogram[1] += sum_
+            histogram[2] += count
+    return result
+
+
+def _alive(pid: str) -> bool:
+    """Returns `True` if a process with the given `pid` exists."""
+    try:
+        pid = int(pid)
+    except ValueError:
+        return True  # not written by a registry
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # exists but owned by another user
+        return True
+    return True
+
+
+def _read_snapshot(file: Path) -> Optional[dict]:
+    try:
+        return json.loads(file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):  # missing or concurrently replaced
+        return None
+
+
+def archive(directory: Path, files: Iterable[Path]) -> None:
+    """
+    Merges the snapshots in `files` into the archive of `directory`
+    ('.archive') and deletes them afterwards.
+    """
+    with open(directory / ".archive.lock", "w", encoding="utf-8") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)  # released when closed
+        snapshots = [_read_snapshot(directory / ".archive") or {}]
+        archived = []
+        for file in files:
+            snapshot = _read_snapshot(file)
+            if snapshot is None:  # already archived concurrently
+                continue
+            snapshots.append(snapshot)
+            archived.append(file)
+        if not archived:
+            return
+        tmp = directory / ".archive.tmp"
+        tmp.write_text(json.dumps(merge(snapshots)), encoding="utf-8")
+        os.replace(tmp, directory / ".archive")
+        for file in archived:
+            file.unlink(missing_ok=True)
+
+
+def aggregate(directory: Optional[Path]) -> dict:
+    """
+    Returns the aggregated snapshot of all processes that have written
+    into `directory` (and the current process). Snapshots of processes
+    that no longer exist (e.g., workers that have been replaced) are
+    moved into the archive of `directory` (see `archive`), which is
+    included in the result.
+    """
+    REGISTRY.write()
+    snapshots = []
+    if directory is not None and directory.is_dir():
+        dead = []
+        for file in directory.glob("*.json"):
+            if not _alive(file.stem):
+                dead.append(file)
+                continue
+            snapshot = _read_snapshot(file)
+            if snapshot is not None:
+                snapshots.append(snapshot)
+        if dead:
+            archive(directory, dead)
+        snapshot = _read_snapshot(directory / ".archive")
+        if snapshot is not None:
+            snapshots.append(snapshot)
+    if directory is None or REGISTRY.directory != directory:
+        snapshots.append(REGISTRY.snapshot)
+    return merge(snapshots)
+
+
+def _escape(value) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+        + "}"
+    )
+
+
+def render(snapshot: dict) -> str:
+    """Returns `snapshot` formatted in the Prometheus text-format."""
+    series = {}
+    for key, value in (
+        snapshot["counters"] | snapshot.get("maxima", {})
+    ).items():
+        name, labels = json.loads(key)
+        series.setdefault(name, []).append(
+            f"{name}{_format_labels(labels)} {value}"
+        )
+    for key, (buckets, sum_, count) in snapshot["histograms"].items():
+        name, labels = json.loads(key)
+        lines = series.setdefault(name, [])
+        cumulative = 0
+        for bound, n in zip(BUCKETS + ("+Inf",), buckets):
+            cumulative += n
+            lines.append(
+                f"{name}_bucket{_format_labels(labels | {'le': bound})} "
+                + f"{cumulative}"
+            )
+        lines.append(f"{name}_sum{_format_labels(labels)} {sum_}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    output = []
+    for name, lines in sorted(series.items()):
+        type_, description = METRICS.get(name, ("untyped", ""))
+        output.append(f"# HELP {name} {description}")
+        output.append(f"# TYPE {name} {type_}")
+        output.extend(lines)
+    return "\n".join(output) + "\n"
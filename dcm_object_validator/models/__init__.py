@@ -1,13 +1,15 @@
-from .report import Report
+from .report import ValidationProgress, Report
 from .target import Target
-from .validation_config import PluginConfig, ValidationConfig
+from .validation_config import PluginConfig, ReportConfig, ValidationConfig
 from .validation_result import ValidationResult
 
 
 __all__ = [
+    "ValidationProgress",
     "Report",
     "Target",
     "PluginConfig",
+    "ReportConfig",
     "ValidationConfig",
     "ValidationResult",
 ]
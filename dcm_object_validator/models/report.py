@@ -2,13 +2,37 @@
 Report data-model definition
 """
 
-from dataclasses import dataclass, field
+from typing import Optional
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
 
-from dcm_common.orchestra import Report as BaseReport
+from dcm_common.orchestra import Report as BaseReport, Progress
 
 from dcm_object_validator.models.validation_result import ValidationResult
+from dcm_object_validator.serialization import iter_json_object
+
+
+@dataclass
+class ValidationProgress(Progress):
+    """
+    `Progress` extended by the number of processed bytes and the
+    estimated time of completion (ISO-8601; if available).
+    """
+
+    processed_bytes: Optional[int] = None
+    eta: Optional[str] = None
 
 
 @dataclass
 class Report(BaseReport):
+    progress: ValidationProgress = field(default_factory=ValidationProgress)
     data: ValidationResult = field(default_factory=ValidationResult)
+
+    def iter_json(self) -> Iterator[str]:
+        """
+        Yields JSON-chunks of the serialized report (equivalent to
+        `json`) with its data being streamed.
+        """
+        data = replace(self, data=ValidationResult()).json
+        data["data"] = self.data.iter_json()
+        return iter_json_object(data.items())
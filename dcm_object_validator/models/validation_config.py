@@ -2,7 +2,7 @@
 ValidationConfig data-model definition
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from dcm_common.models import JSONObject, DataModel
 
@@ -17,9 +17,30 @@ class PluginConfig(DataModel):
     args: JSONObject
 
 
+@dataclass
+class ReportConfig(DataModel):
+    """
+    Report config `DataModel`
+
+    Keyword arguments:
+    verbosity -- level of detail for plugin results; one of
+                 * "full": all records and log messages,
+                 * "errors-only": only records that failed or are
+                   invalid (with error messages only), and
+                 * "summary": only record counts
+                 (default "full")
+    timing -- whether to include a timing-breakdown
+              (default False)
+    """
+
+    verbosity: str = "full"
+    timing: bool = False
+
+
 @dataclass
 class ValidationConfig(DataModel):
     """Validation config `DataModel`"""
 
     target: Target
     plugins: dict[str, PluginConfig]
+    report: ReportConfig = field(default_factory=ReportConfig)
@@ -3,11 +3,17 @@ ValidationResult data-model definition
 """
 
 from typing import Optional
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
 
 from dcm_common.models import DataModel
 
 from dcm_object_validator.plugins.validation import ValidationPluginResult
+from dcm_object_validator.plugins.validation.interface import (
+    ValidationTiming,
+)
+from dcm_object_validator.plugins.tools import ToolUsage
+from dcm_object_validator.serialization import iter_json_object
 
 
 @dataclass
@@ -19,3 +25,46 @@ class ValidationResult(DataModel):
     success: Optional[bool] = None
     valid: Optional[bool] = None
     details: dict[str, ValidationPluginResult] = field(default_factory=dict)
+    timing: Optional[ValidationTiming] = None
+    tools: Optional[dict[str, ToolUsage]] = None
+
+    @DataModel.serialization_handler("timing")
+    @classmethod
+    def timing_serialization_handler(cls, value):
+        """Handle `timing`-serialization."""
+        if value is None:
+            DataModel.skip()
+        return value.json
+
+    @DataModel.deserialization_handler("timing")
+    @classmethod
+    def timing_deserialization_handler(cls, value):
+        """Handle `timing`-deserialization."""
+        if value is None:
+            DataModel.skip()
+        return ValidationTiming.from_json(value)
+
+    @DataModel.serialization_handler("tools")
+    @classmethod
+    def tools_serialization_handler(cls, value):
+        """Handle `tools`-serialization."""
+        if value is None:
+            DataModel.skip()
+        return {k: v.json for k, v in value.items()}
+
+    @DataModel.deserialization_handler("tools")
+    @classmethod
+    def tools_deserialization_handler(cls, value):
+        """Handle `tools`-deserialization."""
+        if value is None:
+            DataModel.skip()
+        return {k: ToolUsage.from_json(v) for k, v in value.items()}
+
+    def iter_json(self) -> Iterator[str]:
+        """
+        Yields JSON-chunks of the serialized result (equivalent to
+        `json`) with plugin results being streamed.
+        """
+        data = replace(self, details={}).json
+        data["details"] = iter_json_object(self.details.items())
+        return iter_json_object(data.items())
@@ -7,6 +7,7 @@ from dcm_common.util import qjoin
 from dcm_common.logger import LoggingContext as Context
 from dcm_common.plugins import PythonDependency
 
+from dcm_object_validator.plugins.tools import run_tool
 from .interface import (
     FormatIdentificationPlugin,
     FormatIdentificationResult,
@@ -69,17 +70,14 @@ class FidoPUIDPlugin(FormatIdentificationPlugin):
         context.push()
 
         # process
-        subprocess_result = subprocess.run(
+        subprocess_result = run_tool(
             [
                 self._DEFAULT_FIDO_CMD,
                 "-q",
                 "-matchprintf",
                 f"%(info.{self._FORMAT_TYPE})s ",
                 kwargs["path"],
-            ],
-            check=False,
-            capture_output=True,
-            text=True,
+            ]
         )
 
         # evaluate
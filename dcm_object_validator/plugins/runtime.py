@@ -0,0 +1,218 @@
+"""
+Job-scoped runtime-settings for plugin-invocations.
+
+In contrast to the request arguments, these settings are controlled by
+the job that runs a plugin (see `ValidationView`). They are provided
+for the duration of a plugin-call via `use_runtime` and can be accessed
+from within the plugins with `current_runtime`.
+"""
+
+from typing import Optional, Callable, TYPE_CHECKING
+from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from threading import Event
+from time import monotonic
+
+if TYPE_CHECKING:
+    from dcm_object_validator.plugins.validation.checkpoint import (
+        Checkpoint,
+    )
+    from dcm_object_validator.plugins.validation.interface import (
+        ValidationTiming,
+    )
+    from dcm_object_validator.plugins.tools import ToolUsage
+    from dcm_object_validator.profiling import JobProfiler
+    from dcm_object_validator.tracing import JobTracer
+    from dcm_object_validator.estimation import ProgressTracker
+
+
+class PluginCancelledError(RuntimeError):
+    """Raised if a plugin-invocation has been cancelled."""
+
+
+class PluginTimeoutError(RuntimeError):
+    """Raised if a time budget of a plugin-invocation is exceeded."""
+
+
+class Cancellation:
+    """
+    Thread-safe flag for cooperative cancellation of plugin-
+    invocations.
+    """
+
+    def __init__(self) -> None:
+        self._event = Event()
+
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Returns `True` if cancellation has been requested."""
+        return self._event.is_set()
+
+
+@dataclass
+class PluginRuntime:
+    """
+    Runtime-settings for plugin-invocations.
+
+    Keyword arguments:
+    checkpoint -- store for completed records of the current plugin-
+                  invocation
+                  (default None)
+    cancellation -- flag for cancelling the current plugin-invocation
+                    (default None)
+    record_timeout -- time budget (in seconds) for processing a single
+                      record
+                      (default None)
+    deadline -- point in time (see `time.monotonic`) after which the
+                job's time budget is exhausted
+                (default None)
+    memory_limit -- limit for the address space (in bytes) of
+                    external tools
+                    (default None)
+    record_deadline -- point in time (see `time.monotonic`) after
+                       which the time budget of the current record is
+                       exhausted; set while processing records
+                       (default None)
+    verbosity -- level of detail for records in the plugin result;
+                 one of 'full', 'errors-only', and 'summary' (see
+                 `ReportConfig`)
+                 (default 'full')
+    compact_records -- whether to collect records in a compact
+                       `RecordStore` instead of a `dict`
+                       (default False)
+    timing -- if set, durations of phases and records are collected in
+              this object
+              (default None)
+    slowest_records -- number of slowest records that are kept in
+                       `timing`
+                       (default 10)
+    tool_usage -- if set, the resource usage of external tools is
+                  accumulated in this mapping (by tool)
+                  (default None)
+    profiler -- profiler of the current job (used for profiling
+                individual records)
+                (default None)
+    tracer -- if set, trace spans of the current job are recorded
+              with this object
+              (default None)
+    progress -- if set, the processed records (and their sizes) are
+                reported to this object
+                (default None)
+    record_order -- order in which records are processed (see
+                    `ordering.ORDERS`)
+                    (default 'discovery')
+    heartbeat -- if set, called regularly during long-running work on
+                 a single record (e.g., while waiting for external
+                 tools) to forward pending report-updates
+                 (default None)
+    """
+
+    checkpoint: Optional["Checkpoint"] = None
+    cancellation: Optional[Cancellation] = None
+    record_timeout: Optional[float] = None
+    deadline: Optional[float] = None
+    memory_limit: Optional[int] = None
+    record_deadline: Optional[float] = None
+    verbosity: str = "full"
+    compact_records: bool = False
+    timing: Optional["ValidationTiming"] = None
+    slowest_records: int = 10
+    tool_usage: Optional[dict[str, "ToolUsage"]] = None
+    profiler: Optional["JobProfiler"] = None
+    tracer: Optional["JobTracer"] = None
+    progress: Optional["ProgressTracker"] = None
+    record_order: str = "discovery"
+    heartbeat: Optional[Callable[[], None]] = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Returns `True` if cancellation has been requested."""
+        return self.cancellation is not None and self.cancellation.cancelled
+
+    @contextmanager
+    def timed(self, phase: str):
+        """
+        Context manager that adds the duration of its body to `phase`
+        of `timing` (if set).
+        """
+        if self.timing is None:
+            yield
+            return
+        time0 = monotonic()
+        try:
+            yield
+        finally:
+            self.timing.add(phase, monotonic() - time0)
+
+    def beat(self) -> None:
+        """Calls `heartbeat` (if set)."""
+        if self.heartbeat is not None:
+            self.heartbeat()
+
+    def traced(self, name: str, category: str, **args):
+        """
+        Returns context manager that records its body as span of
+        `tracer` (or a no-op if not set).
+        """
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, category, **args)
+
+    def remaining(self) -> Optional[float]:
+        """
+        Returns the remaining time (in seconds) until the earliest
+        deadline or `None` if there is no deadline.
+        """
+        deadlines = [
+            d for d in (self.record_deadline, self.deadline) if d is not None
+        ]
+        if not deadlines:
+            return None
+        return min(deadlines) - monotonic()
+
+    def check_budget(self, subject: str) -> None:
+        """
+        Raises `PluginTimeoutError` if a time budget is exhausted.
+
+        Keyword arguments:
+        subject -- description of the affected task for the error
+                   message
+        """
+        now = monotonic()
+        if self.deadline is not None and now >= self.deadline:
+            raise PluginTimeoutError(
+                f"{subject} exceeded the job's time budget."
+            )
+        if self.record_deadline is not None and now >= self.record_deadline:
+            raise PluginTimeoutError(
+                f"{subject} exceeded the per-record time budget of "
+                + f"{self.record_timeout} seconds."
+            )
+
+
+_RUNTIME: ContextVar[Optional[PluginRuntime]] = ContextVar(
+    "plugin_runtime", default=None
+)
+
+
+def current_runtime() -> PluginRuntime:
+    """
+    Returns the `PluginRuntime` of the current context (or defaults if
+    not set).
+    """
+    return _RUNTIME.get() or PluginRuntime()
+
+
+@contextmanager
+def use_runtime(runtime: PluginRuntime):
+    """Context manager that sets `runtime` for the current context."""
+    token = _RUNTIME.set(runtime)
+    try:
+        yield runtime
+    finally:
+        _RUNTIME.reset(token)
@@ -0,0 +1,227 @@
+"""Helpers for invoking external tools from within plugins."""
+
+from typing import Optional, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+import os
+import signal
+import subprocess
+import resource
+
+from dcm_common.models import DataModel
+
+from dcm_object_validator.plugins.runtime import (
+    current_runtime,
+    PluginCancelledError,
+)
+from dcm_object_validator.metrics import REGISTRY
+
+
+# interval (in seconds) in which running tools are checked for
+# cancellation and exceeded time budgets
+POLL_INTERVAL = 0.1
+
+
+@dataclass
+class ToolUsage(DataModel):
+    """
+    Data model for the (accumulated) resource usage of external tool-
+    invocations.
+
+    Keyword arguments:
+    calls -- number of invocations
+             (default 0)
+    wall -- wall time (in seconds)
+            (default 0.0)
+    user -- user CPU time (in seconds)
+            (default 0.0)
+    system -- system CPU time (in seconds)
+              (default 0.0)
+    max_rss -- peak resident set size (in bytes) of a single
+               invocation (including its descendants)
+               (default 0)
+    """
+
+    calls: int = 0
+    wall: float = 0.0
+    user: float = 0.0
+    system: float = 0.0
+    max_rss: int = 0
+
+    def merge(self, other: "ToolUsage") -> None:
+        """Adds the usage of `other`."""
+        self.calls += other.calls
+        self.wall += other.wall
+        self.user += other.user
+        self.system += other.system
+        self.max_rss = max(self.max_rss, other.max_rss)
+
+
+def merge_tool_usage(
+    target: dict[str, ToolUsage], source: dict[str, ToolUsage]
+) -> None:
+    """Merges the per-tool usage of `source` into `target`."""
+    for tool, usage in source.items():
+        target.setdefault(tool, ToolUsage()).merge(usage)
+
+
+class _AccountedPopen(subprocess.Popen):
+    """
+    `Popen` that collects the resource usage of the child process via
+    `os.wait4` (available as `rusage` after the process has been
+    waited for).
+    """
+
+    rusage: Optional[resource.struct_rusage] = None
+
+    def _try_wait(self, wait_flags):
+        try:
+            pid, sts, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            return super()._try_wait(wait_flags)
+        if pid == self.pid:
+            self.rusage = rusage
+        return pid, sts
+
+
+class ToolResult(subprocess.CompletedProcess):
+    """
+    `CompletedProcess` with the resource usage of the invocation
+    (`None` if not available).
+    """
+
+    def __init__(
+        self, args, returncode, stdout, stderr, usage: Optional[ToolUsage]
+    ) -> None:
+        super().__init__(args, returncode, stdout, stderr)
+        self.usage = usage
+
+
+def _limit_memory(limit: int) -> Callable[[], None]:
+    """
+    Returns function that limits the address space of the calling
+    process to `limit` bytes (run in the child process via `preexec_fn`;
+    only calls async-signal-safe `setrlimit`).
+    """
+
+    def preexec() -> None:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    return preexec
+
+
+def _kill_process_group(process: subprocess.Popen) -> None:
+    """
+    Kills the process group of `process` (see `run_tool`) and waits
+    for `process`.
+    """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:  # group has already exited
+        pass
+    process.wait()
+
+
+def run_tool(args: list[str]) -> ToolResult:
+    """
+    Runs an external tool with arguments `args` and returns the
+    `ToolResult` (like `subprocess.run` with `check=False`,
+    `capture_output=True`, and `text=True`) including its resource
+    usage.
+
+    In contrast to `subprocess.run`, the calling thread regularly
+    returns to the interpreter while waiting for the tool to finish.
+    The tool is started in a new session and its entire process group
+    is terminated (i.e., including processes started by the tool, like
+    a JVM started by a shell launcher) if
+    * the current `PluginRuntime` is cancelled (this raises a
+      `PluginCancelledError`),
+    * a time budget of the current `PluginRuntime` is exhausted (this
+      raises a `PluginTimeoutError`), or
+    * any exception is raised in the calling thread while waiting
+      (e.g., an abort that is injected into the job's thread).
+
+    If the current `PluginRuntime` defines a `memory_limit`, it is
+    applied to the tool's address space in the child process before the
+    tool is executed (and is, hence, inherited by its descendants). If
+    it defines `timing`, the duration of the call is added to the phase
+    'tool:<name of executable>'. While waiting, the
+    runtime's `heartbeat` is called regularly. If it defines
+    `tool_usage`, the resource usage is accumulated there (by name of
+    the executable). If it defines a `tracer`, the call is traced as
+    span.
+    """
+    runtime = current_runtime()
+    runtime.check_budget(f"Call to '{args[0]}'")
+    tool = Path(args[0]).name
+    time0 = monotonic()
+    with runtime.traced(f"tool:{tool}", "tool"), _AccountedPopen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+        preexec_fn=(
+            None
+            if runtime.memory_limit is None
+            else _limit_memory(runtime.memory_limit)
+        ),
+    ) as process:
+        try:
+            while True:
+                if runtime.cancelled:
+                    raise PluginCancelledError(
+                        f"Call to '{args[0]}' has been cancelled."
+                    )
+                runtime.check_budget(f"Call to '{args[0]}'")
+                remaining = runtime.remaining()
+                try:
+                    stdout, stderr = process.communicate(
+                        timeout=(
+                            POLL_INTERVAL
+                            if remaining is None
+                            else max(0, min(POLL_INTERVAL, remaining))
+                        )
+                    )
+                    break
+                except subprocess.TimeoutExpired:
+                    runtime.beat()
+        except BaseException:
+            _kill_process_group(process)
+            raise
+    duration = monotonic() - time0
+    usage = None
+    if process.rusage is not None:
+        usage = ToolUsage(
+            calls=1,
+            wall=duration,
+            user=process.rusage.ru_utime,
+            system=process.rusage.ru_stime,
+            # ru_maxrss is given in kilobytes
+            max_rss=process.rusage.ru_maxrss * 1024,
+        )
+    REGISTRY.observe(
+        "validator_tool_duration_seconds", duration, labels={"tool": tool}
+    )
+    if usage is not None:
+        REGISTRY.inc(
+            "validator_tool_cpu_seconds_total",
+            usage.user,
+            labels={"tool": tool, "mode": "user"},
+        )
+        REGISTRY.inc(
+            "validator_tool_cpu_seconds_total",
+            usage.system,
+            labels={"tool": tool, "mode": "system"},
+        )
+        REGISTRY.maximum(
+            "validator_tool_max_rss_bytes",
+            usage.max_rss,
+            labels={"tool": tool},
+        )
+        if runtime.tool_usage is not None:
+            runtime.tool_usage.setdefault(tool, ToolUsage()).merge(usage)
+    if runtime.timing is not None:
+        runtime.timing.add(f"tool:{tool}", duration)
+    return ToolResult(args, process.returncode, stdout, stderr, usage)
@@ -0,0 +1,128 @@
+"""Checkpoint-store for records of validation-plugin-invocations."""
+
+from typing import Optional
+from pathlib import Path
+from time import time
+import json
+import sqlite3
+
+
+class Checkpoint:
+    """
+    SQLite-based (append-only) store for the results of processed
+    records. Records are identified by their path. Stored results are
+    ignored if the file identity (inode, size, and modification time)
+    has changed since the result has been written.
+
+    Keyword arguments:
+    file -- path to the database file
+    namespace -- namespace for records (e.g., an id for the plugin-
+                 invocation)
+                 (default "")
+    """
+
+    _SCHEMA = """CREATE TABLE IF NOT EXISTS records (
+        namespace TEXT NOT NULL,
+        path TEXT NOT NULL,
+        identity TEXT NOT NULL,
+        result TEXT NOT NULL,
+        PRIMARY KEY (namespace, path)
+    )"""
+
+    def __init__(self, file: Path, namespace: str = "") -> None:
+        self.file = file
+        self.namespace = namespace
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Returns (lazily initialized) database connection."""
+        if self._connection is None:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.file)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(self._SCHEMA)
+        return self._connection
+
+    def bind(self, namespace: str) -> "Checkpoint":
+        """Returns `Checkpoint` for the same file but `namespace`."""
+        return Checkpoint(self.file, namespace)
+
+    @staticmethod
+    def identity(record: Path) -> Optional[str]:
+        """
+        Returns identity-string for the file at `record` or `None` if it
+        does not exist.
+        """
+        try:
+            stat = record.stat()
+        except OSError:
+            return None
+        return f"{stat.st_ino}-{stat.st_size}-{stat.st_mtime_ns}"
+
+    def get(self, record: Path) -> Optional[dict]:
+        """
+        Returns the stored (JSON-)result for `record` if available and
+        still valid.
+        """
+        identity = self.identity(record)
+        if identity is None:
+            return None
+        row = self.connection.execute(
+            "SELECT result FROM records "
+            + "WHERE namespace = ? AND path = ? AND identity = ?",
+            (self.namespace, str(record), identity),
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put(self, record: Path, result: dict) -> None:
+        """Stores (JSON-)`result` for `record`."""
+        identity = self.identity(record)
+        if identity is None:
+            return
+        self.connection.execute(
+            "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+            (self.namespace, str(record), identity, json.dumps(result)),
+        )
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Closes database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def delete(self) -> None:
+        """Closes database connection and removes database files."""
+        self.close()
+        for suffix in ["", "-wal", "-shm"]:
+            self.file.with_name(self.file.name + suffix).unlink(
+                missing_ok=True
+            )
+
+
+def cleanup_checkpoints(directory: Path, max_age: float) -> None:
+    """
+    Deletes the checkpoints (database files '*.sqlite' including their
+    journal) in `directory` that have not been written to for more than
+    `max_age` seconds. Checkpoints are only deleted automatically once
+    their job has been completed; this removes the checkpoints of jobs
+    that have failed or have been aborted (and are not resumed).
+    """
+    if not directory.is_dir():
+        return
+    now = time()
+    for file in directory.glob("*.sqlite"):
+        files = [file.with_name(file.name + s) for s in ["", "-wal", "-shm"]]
+        mtimes = []
+        for f in files:
+            try:
+                mtimes.append(f.stat().st_mtime)
+            except FileNotFoundError:
+                continue
+        if mtimes and now - max(mtimes) > max_age:
+            for f in files:
+                f.unlink(missing_ok=True)
@@ -20,23 +20,34 @@ from dcm_common.plugins import (
     JSONType,
 )
 
+from dcm_object_validator.plugins.runtime import current_runtime
+from dcm_object_validator.metrics import REGISTRY
 from .interface import ValidationPlugin, ValidationPluginResultPart
 
 
 def _get_hash(file: Path, method: Callable, block: int) -> str:
     """
     Calculate and return hash of `file` using the given `method`
-    and a block-size of `block`.
+    and a block-size of `block` (while respecting the time budgets and
+    calling the heartbeat of the current `PluginRuntime`).
 
     See https://stackoverflow.com/a/1131255
     """
+    runtime = current_runtime()
     hash_ = method()
-    with open(file, "rb") as f:
+    size = 0
+    with runtime.timed("hashing"), open(file, "rb") as f:
         while True:
+            runtime.check_budget(f"Hashing '{file}'")
             buffer = f.read(block)
             if not buffer:
                 break
             hash_.update(buffer)
+            size += len(buffer)
+            runtime.beat()
+    REGISTRY.inc(
+        "validator_hashed_bytes_total", size, labels={"method": hash_.name}
+    )
     return hash_.hexdigest()
 
 
@@ -90,6 +101,7 @@ class IntegrityBasePlugin(ValidationPlugin, metaclass=abc.ABCMeta):
     _INFO = {
         "algorithms": list(_SUPPORTED_METHODS.keys()),
     }
+    _PART_TYPE = IntegrityPluginResult
 
     def _finalize_fail(
         self, result: IntegrityPluginResult, reason: str
@@ -1,14 +1,12 @@
 """BagIt-related file integrity-validation plugin."""
 
+from typing import Optional
 from pathlib import Path
 
 from dcm_common.util import qjoin
 from dcm_common.logger import LoggingContext as Context
 
-from .interface import (
-    ValidationPluginContext,
-    ValidationPluginResult,
-)
+from .interface import ValidationPluginContext
 from .integrity import IntegrityBasePlugin
 
 
@@ -41,9 +39,9 @@ class BagItIntegrityPlugin(IntegrityBasePlugin):
             return False, "unable to load manifest information from target"
         return True, "ok"
 
-    def _get(
-        self, context: ValidationPluginContext, /, **kwargs
-    ) -> ValidationPluginResult:
+    def _prepare(
+        self, context: ValidationPluginContext, kwargs: dict
+    ) -> Optional[dict]:
         context.set_progress(
             f"generating manifest information from '{kwargs.get('path', '?')}'"
         )
@@ -78,7 +76,7 @@ class BagItIntegrityPlugin(IntegrityBasePlugin):
                     )
                     context.result.success = False
                     context.push()
-                    return context.result
+                    return None
 
                 # read contents and write into manifest-dict
                 try:
@@ -104,6 +102,6 @@ class BagItIntegrityPlugin(IntegrityBasePlugin):
                     )
                     context.result.success = False
                     context.push()
-                    return context.result
+                    return None
 
-        return super()._get(context, **(kwargs | {"manifest": manifest}))
+        return super()._prepare(context, kwargs | {"manifest": manifest})
@@ -1,11 +1,14 @@
 """Format validation-plugin-interface."""
 
 from typing import Optional
+from collections.abc import Iterator
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from contextlib import nullcontext
+from time import monotonic
 import abc
 
-from dcm_common.logger import LoggingContext as Context
+from dcm_common.logger import LoggingContext as Context, Logger
 from dcm_common.util import list_directory_content
 from dcm_common.models import DataModel
 from dcm_common.plugins import (
@@ -17,6 +20,23 @@ from dcm_common.plugins import (
     JSONType,
 )
 
+from dcm_object_validator.plugins.runtime import (
+    PluginRuntime,
+    PluginCancelledError,
+    PluginTimeoutError,
+    current_runtime,
+    use_runtime,
+)
+from dcm_object_validator.plugins.tools import ToolUsage
+from dcm_object_validator.plugins.validation.records import RecordStore
+from dcm_object_validator.plugins.validation.ordering import (
+    stat_records,
+    order_records,
+)
+from dcm_object_validator.serialization import iter_json_object
+from dcm_object_validator.metrics import REGISTRY
+from dcm_object_validator.estimation import file_size
+
 
 @dataclass
 class ValidationPluginResultPart(PluginResult):
@@ -27,6 +47,7 @@ class ValidationPluginResultPart(PluginResult):
     path: Path
     success: Optional[bool] = None
     valid: Optional[bool] = None
+    duration: Optional[float] = None
 
     @DataModel.serialization_handler("path")
     @classmethod
@@ -40,6 +61,115 @@ class ValidationPluginResultPart(PluginResult):
         """Handle `path`-deserialization."""
         return Path(value)
 
+    @DataModel.serialization_handler("duration")
+    @classmethod
+    def duration_serialization_handler(cls, value):
+        """Handle `duration`-serialization."""
+        if value is None:
+            DataModel.skip()
+        return value
+
+    @DataModel.deserialization_handler("duration")
+    @classmethod
+    def duration_deserialization_handler(cls, value):
+        """Handle `duration`-deserialization."""
+        if value is None:
+            DataModel.skip()
+        return value
+
+
+@dataclass
+class ValidationPluginResultSummary(DataModel):
+    """
+    Data model for aggregated record-counts of `ValidationPlugin`-
+    invocations.
+
+    Keyword arguments:
+    total -- number of processed records
+             (default 0)
+    failed -- number of records that could not be processed
+              successfully
+              (default 0)
+    invalid -- number of invalid records
+               (default 0)
+    """
+
+    total: int = 0
+    failed: int = 0
+    invalid: int = 0
+
+    def add(self, part: ValidationPluginResultPart) -> None:
+        """Count `part`."""
+        self.total += 1
+        if not part.success:
+            self.failed += 1
+        if not part.valid:
+            self.invalid += 1
+
+    def merge(self, other: "ValidationPluginResultSummary") -> None:
+        """Add counts of `other`."""
+        self.total += other.total
+        self.failed += other.failed
+        self.invalid += other.invalid
+
+
+@dataclass
+class ValidationTiming(DataModel):
+    """
+    Data model for the timing-breakdown of validations.
+
+    Keyword arguments:
+    phases -- accumulated durations (in seconds) by phase
+              (default {})
+    records -- number of timed records
+               (default 0)
+    slowest -- slowest records as objects with 'index', 'path', and
+               'duration' (in seconds) in descending order of duration
+               (default [])
+    """
+
+    phases: dict[str, float] = field(default_factory=dict)
+    records: int = 0
+    slowest: list[dict] = field(default_factory=list)
+
+    def add(self, phase: str, duration: float) -> None:
+        """Adds `duration` to `phase`."""
+        self.phases[phase] = self.phases.get(phase, 0) + duration
+
+    def _keep(self, record: dict, limit: int) -> None:
+        if len(self.slowest) >= limit and (
+            limit <= 0 or record["duration"] <= self.slowest[-1]["duration"]
+        ):
+            return
+        self.slowest.append(record)
+        self.slowest.sort(key=lambda r: r["duration"], reverse=True)
+        del self.slowest[limit:]
+
+    def add_record(
+        self, index: int, path: Path, duration: float, limit: int
+    ) -> None:
+        """
+        Counts a record and keeps it if it is among the `limit` slowest
+        records.
+        """
+        self.records += 1
+        self._keep(
+            {"index": index, "path": str(path), "duration": duration}, limit
+        )
+
+    def merge(
+        self, other: "ValidationTiming", limit: int, **kwargs
+    ) -> None:
+        """
+        Adds phases, records, and slowest records of `other`. The
+        `kwargs` are added to the slowest records of `other`.
+        """
+        for phase, duration in other.phases.items():
+            self.add(phase, duration)
+        self.records += other.records
+        for record in other.slowest:
+            self._keep(record | kwargs, limit)
+
 
 @dataclass
 class ValidationPluginResult(PluginResult):
@@ -47,12 +177,45 @@ class ValidationPluginResult(PluginResult):
 
     success: Optional[bool] = None
     valid: Optional[bool] = None
-    records: Optional[dict[str, ValidationPluginResultPart]] = None
+    records: Optional[
+        dict[str, ValidationPluginResultPart] | RecordStore
+    ] = None
+    summary: Optional[ValidationPluginResultSummary] = None
+    timing: Optional[ValidationTiming] = None
+    tools: Optional[dict[str, ToolUsage]] = None
 
     def eval(self) -> None:
-        """Evaluate success and validity based on current records."""
-        self.success = all(record.success for record in self.records.values())
-        self.valid = all(record.valid for record in self.records.values())
+        """
+        Evaluate success and validity based on current records (or
+        `summary` if available).
+        """
+        if self.summary is not None:
+            self.success = self.summary.failed == 0
+            self.valid = self.summary.invalid == 0
+            return
+        if isinstance(self.records, RecordStore):
+            states = list(self.records.states())
+        else:
+            states = [
+                (record.success, record.valid)
+                for record in self.records.values()
+            ]
+        self.success = all(success for success, _ in states)
+        self.valid = all(valid for _, valid in states)
+
+    def iter_json(self) -> Iterator[str]:
+        """
+        Yields JSON-chunks of the serialized result (equivalent to
+        `json`) with records being serialized one at a time.
+        """
+        data = replace(self, records=None).json
+        if isinstance(self.records, RecordStore):
+            data["records"] = iter_json_object(self.records.items_json())
+        elif self.records is not None:
+            data["records"] = iter_json_object(
+                (k, v.json) for k, v in self.records.items()
+            )
+        return iter_json_object(data.items())
 
     @DataModel.serialization_handler("records")
     @classmethod
@@ -60,6 +223,8 @@ class ValidationPluginResult(PluginResult):
         """Handle `records`-serialization."""
         if value is None:
             DataModel.skip()
+        if isinstance(value, RecordStore):
+            return value.json
         return {k: v.json for k, v in value.items()}
 
     @DataModel.deserialization_handler("records")
@@ -73,6 +238,54 @@ class ValidationPluginResult(PluginResult):
             for k, v in value.items()
         }
 
+    @DataModel.serialization_handler("summary")
+    @classmethod
+    def summary_serialization_handler(cls, value):
+        """Handle `summary`-serialization."""
+        if value is None:
+            DataModel.skip()
+        return value.json
+
+    @DataModel.deserialization_handler("summary")
+    @classmethod
+    def summary_deserialization_handler(cls, value):
+        """Handle `summary`-deserialization."""
+        if value is None:
+            DataModel.skip()
+        return ValidationPluginResultSummary.from_json(value)
+
+    @DataModel.serialization_handler("timing")
+    @classmethod
+    def timing_serialization_handler(cls, value):
+        """Handle `timing`-serialization."""
+        if value is None:
+            DataModel.skip()
+        return value.json
+
+    @DataModel.deserialization_handler("timing")
+    @classmethod
+    def timing_deserialization_handler(cls, value):
+        """Handle `timing`-deserialization."""
+        if value is None:
+            DataModel.skip()
+        return ValidationTiming.from_json(value)
+
+    @DataModel.serialization_handler("tools")
+    @classmethod
+    def tools_serialization_handler(cls, value):
+        """Handle `tools`-serialization."""
+        if value is None:
+            DataModel.skip()
+        return {k: v.json for k, v in value.items()}
+
+    @DataModel.deserialization_handler("tools")
+    @classmethod
+    def tools_deserialization_handler(cls, value):
+        """Handle `tools`-deserialization."""
+        if value is None:
+            DataModel.skip()
+        return {k: ToolUsage.from_json(v) for k, v in value.items()}
+
 
 @dataclass
 class ValidationPluginContext(PluginExecutionContext):
@@ -97,7 +310,11 @@ class ValidationPlugin(PluginInterface, metaclass=abc.ABCMeta):
 
     An implementation's `PluginResult` should inherit from
     `ValidationPluginResult`. Similarly, the return type of `_get_part`
-    should inherit from `ValidationPluginResultPart`.
+    should inherit from `ValidationPluginResultPart` and be declared as
+    `_PART_TYPE`.
+
+    Request arguments that need to be derived from the target (like
+    manifest information) should be generated in `_prepare`.
     """
 
     _CONTEXT = "validation"
@@ -124,6 +341,7 @@ class ValidationPlugin(PluginInterface, metaclass=abc.ABCMeta):
         ),
     )
     _RESULT_TYPE = ValidationPluginResult
+    _PART_TYPE = ValidationPluginResultPart
 
     @classmethod
     def _validate_more(cls, kwargs):
@@ -153,6 +371,11 @@ class ValidationPlugin(PluginInterface, metaclass=abc.ABCMeta):
             return False, "missing value for 'path'"
         return True, "ok"
 
+    @classmethod
+    def load_part(cls, json: dict) -> ValidationPluginResultPart:
+        """Returns `_PART_TYPE`-instance deserialized from `json`."""
+        return cls._PART_TYPE.from_json(json)
+
     @abc.abstractmethod
     def _get_part(
         self, record_path: Path, /, **kwargs
@@ -178,9 +401,29 @@ class ValidationPlugin(PluginInterface, metaclass=abc.ABCMeta):
         """
         return list_directory_content(path, "**/*", lambda p: p.is_file())
 
-    def _get(
+    def _prepare(  # pylint: disable=unused-argument
+        self, context: ValidationPluginContext, kwargs: dict
+    ) -> Optional[dict]:
+        """
+        Returns the (possibly hydrated) request arguments or `None` if
+        the request cannot be processed (in that case, the reason is
+        written to `context.result`). Called before validating the
+        request.
+        """
+        return kwargs
+
+    def prepare(
         self, context: ValidationPluginContext, /, **kwargs
-    ) -> ValidationPluginResult:
+    ) -> Optional[dict]:
+        """
+        Hydrates (see `_prepare`) and validates request. Returns the
+        hydrated request arguments or `None` if the request is rejected
+        (in that case, the reason is written to `context.result`).
+        """
+        kwargs = self._prepare(context, kwargs)
+        if kwargs is None:
+            return None
+
         context.set_progress(f"validating request '{kwargs.get('path', '?')}'")
         context.push()
 
@@ -199,7 +442,21 @@ class ValidationPlugin(PluginInterface, metaclass=abc.ABCMeta):
                 )
                 context.result.success = False
                 context.push()
-                return context.result
+                return None
+        return kwargs
+
+    def collect(
+        self, context: ValidationPluginContext, /, **kwargs
+    ) -> Optional[tuple[list[Path], dict]]:
+        """
+        Validates request and collects records. Returns a tuple of
+        records and the hydrated request arguments or `None` if the
+        request is rejected (in that case, the reason is written to
+        `context.result`).
+        """
+        kwargs = self.prepare(context, **kwargs)
+        if kwargs is None:
+            return None
 
         context.set_progress("collecting targets")
         context.push()
@@ -211,19 +468,220 @@ class ValidationPlugin(PluginInterface, metaclass=abc.ABCMeta):
         context.result.log.log(
             Context.INFO, body=f"Collected {len(records)} record(s)."
         )
+        return records, kwargs
+
+    def _get_part_within_budget(
+        self, record_path: Path, runtime: PluginRuntime, /, **kwargs
+    ) -> ValidationPluginResultPart:
+        """
+        Returns result of `_get_part` for `record_path` while enforcing
+        the time budgets of `runtime` (raises `PluginTimeoutError` if a
+        time budget is exhausted). If `runtime` defines a `profiler`,
+        the call is profiled as record. If it defines a `tracer`, the
+        call is traced as span (subject to the tracer's record-
+        sampling; spans within records that are not sampled are
+        omitted as well).
+        """
+        if runtime.record_timeout is not None:
+            runtime = replace(
+                runtime, record_deadline=monotonic() + runtime.record_timeout
+            )
+        if runtime.tracer is not None and not runtime.tracer.sample_record():
+            runtime = replace(runtime, tracer=None)
+        with use_runtime(runtime), (
+            nullcontext()
+            if runtime.profiler is None
+            else runtime.profiler.record()
+        ), runtime.traced(str(record_path), "record", plugin=self.name):
+            runtime.check_budget(f"Processing '{record_path}'")
+            return self._get_part(record_path, **kwargs)
+
+    def _get_failed_part(
+        self, record_path: Path, msg: str
+    ) -> ValidationPluginResultPart:
+        """Returns failed `_PART_TYPE`-instance with error `msg`."""
+        result = self._PART_TYPE(
+            path=record_path, log=Logger(default_origin=self.display_name)
+        )
+        result.log.log(Context.ERROR, body=msg)
+        result.success = False
+        return result
+
+    @staticmethod
+    def store_part(
+        result: ValidationPluginResult,
+        index: int,
+        part: ValidationPluginResultPart,
+        verbosity: str = "full",
+    ) -> None:
+        """
+        Stores `part` in `result` as record `index` according to the
+        given `verbosity` (see `ReportConfig`).
+        """
+        if result.summary is not None:
+            result.summary.add(part)
+        if verbosity == "summary":
+            return
+        if verbosity == "errors-only":
+            if part.success and part.valid:
+                return
+            part.log = part.log.pick(Context.ERROR)
+            result.records[index] = part
+            return
+        result.records[index] = part
+        result.log.merge(part.log.pick(Context.ERROR))
+
+    def process(
+        self,
+        context: ValidationPluginContext,
+        records: list[Path],
+        /,
+        offset: int = 0,
+        indices: Optional[list[int]] = None,
+        sizes: Optional[list[int]] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Processes `records` (in the given order) and writes results into
+        `context.result.records` (indexed starting at `offset`).
 
-        # process
-        context.result.records = {}
-        for i, record in enumerate(records):
+        Keyword arguments:
+        context -- plugin execution context
+        records -- list of records to be processed
+        offset -- index of the first record in `records`
+                  (default 0)
+        indices -- explicit indices of `records` (replaces `offset`;
+                   used for reordered records)
+                   (default None)
+        sizes -- file sizes of `records` if already known
+                 (default None)
+        kwargs -- hydrated request arguments (see `collect`)
+
+        If a `Checkpoint` is provided via the plugin-runtime, records
+        with a stored result are restored instead of being processed
+        again. If the plugin-runtime is cancelled, a
+        `PluginCancelledError` is raised before the next record. Records
+        that exceed a time budget of the plugin-runtime are marked as
+        failed (and not stored in the checkpoint such that they are
+        retried when the job is resumed). Once the job's time budget is
+        exhausted, the remaining records are skipped and a single
+        failed record is stored for the first of them. If the plugin-
+        runtime defines `timing`, record durations
+        are collected there. Depending on the plugin-runtime's
+        `verbosity`, only a subset of records is stored (see
+        `store_part`). If the plugin-runtime requests compact records,
+        records are collected in a `RecordStore`. If the plugin-runtime
+        defines `progress`, the records (and their file sizes) are
+        reported there (restored and timed-out records are reported as
+        skipped, i.e., are not part of the measured throughput).
+        """
+        runtime = current_runtime()
+        checkpoint = runtime.checkpoint
+        restored = 0
+        if runtime.progress is not None:
+            if sizes is None:
+                sizes = [file_size(record) for record in records]
+            runtime.progress.plan(sizes)
+        if context.result.records is None:
+            context.result.records = (
+                RecordStore(self._PART_TYPE) if runtime.compact_records else {}
+            )
+        if runtime.verbosity != "full" and context.result.summary is None:
+            context.result.summary = ValidationPluginResultSummary()
+        if runtime.timing is not None:
+            context.result.timing = runtime.timing
+        for n, record in enumerate(records):
+            i = offset + n if indices is None else indices[n]
+            if runtime.cancelled:
+                raise PluginCancelledError(
+                    f"Plugin '{self.name}' has been cancelled after "
+                    + f"{n} of {len(records)} record(s)."
+                )
+            if runtime.deadline is not None and monotonic() >= (
+                runtime.deadline
+            ):
+                self.store_part(
+                    context.result,
+                    i,
+                    self._get_failed_part(
+                        record,
+                        f"Job's time budget exhausted after {n} of "
+                        + f"{len(records)} record(s); skipped "
+                        + f"{len(records) - n} record(s) starting with "
+                        + f"'{record}'.",
+                    ),
+                    runtime.verbosity,
+                )
+                context.push()
+                break
             context.set_progress(f"processing '{record}'")
             context.push()
-            context.result.records[i] = self._get_part(record, **kwargs)
-            context.result.log.merge(
-                context.result.records[i].log.pick(Context.ERROR)
+            time0 = monotonic()
+            part = None
+            if checkpoint is not None:
+                part_json = checkpoint.get(record)
+                if part_json is not None:
+                    part = self.load_part(part_json)
+                    restored += 1
+                REGISTRY.inc(
+                    "validator_checkpoint_"
+                    + ("misses" if part is None else "hits")
+                    + "_total",
+                    labels={"plugin": self.name},
+                )
+            measured = part is None
+            if part is None:
+                try:
+                    part = self._get_part_within_budget(
+                        record, runtime, **kwargs
+                    )
+                except PluginTimeoutError as exc_info:
+                    part = self._get_failed_part(record, str(exc_info))
+                    measured = False
+                else:
+                    if checkpoint is not None:
+                        checkpoint.put(record, part.json)
+            duration = monotonic() - time0
+            if runtime.timing is not None:
+                part.duration = duration
+                runtime.timing.add_record(
+                    i, record, duration, runtime.slowest_records
+                )
+            self.store_part(context.result, i, part, runtime.verbosity)
+            REGISTRY.inc(
+                "validator_records_total", labels={"plugin": self.name}
+            )
+            REGISTRY.observe(
+                "validator_record_duration_seconds",
+                duration,
+                labels={"plugin": self.name},
             )
+            if runtime.progress is not None:
+                if measured:
+                    runtime.progress.advance(sizes[n])
+                else:
+                    runtime.progress.skip(sizes[n])
             context.push()
+        if restored > 0:
+            context.result.log.log(
+                Context.INFO,
+                body=f"Restored {restored} record(s) from checkpoint.",
+            )
 
+    def evaluate(
+        self, context: ValidationPluginContext
+    ) -> ValidationPluginResult:
+        """Evaluates and returns `context.result` after processing."""
         context.result.eval()
+        if context.result.summary is not None:
+            context.result.log.log(
+                Context.INFO,
+                body=(
+                    f"Processed {context.result.summary.total} record(s) "
+                    + f"({context.result.summary.failed} failed, "
+                    + f"{context.result.summary.invalid} invalid)."
+                ),
+            )
         if context.result.success:
             context.set_progress("success")
         else:
@@ -231,6 +689,39 @@ class ValidationPlugin(PluginInterface, metaclass=abc.ABCMeta):
         context.push()
         return context.result
 
+    def _get(
+        self, context: ValidationPluginContext, /, **kwargs
+    ) -> ValidationPluginResult:
+        runtime = current_runtime()
+        with runtime.timed("collect"):
+            collected = self.collect(context, **kwargs)
+        if collected is None:
+            return context.result
+        records, kwargs = collected
+
+        indices = sizes = None
+        if runtime.record_order != "discovery":
+            with runtime.timed("order"):
+                stats = stat_records(records)
+                indices = order_records(stats, runtime.record_order)
+                records = [records[p] for p in indices]
+                sizes = [
+                    0 if stats[p] is None else stats[p].st_size
+                    for p in indices
+                ]
+
+        with runtime.timed("process"):
+            self.process(
+                context, records, indices=indices, sizes=sizes, **kwargs
+            )
+        if indices is not None and isinstance(context.result.records, dict):
+            context.result.records = dict(
+                sorted(context.result.records.items())
+            )
+
+        with runtime.timed("evaluate"):
+            return self.evaluate(context)
+
     def get(  # this simply narrows down the involved types
         self, context: Optional[ValidationPluginContext], /, **kwargs
     ) -> ValidationPluginResult:
@@ -15,6 +15,8 @@ from dcm_object_validator.plugins import FidoMIMETypePlugin
 from dcm_object_validator.plugins.identification.interface import (
     FormatIdentificationResult,
 )
+from dcm_object_validator.plugins.runtime import current_runtime
+from dcm_object_validator.plugins.tools import run_tool
 from .interface import FormatValidationPlugin, ValidationPluginResultPart
 
 
@@ -165,6 +167,7 @@ class JHOVEFidoMIMETypePlugin(FormatValidationPlugin):
             if module in _JHOVELoader.load_modules()
         },
     }
+    _PART_TYPE = JHOVEPluginResult
     _ERROR_FMT = "{msg} (file '{file}', module '{module}', id '{id_}')"
     _INFO_FMT = "{msg} (file '{file}', module '{module}')"
 
@@ -189,10 +192,18 @@ class JHOVEFidoMIMETypePlugin(FormatValidationPlugin):
                 fmt=[kwargs["format"]], success=True
             )
 
-        return self.identification_plugin.get(
-            None,
-            **(self._IDENTIFICATION_PLUGIN_ARGS | {"path": str(record_path)}),
-        )
+        with current_runtime().traced(
+            "identification",
+            "identification",
+            plugin=self.identification_plugin.name,
+        ):
+            return self.identification_plugin.get(
+                None,
+                **(
+                    self._IDENTIFICATION_PLUGIN_ARGS
+                    | {"path": str(record_path)}
+                ),
+            )
 
     def _get_jhove_module(self, fmt: list[str]) -> str:
         """Returns JHOVE-module based on given `fmt`."""
@@ -281,7 +292,7 @@ class JHOVEFidoMIMETypePlugin(FormatValidationPlugin):
             return result
 
         # make call to JHOVE
-        subprocess_result = subprocess.run(
+        subprocess_result = run_tool(
             [
                 _JHOVELoader.DEFAULT_JHOVE_CMD,
                 "-h",
@@ -294,10 +305,7 @@ class JHOVEFidoMIMETypePlugin(FormatValidationPlugin):
             )
             + [
                 str(record_path),
-            ],
-            check=False,
-            capture_output=True,
-            text=True,
+            ]
         )
 
         # jhove returned error
@@ -0,0 +1,97 @@
+"""
+Ordering of the records of `ValidationPlugin`-invocations based on a
+`stat`-prepass.
+"""
+
+from typing import Optional
+from collections.abc import Iterable
+from pathlib import Path
+import heapq
+import os
+
+
+# record order-policies
+# * 'discovery': order of record collection (no prepass)
+# * 'largest-first': descending file size (minimizes the makespan of
+#   parallel processing)
+# * 'smallest-first': ascending file size (early feedback)
+# * 'physical': ascending device and inode (reduces seek overhead on
+#   spinning disks)
+ORDERS = ("discovery", "largest-first", "smallest-first", "physical")
+
+
+def stat_records(records: Iterable[Path]) -> list[Optional[os.stat_result]]:
+    """
+    Returns the `stat`-results for `records` (`None` for records that
+    are not accessible).
+    """
+    stats = []
+    for record in records:
+        try:
+            stats.append(os.stat(record))
+        except OSError:
+            stats.append(None)
+    return stats
+
+
+def order_records(
+    stats: list[Optional[os.stat_result]], policy: str
+) -> list[int]:
+    """
+    Returns the positions of the records with `stats` in the order given
+    by `policy` (see `ORDERS`). The order is stable and inaccessible
+    records are placed last.
+    """
+    positions = range(len(stats))
+    if policy == "discovery":
+        return list(positions)
+    if policy in ("largest-first", "smallest-first"):
+        sign = -1 if policy == "largest-first" else 1
+        return sorted(
+            positions,
+            key=lambda p: (
+                (1, 0) if stats[p] is None else (0, sign * stats[p].st_size)
+            ),
+        )
+    if policy == "physical":
+        return sorted(
+            positions,
+            key=lambda p: (
+                (1, 0, 0)
+                if stats[p] is None
+                else (0, stats[p].st_dev, stats[p].st_ino)
+            ),
+        )
+    raise ValueError(
+        f"Unknown record order '{policy}' (expected one of {ORDERS})."
+    )
+
+
+def balance_shards(
+    sizes: list[int], shards: int, capacity: Optional[int] = None
+) -> list[list[int]]:
+    """
+    Returns the positions of records with `sizes` distributed over (at
+    most) `shards` shards such that the total sizes per shard are
+    balanced (greedy largest-first assignment; ties are broken by the
+    number of records per shard). Positions within a shard are in
+    ascending order.
+
+    If `capacity` is not `None`, no shard receives more than `capacity`
+    records (a `ValueError` is raised if `shards` shards of that
+    capacity cannot hold all records).
+    """
+    shards = min(shards, len(sizes))
+    if capacity is not None and shards * capacity < len(sizes):
+        raise ValueError(
+            f"Cannot distribute {len(sizes)} records over {shards} "
+            + f"shard(s) of capacity {capacity}."
+        )
+    bins: list[list[int]] = [[] for _ in range(shards)]
+    heap = [(0, 0, n) for n in range(len(bins))]
+    for position in sorted(range(len(sizes)), key=lambda p: -sizes[p]):
+        total, count, n = heapq.heappop(heap)
+        bins[n].append(position)
+        if capacity is None or count + 1 < capacity:
+            heapq.heappush(heap, (total + sizes[position], count + 1, n))
+    return [sorted(positions) for positions in bins]
@@ -0,0 +1,127 @@
+"""Compact storage for records of validation-plugin-invocations."""
+
+from typing import Any, Optional, TYPE_CHECKING
+from collections.abc import Iterator, MutableMapping
+from array import array
+import os
+import sys
+import json
+
+if TYPE_CHECKING:
+    from dcm_object_validator.plugins.validation.interface import (
+        ValidationPluginResultPart,
+    )
+
+
+class RecordStore(MutableMapping):
+    """
+    Array-backed mapping of record-indices to
+    `ValidationPluginResultPart`s with a small memory footprint.
+
+    Instead of keeping every part as object, the store keeps parallel
+    arrays of
+    * interned directory-names (shared by many records) and file-names
+      of the record paths,
+    * a bitfield with the states of `success` and `valid`, and
+    * the remaining serialized data (e.g., log) as compact JSON-
+      strings.
+
+    Parts are reconstructed on access (changes to a returned part are
+    therefore not written back). Iteration is ordered by index.
+
+    Keyword arguments:
+    part_type -- type of the stored parts (used for deserialization)
+    """
+
+    # per field two bits: 0 (missing), 1 (None), 2 (False), 3 (True)
+    _STATES = {None: 1, False: 2, True: 3}
+    _VALUES = {1: None, 2: False, 3: True}
+
+    def __init__(self, part_type: type["ValidationPluginResultPart"]) -> None:
+        self._part_type = part_type
+        self._rows: dict[int, int] = {}
+        self._indices = array("q")
+        self._dirs: list[Optional[str]] = []
+        self._names: list[Optional[str]] = []
+        self._status = bytearray()
+        self._extras: list[Optional[str]] = []
+
+    def _encode_status(self, data: dict) -> int:
+        status = 0
+        for shift, key in ((0, "success"), (2, "valid")):
+            if key in data:
+                status |= self._STATES[data.pop(key)] << shift
+        return status
+
+    def __setitem__(
+        self, index: int, part: "ValidationPluginResultPart"
+    ) -> None:
+        data = part.json
+        dir_, name = os.path.split(data.pop("path"))
+        status = self._encode_status(data)
+        extra = json.dumps(data, separators=(",", ":")) if data else None
+        row = self._rows.get(index)
+        if row is None:
+            self._rows[index] = len(self._indices)
+            self._indices.append(index)
+            self._dirs.append(sys.intern(dir_))
+            self._names.append(name)
+            self._status.append(status)
+            self._extras.append(extra)
+        else:
+            self._dirs[row] = sys.intern(dir_)
+            self._names[row] = name
+            self._status[row] = status
+            self._extras[row] = extra
+
+    def _row_json(self, row: int) -> dict[str, Any]:
+        data = {"path": os.path.join(self._dirs[row], self._names[row])}
+        for shift, key in ((0, "success"), (2, "valid")):
+            state = (self._status[row] >> shift) & 3
+            if state:
+                data[key] = self._VALUES[state]
+        if self._extras[row] is not None:
+            data.update(json.loads(self._extras[row]))
+        return data
+
+    def __getitem__(self, index: int) -> "ValidationPluginResultPart":
+        return self._part_type.from_json(self._row_json(self._rows[index]))
+
+    def __delitem__(self, index: int) -> None:
+        row = self._rows.pop(index)
+        self._dirs[row] = None
+        self._names[row] = None
+        self._extras[row] = None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(sorted(self._rows))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def states(self) -> Iterator[tuple[Optional[bool], Optional[bool]]]:
+        """
+        Yields tuples of `success` and `valid` for all records (without
+        reconstructing the parts).
+        """
+        for row in self._rows.values():
+            yield (
+                self._VALUES.get(self._status[row] & 3),
+                self._VALUES.get((self._status[row] >> 2) & 3),
+            )
+
+    def items_json(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Yields pairs of (stringified) index and serialized part in
+        index-order.
+        """
+        for index in self:
+            yield str(index), self._row_json(self._rows[index])
+
+    @property
+    def json(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns serialized records in the format of
+        `ValidationPluginResult.records`.
+        """
+        return dict(self.items_json())
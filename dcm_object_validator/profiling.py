@@ -0,0 +1,123 @@
+"""Opt-in profiling of validation jobs."""
+
+from typing import Optional
+from pathlib import Path
+from contextlib import contextmanager
+from threading import Lock
+import cProfile
+import tracemalloc
+
+
+# tracemalloc is process-wide; it is started by the first profiler
+# that traces memory and stopped once the last one exits (unless it
+# has been started elsewhere)
+_TRACEMALLOC_LOCK = Lock()
+_tracemalloc_users = 0
+_tracemalloc_started = False
+
+
+def _acquire_tracemalloc() -> None:
+    global _tracemalloc_users, _tracemalloc_started
+    with _TRACEMALLOC_LOCK:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_started = True
+        _tracemalloc_users += 1
+
+
+def _release_tracemalloc() -> None:
+    global _tracemalloc_users, _tracemalloc_started
+    with _TRACEMALLOC_LOCK:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_started:
+            tracemalloc.stop()
+            _tracemalloc_started = False
+
+
+class JobProfiler:
+    """
+    Context manager that profiles a job with `cProfile` (and optionally
+    `tracemalloc`) and writes the results into `directory` on exit:
+    * '<name>.prof': `cProfile`-statistics (e.g., for `pstats` or
+      `snakeviz`) and
+    * '<name>.tracemalloc': `tracemalloc.Snapshot` taken at the end of
+      the job (see `tracemalloc.Snapshot.load`).
+
+    Keyword arguments:
+    directory -- output directory
+    name -- base name of the output files (e.g., the job token)
+    memory -- whether to trace memory allocations
+              (default False)
+    records -- if `True`, only the code inside `record`-blocks is
+               profiled (instead of the entire job)
+               (default False)
+    retention -- maximum number of profiles kept in `directory` (older
+                 profiles are deleted); `None` corresponds to no limit
+                 (default None)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        name: str,
+        memory: bool = False,
+        records: bool = False,
+        retention: Optional[int] = None,
+    ) -> None:
+        self.directory = directory
+        self.name = name
+        self.memory = memory
+        self.records = records
+        self.retention = retention
+        self.profile = cProfile.Profile()
+
+    def __enter__(self) -> "JobProfiler":
+        if self.memory:
+            _acquire_tracemalloc()
+        if not self.records:
+            self.profile.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        if not self.records:
+            self.profile.disable()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.profile.dump_stats(self.directory / f"{self.name}.prof")
+        if self.memory:
+            try:
+                tracemalloc.take_snapshot().dump(
+                    str(self.directory / f"{self.name}.tracemalloc")
+                )
+            finally:
+                _release_tracemalloc()
+        self.apply_retention()
+
+    @contextmanager
+    def record(self):
+        """
+        Context manager that profiles its body if only records are
+        profiled (no-op otherwise).
+        """
+        if not self.records:
+            yield
+            return
+        self.profile.enable()
+        try:
+            yield
+        finally:
+            self.profile.disable()
+
+    def apply_retention(self) -> None:
+        """Deletes the oldest profiles exceeding `retention`."""
+        if self.retention is None:
+            return
+        profiles = []
+        for profile in self.directory.glob("*.prof"):
+            try:
+                profiles.append((profile.stat().st_mtime, profile))
+            except FileNotFoundError:  # deleted concurrently
+                continue
+        profiles = [profile for _, profile in sorted(profiles)]
+        for profile in profiles[: max(0, len(profiles) - self.retention)]:
+            for file in (profile, profile.with_suffix(".tracemalloc")):
+                file.unlink(missing_ok=True)
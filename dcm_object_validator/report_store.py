@@ -0,0 +1,162 @@
+"""
+File-based store for the final reports of jobs.
+
+The orchestra-backend only provides reports as a whole (see
+`Controller.get_report`), i.e., streaming a report from there still
+requires to load it into memory completely. Instead, the final report
+of a job can be written (incrementally) into a shared directory from
+where it is streamed with a flat memory profile:
+* '<token>.json': the serialized report and
+* '<token>.records.ndjson': the records of all plugin results (one
+  JSON-object with the keys 'plugin', 'index', and 'record' per line;
+  see `views.report.iter_records`).
+"""
+
+from typing import Any, Optional
+from collections.abc import Iterator
+from pathlib import Path
+import json
+import os
+
+from dcm_object_validator.models import Report
+from dcm_object_validator.plugins.validation.records import RecordStore
+
+
+class ReportStore:
+    """
+    File-based store for the final reports of jobs.
+
+    Keyword arguments:
+    directory -- directory shared by all processes of the service
+    retention -- maximum number of reports kept in `directory` (older
+                 reports are deleted); `None` corresponds to no limit
+                 (default None)
+    """
+
+    def __init__(self, directory: Path, retention: Optional[int] = None):
+        self.directory = directory
+        self.retention = retention
+
+    def _files(self, token: str) -> Optional[tuple[Path, Path]]:
+        """
+        Returns the report- and records-file for `token` (or `None` if
+        `token` is not a plain file name).
+        """
+        if not token or token.startswith(".") or Path(token).name != token:
+            return None
+        return (
+            self.directory / f"{token}.json",
+            self.directory / f"{token}.records.ndjson",
+        )
+
+    @staticmethod
+    def _iter_record_lines(report: Report) -> Iterator[str]:
+        for plugin_id, result in report.data.details.items():
+            records = getattr(result, "records", None)
+            if isinstance(records, RecordStore):
+                items = records.items_json()
+            elif records is not None:
+                items = (
+                    (index, records[index].json)
+                    for index in sorted(records, key=int)
+                )
+            else:
+                continue
+            for index, record in items:
+                yield (
+                    json.dumps(
+                        {
+                            "plugin": plugin_id,
+                            "index": int(index),
+                            "record": record,
+                        }
+                    )
+                    + "\n"
+                )
+
+    def write(self, token: str, report: Report) -> None:
+        """Writes `report` of the job `token` (one chunk at a time)."""
+        files = self._files(token)
+        if files is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for file, chunks in zip(
+            files, (report.iter_json(), self._iter_record_lines(report))
+        ):
+            tmp = file.with_name(f".{file.name}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp, file)
+        self.apply_retention()
+
+    def iter_report(
+        self, token: str, chunk_size: int = 65536
+    ) -> Optional[Iterator[str]]:
+        """
+        Returns iterator for the JSON-chunks of the report of the job
+        `token` (or `None` if not available).
+        """
+        files = self._files(token)
+        if files is None:
+            return None
+        try:
+            f = open(files[0], "r", encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        def chunks():
+            with f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+
+        return chunks()
+
+    def iter_records(self, token: str) -> Optional[Iterator[dict]]:
+        """
+        Returns iterator for the records of the report of the job
+        `token` (or `None` if not available).
+        """
+        files = self._files(token)
+        if files is None or not files[0].is_file():
+            return None
+        try:
+            f = open(files[1], "r", encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        def records():
+            with f:
+                for line in f:
+                    yield json.loads(line)
+
+        return records()
+
+    def apply_retention(self) -> None:
+        """Deletes the oldest reports exceeding `retention`."""
+        if self.retention is None:
+            return
+        reports = []
+        for file in self.directory.glob("*.records.ndjson"):
+            try:
+                reports.append((file.stat().st_mtime, file))
+            except FileNotFoundError:  # deleted concurrently
+                continue
+        reports.sort()
+        for _, file in reports[: max(0, len(reports) - self.retention)]:
+            file.with_name(
+                file.name.removesuffix(".records.ndjson") + ".json"
+            ).unlink(missing_ok=True)
+            file.unlink(missing_ok=True)
+
+
+def get_report_store(config: Any) -> Optional[ReportStore]:
+    """
+    Returns `ReportStore` based on the app-`config` (or `None` if the
+    store is disabled).
+    """
+    if config.REPORT_STORE_DIR is None:
+        return None
+    return ReportStore(
+        config.REPORT_STORE_DIR, retention=config.REPORT_STORE_RETENTION
+    )
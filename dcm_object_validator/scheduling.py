@@ -0,0 +1,457 @@
+"""
+Job-size-aware admission control for validation jobs.
+
+Jobs are classified by an estimate of their cost (number of files and
+bytes of the target; see `estimate_cost`) into the lanes 'express' and
+'bulk'. Every lane can have a capacity, i.e., a maximum number of jobs
+that are queued or running at the same time. Admitted jobs are tracked
+in a shared directory (one file per job) such that capacities hold
+across processes (e.g., app- and worker-processes).
+
+Lanes only gate the admission of jobs on submission: admitted jobs of
+all lanes share the orchestra-queue, which is processed in order of
+submission (i.e., express-jobs are not prioritized). Only a bulk-
+capacity below the number of workers keeps workers available for small
+jobs.
+
+Additionally, the number and total size of queued jobs can be limited
+(admission control). Rejections come with an estimate for when to
+retry based on the recent throughput.
+
+The registry also provides a snapshot of the current load (queue depth,
+running jobs, waiting times, and worker utilization; see
+`LaneRegistry.load`), e.g., for autoscaling.
+"""
+
+from typing import Optional
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from contextlib import contextmanager
+from time import time
+import fcntl
+import json
+import os
+
+from dcm_common.models import DataModel
+
+
+EXPRESS = "express"
+BULK = "bulk"
+LANES = (EXPRESS, BULK)
+
+
+@dataclass
+class JobCost(DataModel):
+    """
+    Data model for the estimated cost of a validation job.
+
+    Keyword arguments:
+    files -- number of files in the target
+             (default 0)
+    size -- total size of these files in bytes
+            (default 0)
+    complete -- `False` if the estimate has been cut short (see
+                `estimate_cost`)
+                (default True)
+    """
+
+    files: int = 0
+    size: int = 0
+    complete: bool = True
+
+
+def estimate_cost(path: Path, limit: Optional[int] = None) -> JobCost:
+    """
+    Returns `JobCost` of the file or directory at `path` based on a
+    quick `stat` of its contents (symlinks are not followed). The
+    traversal stops after `limit` directory entries (if not `None`).
+    """
+    if not path.is_dir():
+        try:
+            return JobCost(1, path.stat().st_size)
+        except OSError:
+            return JobCost()
+    cost = JobCost()
+    entries = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as iterator:
+                for entry in iterator:
+                    entries += 1
+                    if limit is not None and entries > limit:
+                        cost.complete = False
+                        return cost
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        cost.files += 1
+                        cost.size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return cost
+
+
+def classify(cost: JobCost, max_files: int, max_size: int) -> str:
+    """
+    Returns the lane for a job of `cost`: 'express' if the (complete)
+    estimate does not exceed `max_files` and `max_size`, 'bulk'
+    otherwise.
+    """
+    if cost.complete and cost.files <= max_files and cost.size <= max_size:
+        return EXPRESS
+    return BULK
+
+
+def get_lanes(config) -> Optional["LaneRegistry"]:
+    """
+    Returns `LaneRegistry` as configured by the app-`config` (or `None`
+    if job-size-aware scheduling is disabled).
+    """
+    if config.SCHEDULING_DIR is None:
+        return None
+    return LaneRegistry(
+        config.SCHEDULING_DIR,
+        {
+            EXPRESS: config.SCHEDULING_EXPRESS_CAPACITY,
+            BULK: config.SCHEDULING_BULK_CAPACITY,
+        },
+        max_queue_depth=config.ADMISSION_MAX_QUEUE_DEPTH,
+        max_queued_size=config.ADMISSION_MAX_QUEUED_BYTES,
+    )
+
+
+class AdmissionError(RuntimeError):
+    """
+    Raised if a job is not admitted.
+
+    Keyword arguments:
+    msg -- reason for the rejection
+    status -- suggested HTTP-status code for the rejection
+    retry_after -- estimated time (in seconds) until the job could be
+                   admitted (`None` if unknown)
+    """
+
+    def __init__(
+        self, msg: str, status: int, retry_after: Optional[float]
+    ) -> None:
+        super().__init__(msg)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class LaneRegistry:
+    """
+    File-based registry of the jobs that have been admitted into the
+    scheduling lanes.
+
+    Besides the capacities per lane, the admission can be limited by
+    the total number of queued (i.e., admitted but not yet started)
+    jobs and their total size. The completions of the most recent jobs
+    are kept to estimate the current throughput.
+
+    Keyword arguments:
+    directory -- shared working directory
+    capacities -- maximum number of (queued or running) jobs per lane;
+                  lanes that are missing or `None` are not limited
+    grace -- time (in seconds) after admission during which an entry
+             is not considered stale (the job may not have been queued
+             yet)
+             (default 10)
+    max_queue_depth -- maximum number of queued jobs
+                       (default None; not limited)
+    max_queued_size -- maximum total size (in bytes) of queued jobs
+                       (a job is always admitted into an empty queue)
+                       (default None; not limited)
+    history -- number of completed jobs that are kept for estimating
+               the throughput
+               (default 100)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        capacities: dict[str, Optional[int]],
+        grace: float = 10,
+        max_queue_depth: Optional[int] = None,
+        max_queued_size: Optional[int] = None,
+        history: int = 100,
+    ) -> None:
+        self.directory = directory
+        self.capacities = capacities
+        self.grace = grace
+        self.max_queue_depth = max_queue_depth
+        self.max_queued_size = max_queued_size
+        self.history = history
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Inter-process lock for modifications of the registry."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / ".lock", "w", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _file(self, token: str) -> Path:
+        return self.directory / f"{token}.json"
+
+    def _write(self, entry: dict) -> None:
+        file = self._file(entry["token"])
+        tmp = file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, file)
+
+    def _read(self, token: str) -> Optional[dict]:
+        try:
+            return json.loads(self._file(token).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def entries(self, lane: Optional[str] = None) -> list[dict]:
+        """
+        Returns the entries of all admitted jobs (or only those in
+        `lane`).
+        """
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for file in self.directory.glob("*.json"):
+            try:
+                entry = json.loads(file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if lane is None or entry.get("lane") == lane:
+                entries.append(entry)
+        return entries
+
+    def completed(self) -> list[dict]:
+        """
+        Returns the most recent completions (in order of completion).
+        """
+        try:
+            return json.loads(
+                (self.directory / ".history").read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return []
+
+    def throughput(
+        self, lane: Optional[str] = None, window: float = 600
+    ) -> Optional[tuple[float, float]]:
+        """
+        Returns the current throughput as jobs and bytes per second
+        (for `lane` or all lanes) based on the completions within the
+        last `window` seconds (or `None` if there are none). Only the
+        part of the window since the start of the earliest of these
+        jobs is considered, such that an idle period before does not
+        dilute the result.
+        """
+        now = time()
+        completed = [
+            c
+            for c in self.completed()
+            if (lane is None or c["lane"] == lane)
+            and c["finished"] >= now - window
+        ]
+        if not completed:
+            return None
+        span = now - max(now - window, min(c["started"] for c in completed))
+        if span <= 0:
+            return None
+        return (
+            len(completed) / span,
+            sum(c["size"] for c in completed) / span,
+        )
+
+    def _prune(self, is_stale: Callable[[str], bool]) -> None:
+        """Removes stale entries (see `admit`)."""
+        for entry in self.entries():
+            if time() - entry["submitted"] > self.grace and is_stale(
+                entry["token"]
+            ):
+                self._file(entry["token"]).unlink(missing_ok=True)
+
+    def _check(self, lane: str, cost: JobCost) -> Optional[AdmissionError]:
+        """
+        Returns `AdmissionError` if a job of `cost` cannot be admitted
+        into `lane`.
+        """
+        capacity = self.capacities.get(lane)
+        if capacity is not None and len(self.entries(lane)) >= capacity:
+            throughput = self.throughput(lane)
+            return AdmissionError(
+                f"Lane '{lane}' is at capacity.",
+                429,
+                None if throughput is None else 1 / throughput[0],
+            )
+        queued = [e for e in self.entries() if e["started"] is None]
+        if (
+            self.max_queue_depth is not None
+            and len(queued) >= self.max_queue_depth
+        ):
+            throughput = self.throughput()
+            return AdmissionError(
+                f"Maximum queue depth of {self.max_queue_depth} reached.",
+                503,
+                (
+                    None
+                    if throughput is None
+                    else (len(queued) - self.max_queue_depth + 1)
+                    / throughput[0]
+                ),
+            )
+        size = sum(e["cost"]["size"] for e in queued)
+        if (
+            self.max_queued_size is not None
+            and size + cost.size > self.max_queued_size
+            and queued
+        ):
+            throughput = self.throughput()
+            return AdmissionError(
+                f"Maximum queued size of {self.max_queued_size} bytes "
+                + "reached.",
+                503,
+                (
+                    None
+                    if throughput is None or throughput[1] == 0
+                    else (size + cost.size - self.max_queued_size)
+                    / throughput[1]
+                ),
+            )
+        return None
+
+    def admit(
+        self,
+        token: str,
+        lane: str,
+        cost: JobCost,
+        is_stale: Optional[Callable[[str], bool]] = None,
+    ) -> bool:
+        """
+        Registers the job `token` in `lane` (if not already registered)
+        or raises `AdmissionError` if the lane is at capacity or the
+        queue limits are exceeded. In that case, entries for which
+        `is_stale` returns `True` (e.g., jobs that have been aborted)
+        are removed before the limits are checked again (see `grace`).
+
+        Returns `True` if a new entry has been created and `False` if
+        the job had already been registered (e.g., by a previous
+        submission of the same job).
+        """
+        with self._lock():
+            if self._file(token).is_file():
+                return False
+            error = self._check(lane, cost)
+            if error is not None and is_stale is not None:
+                self._prune(is_stale)
+                error = self._check(lane, cost)
+            if error is not None:
+                raise error
+            self._write(
+                {
+                    "token": token,
+                    "lane": lane,
+                    "cost": cost.json,
+                    "submitted": time(),
+                    "started": None,
+                }
+            )
+            return True
+
+    def start(self, token: str) -> None:
+        """Marks the job `token` as running."""
+        with self._lock():
+            entry = self._read(token)
+            if entry is None:
+                return
+            entry["started"] = time()
+            self._write(entry)
+
+    def release(self, token: str) -> None:
+        """
+        Removes the job `token` from the registry and records its
+        completion (if it has been started).
+        """
+        with self._lock():
+            entry = self._read(token)
+            self._file(token).unlink(missing_ok=True)
+            if entry is None or entry["started"] is None:
+                return
+            completed = (
+                self.completed()
+                + [
+                    {
+                        "lane": entry["lane"],
+                        "size": entry["cost"]["size"],
+                        "submitted": entry["submitted"],
+                        "started": entry["started"],
+                        "finished": time(),
+                    }
+                ]
+            )[-self.history :]
+            tmp = self.directory / ".history.tmp"
+            tmp.write_text(json.dumps(completed), encoding="utf-8")
+            os.replace(tmp, self.directory / ".history")
+
+    def load(self, workers: int, window: float = 60) -> dict:
+        """
+        Returns a snapshot of the current load:
+        * 'queued' and 'running': number of queued and running jobs,
+        * 'busy_ratio': fraction of the time of `workers` workers spent
+          on jobs during the last `window` seconds (based on the
+          running and most recent completed jobs; shard jobs are not
+          registered in the lanes and are, hence, not included), and
+        * 'lanes': per lane, the number of queued and running jobs, the
+          capacity, the longest waiting time of a queued job
+          ('max_wait'), and the mean waiting time of the most recent
+          completed jobs ('mean_wait'; `None` if unknown).
+        """
+        now = time()
+        entries = self.entries()
+        completed = self.completed()
+        busy = sum(
+            max(0, min(c["finished"], now) - max(c["started"], now - window))
+            for c in completed
+        ) + sum(
+            now - max(e["started"], now - window)
+            for e in entries
+            if e["started"] is not None
+        )
+        lanes = {}
+        for lane in LANES:
+            queued = [
+                e
+                for e in entries
+                if e["lane"] == lane and e["started"] is None
+            ]
+            waits = [
+                c["started"] - c["submitted"]
+                for c in completed
+                if c["lane"] == lane and "submitted" in c
+            ]
+            lanes[lane] = {
+                "queued": len(queued),
+                "running": sum(
+                    e["lane"] == lane and e["started"] is not None
+                    for e in entries
+                ),
+                "capacity": self.capacities.get(lane),
+                "max_wait": max(
+                    (now - e["submitted"] for e in queued), default=0
+                ),
+                "mean_wait": sum(waits) / len(waits) if waits else None,
+            }
+        return {
+            "queued": sum(lane["queued"] for lane in lanes.values()),
+            "running": sum(lane["running"] for lane in lanes.values()),
+            "busy_ratio": (
+                busy / (workers * window)
+                if workers > 0 and window > 0
+                else None
+            ),
+            "lanes": lanes,
+        }
@@ -0,0 +1,88 @@
+"""Streaming JSON-serialization of (large) reports."""
+
+from typing import Any
+from collections.abc import Iterable, Iterator, Mapping
+import json
+import zlib
+
+from dcm_common.models import DataModel
+
+
+def iter_json(value: Any, depth: int = 0) -> Iterator[str]:
+    """
+    Yields JSON-chunks for `value`.
+
+    Iterators are expected to yield JSON-chunks themselves. Objects that
+    define a method `iter_json` are serialized with that method while
+    (other) `DataModel`s are serialized via their `json`-property.
+    Mappings are serialized member by member down to a nesting-level of
+    `depth`; deeper values are serialized at once.
+
+    Keyword arguments:
+    value -- value to be serialized
+    depth -- nesting-level down to which mappings are streamed
+             (default 0)
+    """
+    if isinstance(value, Iterator):
+        yield from value
+        return
+    if hasattr(value, "iter_json"):
+        yield from value.iter_json()
+        return
+    if isinstance(value, DataModel):
+        value = value.json
+    if depth > 0 and isinstance(value, Mapping):
+        yield from iter_json_object(value.items(), depth - 1)
+        return
+    yield json.dumps(value)
+
+
+def iter_json_object(
+    items: Iterable[tuple[Any, Any]], depth: int = 0
+) -> Iterator[str]:
+    """
+    Yields JSON-chunks for an object with the given `items` (pairs of
+    key and value). Values are serialized with `iter_json`.
+    """
+    yield "{"
+    for i, (key, value) in enumerate(items):
+        yield ("," if i > 0 else "") + json.dumps(str(key)) + ":"
+        yield from iter_json(value, depth)
+    yield "}"
+
+
+def iter_bytes(
+    chunks: Iterable[str], compress: bool = False, buffer_size: int = 65536
+) -> Iterator[bytes]:
+    """
+    Yields the utf-8-encoded `chunks` in blocks of at least
+    `buffer_size` characters (except the last block).
+
+    Keyword arguments:
+    chunks -- text chunks (e.g., from `iter_json`)
+    compress -- whether to compress the output as gzip-stream
+                (default False)
+    buffer_size -- minimum number of characters per block
+                   (default 65536)
+    """
+    # wbits=31 selects the gzip-container format
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size < buffer_size:
+            continue
+        block = "".join(buffer).encode("utf-8")
+        buffer.clear()
+        size = 0
+        if compressor is not None:
+            block = compressor.compress(block)
+        if block:
+            yield block
+    block = "".join(buffer).encode("utf-8")
+    if compressor is not None:
+        block = compressor.compress(block) + compressor.flush()
+    if block:
+        yield block
@@ -0,0 +1,151 @@
+"""
+Opt-in tracing of validation jobs.
+
+Spans are written in the Chrome trace-event format (JSON array of
+'complete'-events, one event per line) and can be inspected with, for
+example, Perfetto (https://ui.perfetto.dev) or 'chrome://tracing'.
+"""
+
+from typing import Optional, TextIO
+from pathlib import Path
+from contextlib import contextmanager
+from threading import Lock, current_thread, get_ident
+from time import time, perf_counter
+import random
+import json
+import os
+
+
+class JobTracer:
+    """
+    Context manager that collects trace spans of a job and writes them
+    to the file `path` (created on enter and completed on exit). The
+    body of the context manager is recorded as root span.
+
+    Since the events are written incrementally, trace files of jobs
+    that did not complete can still be loaded by most trace viewers.
+
+    Keyword arguments:
+    path -- output file
+    name -- name of the root span
+            (default 'job')
+    args -- additional information for the root span
+            (default None)
+    record_sample_rate -- fraction of records for which spans are
+                          recorded (see `sample_record`)
+                          (default 1.0)
+    retention -- maximum number of traces ('*.trace.json') kept in the
+                 directory of `path` (older traces are deleted on exit);
+                 `None` corresponds to no limit
+                 (default None)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        name: str = "job",
+        args: Optional[dict] = None,
+        record_sample_rate: float = 1.0,
+        retention: Optional[int] = None,
+    ) -> None:
+        self.path = path
+        self.name = name
+        self.args = args or {}
+        self.record_sample_rate = record_sample_rate
+        self.retention = retention
+        self._lock = Lock()
+        self._file: Optional[TextIO] = None
+        self._events = 0
+        self._threads = set()
+        self._root = None
+
+    def __enter__(self) -> "JobTracer":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # pylint: disable=consider-using-with
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write("[\n")
+        self._root = self.span(self.name, "job", **self.args)
+        self._root.__enter__()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._root.__exit__(None, None, None)
+        with self._lock:
+            self._file.write("\n]\n")
+            self._file.close()
+            self._file = None
+        self.apply_retention()
+
+    def apply_retention(self) -> None:
+        """Deletes the oldest traces exceeding `retention`."""
+        if self.retention is None:
+            return
+        traces = []
+        for trace in self.path.parent.glob("*.trace.json"):
+            try:
+                traces.append((trace.stat().st_mtime, trace))
+            except FileNotFoundError:  # deleted concurrently
+                continue
+        traces.sort()
+        for _, trace in traces[: max(0, len(traces) - self.retention)]:
+            trace.unlink(missing_ok=True)
+
+    def _write(self, event: dict) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            if event["tid"] not in self._threads:
+                self._threads.add(event["tid"])
+                self._write_unlocked(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": event["pid"],
+                        "tid": event["tid"],
+                        "args": {"name": current_thread().name},
+                    }
+                )
+            self._write_unlocked(event)
+
+    def _write_unlocked(self, event: dict) -> None:
+        self._file.write(
+            (",\n" if self._events > 0 else "")
+            + json.dumps(event, separators=(",", ":"))
+        )
+        self._events += 1
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        """
+        Context manager that records its body as span.
+
+        Keyword arguments:
+        name -- name of the span
+        category -- category of the span (e.g., 'plugin' or 'record')
+        args -- additional (JSON-serializable) information
+        """
+        ts = time()
+        time0 = perf_counter()
+        try:
+            yield
+        finally:
+            self._write(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    # timestamps and durations are given in microseconds
+                    "ts": round(ts * 1e6),
+                    "dur": round((perf_counter() - time0) * 1e6),
+                    "pid": os.getpid(),
+                    "tid": get_ident(),
+                    "args": args,
+                }
+            )
+
+    def sample_record(self) -> bool:
+        """Returns `True` if the next record should be traced."""
+        return (
+            self.record_sample_rate >= 1
+            or random.random() < self.record_sample_rate
+        )
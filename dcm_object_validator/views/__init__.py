@@ -1,5 +1,11 @@
 from .validation import ValidationView
+from .report import ReportRecordsView
+from .metrics import MetricsView
+from .status import LoadStatusView
 
 __all__ = [
     "ValidationView",
+    "ReportRecordsView",
+    "MetricsView",
+    "LoadStatusView",
 ]
@@ -0,0 +1,27 @@
+"""
+Metrics View-class definition
+"""
+
+from flask import Blueprint, Response
+from dcm_common import services
+
+from dcm_object_validator import metrics
+
+
+class MetricsView(services.View):
+    """
+    View-class for exposing metrics (aggregated across all processes
+    that share `METRICS_DIR`) in the Prometheus text-format.
+    """
+
+    NAME = "metrics"
+
+    def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
+        @bp.route("/metrics", methods=["GET"])
+        def get_metrics():
+            """Get metrics."""
+            return Response(
+                metrics.render(metrics.aggregate(self.config.METRICS_DIR)),
+                mimetype="text/plain",
+                status=200,
+            )
@@ -0,0 +1,91 @@
+"""Definition of a throttled report-push."""
+
+from typing import Optional, Callable, TYPE_CHECKING
+from contextlib import nullcontext
+from time import monotonic
+
+if TYPE_CHECKING:
+    from dcm_object_validator.tracing import JobTracer
+
+
+class ThrottledPush:
+    """
+    Wrapper for a report-`push` that coalesces frequent calls.
+
+    Calling an instance only forwards to `push` if at least `interval`
+    seconds have passed since the last forwarded call; otherwise the
+    update is marked as pending and included in the next forwarded
+    call. Pending updates can be forwarded explicitly via `flush` or,
+    once the interval has passed, via `poll` (which is meant to be
+    called regularly during long-running work, such that pending
+    updates are not held back until the next call).
+
+    Note that this only reduces the number of pushes: every forwarded
+    call still pushes (and serializes) the entire report, i.e., its
+    cost grows linearly with the number of records in the report. The
+    total cost of coalesced pushes is, hence, roughly the job's duration
+    divided by `interval` times the cost of a single push instead of
+    the number of records times that cost.
+
+    Keyword arguments:
+    push -- callable that pushes the entire report
+    interval -- minimum time (in seconds) between pushes; if not
+                positive, every call is forwarded
+    tracer -- if set, forwarded calls are traced as spans
+              (default None)
+
+    The accumulated time (in seconds) spent in forwarded calls is
+    available as `duration`.
+    """
+
+    def __init__(
+        self,
+        push: Callable[[], None],
+        interval: float,
+        tracer: Optional["JobTracer"] = None,
+    ) -> None:
+        self._push = push
+        self.interval = interval
+        self.tracer = tracer
+        self.pending = False
+        self.duration = 0.0
+        self._last = None
+
+    def force(self) -> None:
+        """Forward call to `push` unconditionally."""
+        time0 = monotonic()
+        with (
+            nullcontext()
+            if self.tracer is None
+            else self.tracer.span("push", "report")
+        ):
+            self._push()
+        self.pending = False
+        self._last = monotonic()
+        self.duration += self._last - time0
+
+    def flush(self) -> None:
+        """Forward call to `push` if an update is pending."""
+        if self.pending:
+            self.force()
+
+    def _due(self) -> bool:
+        return (
+            self.interval <= 0
+            or self._last is None
+            or monotonic() - self._last >= self.interval
+        )
+
+    def poll(self) -> None:
+        """
+        Forward call to `push` if an update is pending and the interval
+        has passed.
+        """
+        if self.pending and self._due():
+            self.force()
+
+    def __call__(self) -> None:
+        if self._due():
+            self.force()
+        else:
+            self.pending = True
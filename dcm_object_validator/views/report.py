@@ -0,0 +1,203 @@
+"""
+Report-records View-class definition
+"""
+
+from typing import Optional
+from collections.abc import Iterable, Iterator
+import json
+
+from flask import Blueprint, Response, request
+from data_plumber_http.decorators import flask_handler, flask_args
+from dcm_common import services
+
+from dcm_object_validator.handlers import (
+    get_report_records_handler,
+    get_report_stream_handler,
+)
+from dcm_object_validator.report_store import get_report_store
+from dcm_object_validator.serialization import (
+    iter_json,
+    iter_json_object,
+    iter_bytes,
+)
+
+
+def stream_response(
+    chunks: Iterable[str], mimetype: str = "application/json"
+) -> Response:
+    """
+    Returns a streamed `Response` for the given text `chunks` (status
+    200). The response is gzip-compressed if the client accepts that
+    encoding.
+    """
+    compress = request.accept_encodings["gzip"] > 0
+    response = Response(
+        iter_bytes(chunks, compress), mimetype=mimetype, status=200
+    )
+    if compress:
+        response.headers["Content-Encoding"] = "gzip"
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
+def filter_records(
+    records: Iterable[dict],
+    plugin: Optional[str] = None,
+    success: Optional[bool] = None,
+    valid: Optional[bool] = None,
+    path_prefix: Optional[str] = None,
+) -> Iterator[dict]:
+    """
+    Yields the `records` that match the given filters. Every record is
+    expected as JSON-object with the keys 'plugin' (plugin-id), 'index'
+    (record-index), and 'record' (serialized
+    `ValidationPluginResultPart`).
+
+    Keyword arguments:
+    records -- iterable of records
+    plugin -- only include records of this plugin-id
+              (default None)
+    success -- only include records with this `success`-value
+               (default None)
+    valid -- only include records with this `valid`-value
+             (default None)
+    path_prefix -- only include records with a path starting with this
+                   prefix
+                   (default None)
+    """
+    for item in records:
+        if plugin is not None and item["plugin"] != plugin:
+            continue
+        record = item["record"]
+        if success is not None and record.get("success") != success:
+            continue
+        if valid is not None and record.get("valid") != valid:
+            continue
+        if path_prefix is not None and not record.get("path", "").startswith(
+            path_prefix
+        ):
+            continue
+        yield item
+
+
+def iter_records(report: dict, **filters) -> Iterator[dict]:
+    """
+    Yields the records of the plugin results in the (serialized)
+    `report` that match the given `filters` (see `filter_records`).
+
+    Keyword arguments:
+    report -- serialized `Report`
+    """
+
+    def records():
+        details = (report.get("data") or {}).get("details") or {}
+        for plugin_id, result in details.items():
+            records = (result or {}).get("records") or {}
+            for index in sorted(records, key=int):
+                yield {
+                    "plugin": plugin_id,
+                    "index": int(index),
+                    "record": records[index],
+                }
+
+    return filter_records(records(), **filters)
+
+
+class ReportRecordsView(services.View):
+    """
+    View-class for the streamed as well as the paginated and filtered
+    retrieval of (the records in) job reports.
+    """
+
+    NAME = "report-records"
+
+    def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
+        @bp.route("/report/stream", methods=["GET"])
+        @flask_handler(
+            handler=get_report_stream_handler(),
+            json=flask_args,
+        )
+        def get_stream(token: str):
+            """Get streamed job report."""
+            store = get_report_store(self.config)
+            if store is not None:
+                chunks = store.iter_report(token)
+                if chunks is not None:
+                    return stream_response(chunks)
+            report = self.config.controller.get_report(token)
+            if report is None:
+                return Response(
+                    f"Unknown token '{token}'.",
+                    mimetype="text/plain",
+                    status=404,
+                )
+            # stream down to individual records:
+            # report > data > details > plugin result > records
+            return stream_response(iter_json(report, depth=5))
+
+        @bp.route("/report/records", methods=["GET"])
+        @flask_handler(
+            handler=get_report_records_handler(),
+            json=flask_args,
+        )
+        def get_records(
+            token: str,
+            plugin: Optional[str] = None,
+            success: Optional[str] = None,
+            valid: Optional[str] = None,
+            path_prefix: Optional[str] = None,
+            offset: str = "0",
+            limit: Optional[str] = None,
+            format_: str = "json",
+        ):
+            """Get (filtered) records of a job report."""
+            filters = {
+                "plugin": plugin,
+                "success": None if success is None else success == "true",
+                "valid": None if valid is None else valid == "true",
+                "path_prefix": path_prefix,
+            }
+            store = get_report_store(self.config)
+            stored = None if store is None else store.iter_records(token)
+            if stored is not None:
+                records = filter_records(stored, **filters)
+            else:
+                report = self.config.controller.get_report(token)
+                if report is None:
+                    return Response(
+                        f"Unknown token '{token}'.",
+                        mimetype="text/plain",
+                        status=404,
+                    )
+                records = iter_records(report, **filters)
+            offset = int(offset)
+            limit = None if limit is None else int(limit)
+
+            if format_ == "ndjson":
+
+                def stream():
+                    for i, record in enumerate(records):
+                        if i < offset:
+                            continue
+                        if limit is not None and i >= offset + limit:
+                            break
+                        yield json.dumps(record) + "\n"
+
+                return stream_response(stream(), "application/x-ndjson")
+
+            page = []
+            total = 0
+            for record in records:
+                if total >= offset and (limit is None or len(page) < limit):
+                    page.append(record)
+                total += 1
+            return stream_response(
+                iter_json_object(
+                    {
+                        "offset": offset,
+                        "limit": limit,
+                        "total": total,
+                        "records": page,
+                    }.items()
+                )
+            )
@@ -0,0 +1,55 @@
+"""
+Load-status View-class definition
+"""
+
+from typing import Callable
+
+from flask import Blueprint, jsonify
+from dcm_common import services
+
+from dcm_object_validator.scheduling import get_lanes
+
+
+class LoadStatusView(services.View):
+    """
+    View-class for exposing the current load of the service (queue
+    depth, running jobs, waiting times per scheduling lane, and worker
+    utilization), e.g., as a signal for autoscaling.
+
+    Keyword arguments:
+    config -- `AppConfig`-object
+    ready -- condition for readiness (see `DefaultView`)
+    """
+
+    NAME = "load-status"
+
+    def __init__(self, config, ready: Callable[[], bool]) -> None:
+        super().__init__(config)
+        self.ready = ready
+
+    def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
+        @bp.route("/status/load", methods=["GET"])
+        def get_load_status():
+            """Get load status."""
+            lanes = get_lanes(self.config)
+            load = (
+                {
+                    "queued": None,
+                    "running": None,
+                    "busy_ratio": None,
+                    "lanes": None,
+                }
+                if lanes is None
+                else lanes.load(
+                    self.config.LOAD_STATUS_WORKERS,
+                    self.config.LOAD_STATUS_WINDOW,
+                )
+            )
+            return (
+                jsonify(
+                    ready=self.ready(),
+                    workers=self.config.LOAD_STATUS_WORKERS,
+                    **load,
+                ),
+                200,
+            )
@@ -2,9 +2,19 @@
 Validation View-class definition
 """
 
-from typing import Optional
+from typing import Optional, Callable
 import os
+from time import time, sleep, monotonic
+from math import ceil
+from pathlib import Path
 from uuid import uuid4
+import random
+from contextlib import nullcontext, contextmanager
+from threading import BoundedSemaphore
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
 
 from flask import Blueprint, jsonify, Response, request
 from data_plumber_http.decorators import flask_handler, flask_args, flask_json
@@ -14,20 +24,80 @@ from dcm_common import services
 
 from dcm_object_validator.handlers import get_validate_handler
 from dcm_object_validator.models import Report, ValidationConfig
+from dcm_object_validator.views.push import ThrottledPush
+from dcm_object_validator.views.report import stream_response
+from dcm_object_validator.report_store import get_report_store
+from dcm_object_validator.metrics import REGISTRY
+from dcm_object_validator.profiling import JobProfiler
+from dcm_object_validator.tracing import JobTracer
+from dcm_object_validator.scheduling import (
+    JobCost,
+    AdmissionError,
+    LaneRegistry,
+    estimate_cost,
+    get_lanes,
+    classify,
+)
+from dcm_object_validator.estimation import (
+    ThroughputModel,
+    ProgressTracker,
+    file_size,
+    predict,
+)
+from dcm_object_validator.plugins.runtime import (
+    PluginRuntime,
+    PluginCancelledError,
+    Cancellation,
+    use_runtime,
+)
+from dcm_object_validator.plugins.tools import ToolUsage, merge_tool_usage
 from dcm_object_validator.plugins.validation import ValidationPlugin
+from dcm_object_validator.plugins.validation.interface import (
+    ValidationPluginContext,
+    ValidationPluginResultSummary,
+    ValidationTiming,
+)
+from dcm_object_validator.plugins.validation.checkpoint import Checkpoint
+from dcm_object_validator.plugins.validation.ordering import (
+    stat_records,
+    order_records,
+    balance_shards,
+)
 
 
 class ValidationView(services.OrchestratedView):
     """View-class for object-/ip-validation."""
 
     NAME = "validation"
+    SHARD_NAME = "validation-shard"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # cancellations of the jobs running in this process (by token)
+        self._cancellations: dict[str, Cancellation] = {}
 
     def register_job_types(self):
         self.config.worker_pool.register_job_type(
             self.NAME, self.validate, Report
         )
+        self.config.worker_pool.register_job_type(
+            self.SHARD_NAME, self.validate_shard, Report
+        )
 
     def configure_bp(self, bp: Blueprint, *args, **kwargs) -> None:
+        # synchronous validations are run one at a time; requests that
+        # arrive while the slot is occupied (including validations that
+        # have timed out but not yet stopped) are rejected instead of
+        # piling up in the executor
+        sync_executor = (
+            ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="sync-validation"
+            )
+            if self.config.SYNC_VALIDATION
+            else None
+        )
+        sync_slot = BoundedSemaphore(1)
+
         @bp.route("/validate", methods=["POST"])
         @flask_handler(  # unknown query
             handler=services.no_args_handler,
@@ -44,19 +114,93 @@ class ValidationView(services.OrchestratedView):
             validation: ValidationConfig,
             token: Optional[str] = None,
             callback_url: Optional[str] = None,
+            sync: bool = False,
         ):
             """Submit for validation."""
+            if (
+                sync
+                and sync_executor is not None
+                and self._sync_eligible(validation)
+            ):
+                if not sync_slot.acquire(blocking=False):
+                    return Response(
+                        "Synchronous validation is busy. Retry later or "
+                        + "submit without 'sync'.",
+                        mimetype="text/plain",
+                        status=503,
+                    )
+                report = Report(host=request.host_url, args=request.json)
+                cancellation = Cancellation()
+                future = sync_executor.submit(
+                    self._validate_sync, validation, report, cancellation
+                )
+                future.add_done_callback(lambda _: sync_slot.release())
+                try:
+                    future.result(timeout=self.config.SYNC_VALIDATION_TIMEOUT)
+                except FutureTimeoutError:
+                    future.cancel()
+                    cancellation.cancel()
+                    return Response(
+                        "Synchronous validation exceeded timeout of "
+                        + f"{self.config.SYNC_VALIDATION_TIMEOUT} seconds.",
+                        mimetype="text/plain",
+                        status=503,
+                    )
+                # pylint: disable=broad-exception-caught
+                except Exception as exc_info:
+                    return Response(
+                        f"Synchronous validation failed: {exc_info}",
+                        mimetype="text/plain",
+                        status=500,
+                    )
+                return stream_response(report.iter_json())
+
+            token = token or str(uuid4())
+            request_body = {
+                "validation": validation.json,
+                "callback_url": callback_url,
+                "submitted": time(),
+            }
+            lanes = self._get_lanes()
+            admitted = False
+            if lanes is not None:
+                cost = estimate_cost(
+                    Path(self.config.FS_MOUNT_POINT) / validation.target.path,
+                    self.config.SCHEDULING_STAT_LIMIT,
+                )
+                lane = classify(
+                    cost,
+                    self.config.SCHEDULING_EXPRESS_MAX_FILES,
+                    self.config.SCHEDULING_EXPRESS_MAX_SIZE,
+                )
+                try:
+                    admitted = lanes.admit(
+                        token, lane, cost, self._is_stale
+                    )
+                except AdmissionError as exc_info:
+                    return Response(
+                        f"Submission rejected: {exc_info} Retry later.",
+                        mimetype="text/plain",
+                        status=exc_info.status,
+                        headers={
+                            "Retry-After": str(
+                                self.config.SCHEDULING_RETRY_AFTER
+                                if exc_info.retry_after is None
+                                else max(1, ceil(exc_info.retry_after))
+                            )
+                        },
+                    )
+                request_body["cost"] = cost.json
+                request_body["lane"] = lane
+
             try:
                 token = self.config.controller.queue_push(
-                    token or str(uuid4()),
+                    token,
                     JobInfo(
                         JobConfig(
                             self.NAME,
                             original_body=request.json,
-                            request_body={
-                                "validation": validation.json,
-                                "callback_url": callback_url,
-                            },
+                            request_body=request_body,
                         ),
                         report=Report(
                             host=request.host_url, args=request.json
@@ -65,6 +209,10 @@ class ValidationView(services.OrchestratedView):
                 )
             # pylint: disable=broad-exception-caught
             except Exception as exc_info:
+                # only release entries that have been created by this
+                # request (the job may have been submitted before)
+                if admitted:
+                    lanes.release(token)
                 return Response(
                     f"Submission rejected: {exc_info}",
                     mimetype="text/plain",
@@ -73,104 +221,894 @@ class ValidationView(services.OrchestratedView):
 
             return jsonify(token.json), 201
 
+        @bp.route("/validate/estimate", methods=["POST"])
+        @flask_handler(  # unknown query
+            handler=services.no_args_handler,
+            json=flask_args,
+        )
+        @flask_handler(  # process validation
+            handler=get_validate_handler(
+                cwd=self.config.FS_MOUNT_POINT,
+                acceptable_plugins=self.config.validation_plugins,
+            ),
+            json=flask_json,
+        )
+        def estimate(
+            validation: ValidationConfig,
+            # pylint: disable=unused-argument
+            token: Optional[str] = None,
+            callback_url: Optional[str] = None,
+            sync: bool = False,
+        ):
+            """Estimate cost and duration of a validation (dry-run)."""
+            return jsonify(self._estimate(validation)), 200
+
+        @bp.before_request
+        def cancel_aborted_job():
+            """
+            Requests cancellation of a job that is aborted via
+            `DELETE-/validate` if it runs in this process (before the
+            abort is processed as usual).
+            """
+            if request.method != "DELETE":
+                return
+            cancellation = self._cancellations.get(request.args.get("token"))
+            if cancellation is not None:
+                cancellation.cancel()
+
         self._register_abort_job(bp, "/validate")
 
+    def _sync_eligible(self, validation: ValidationConfig) -> bool:
+        """
+        Returns `True` if `validation` qualifies for the synchronous
+        mode, i.e., its target is a file that does not exceed
+        `SYNC_VALIDATION_MAX_SIZE`.
+        """
+        target = Path(self.config.FS_MOUNT_POINT) / validation.target.path
+        return (
+            target.is_file()
+            and target.stat().st_size <= self.config.SYNC_VALIDATION_MAX_SIZE
+        )
+
+    def _validate_sync(
+        self,
+        validation_config: ValidationConfig,
+        report: Report,
+        cancellation: Optional[Cancellation] = None,
+    ) -> None:
+        """
+        Runs `validation_config` in the current thread and writes the
+        results into `report` (without orchestration or callback).
+
+        Like orchestrated jobs, this sets the process' working directory
+        to `FS_MOUNT_POINT` (and leaves it there; restoring a different
+        directory would interfere with jobs running in the same
+        process).
+        """
+        os.chdir(self.config.FS_MOUNT_POINT)
+        self._validate(
+            validation_config,
+            report,
+            lambda: None,
+            cancellation=cancellation,
+        )
+        report.progress.complete()
+
+    def _get_lanes(self) -> Optional[LaneRegistry]:
+        """
+        Returns `LaneRegistry` (or `None` if job-size-aware scheduling is
+        disabled).
+        """
+        return get_lanes(self.config)
+
+    def _is_stale(self, token: str) -> bool:
+        """
+        Returns `True` if the job `token` is unknown or not active
+        anymore.
+        """
+        report = self.config.controller.get_report(token)
+        if report is None:
+            return True
+        return report.get("progress", {}).get("status") in (
+            "completed",
+            "aborted",
+        )
+
+    def _get_throughput_model(self) -> Optional[ThroughputModel]:
+        """
+        Returns `ThroughputModel` (or `None` if estimation is
+        disabled).
+        """
+        if self.config.ESTIMATION_FILE is None:
+            return None
+        return ThroughputModel(
+            self.config.ESTIMATION_FILE, self.config.ESTIMATION_DECAY
+        )
+
+    def _estimate(self, validation: ValidationConfig) -> dict:
+        """
+        Returns the number of records, their total size, and the
+        predicted duration for the plugins requested in `validation`
+        (without running them).
+
+        Since this runs in the request thread, the contents of a target
+        are only collected if a quick `stat` finds at most
+        `SCHEDULING_STAT_LIMIT` directory entries; otherwise, the
+        (incomplete) result of that `stat` is returned as lower bound.
+        """
+        target = Path(self.config.FS_MOUNT_POINT) / validation.target.path
+        model = self._get_throughput_model()
+        coefficients = (
+            {}
+            if model is None
+            else model.coefficients(
+                self.config.validation_plugins[c.plugin].name
+                for c in validation.plugins.values()
+            )
+        )
+        # bounded stat per path (shared between plugins)
+        costs: dict[Path, JobCost] = {}
+
+        def bounded_cost(path: Path) -> JobCost:
+            if path not in costs:
+                costs[path] = estimate_cost(
+                    path, self.config.SCHEDULING_STAT_LIMIT
+                )
+            return costs[path]
+
+        plugins = {}
+        for id_, plugin_config in validation.plugins.items():
+            plugin = self.config.validation_plugins[plugin_config.plugin]
+            cost = None
+            if isinstance(plugin, ValidationPlugin):
+                # jobs run with FS_MOUNT_POINT as working directory;
+                # resolve a path given in the plugin-args accordingly
+                args = {"path": str(target)} | plugin_config.args
+                args["path"] = str(
+                    Path(self.config.FS_MOUNT_POINT) / args["path"]
+                )
+                cost = bounded_cost(Path(args["path"]))
+                if cost.complete:
+                    collected = plugin.collect(
+                        plugin.create_context(lambda msg: None, lambda: None),
+                        **args,
+                    )
+                    cost = (
+                        None
+                        if collected is None
+                        else JobCost(
+                            len(collected[0]),
+                            sum(map(file_size, collected[0])),
+                        )
+                    )
+            else:
+                cost = bounded_cost(target)
+            plugins[id_] = {
+                "plugin": plugin.name,
+                "records": None if cost is None else cost.files,
+                "size": None if cost is None else cost.size,
+                "complete": None if cost is None else cost.complete,
+                "duration": (
+                    None
+                    if cost is None
+                    else predict(coefficients, plugin.name, cost)
+                ),
+            }
+        durations = [p["duration"] for p in plugins.values()]
+        return {
+            "plugins": plugins,
+            "records": sum(p["records"] or 0 for p in plugins.values()),
+            "size": sum(p["size"] or 0 for p in plugins.values()),
+            "duration": None if None in durations else sum(durations),
+            "complete": all(p["complete"] for p in plugins.values()),
+        }
+
+    def _get_checkpoint(self, info: JobInfo) -> Optional[Checkpoint]:
+        """
+        Returns `Checkpoint` for the job associated with `info` (or
+        `None` if checkpoints are disabled).
+        """
+        if self.config.CHECKPOINT_DIR is None:
+            return None
+        return Checkpoint(
+            self.config.CHECKPOINT_DIR / f"{info.token.value}.sqlite"
+        )
+
+    def _get_deadline(self) -> Optional[float]:
+        """
+        Returns deadline (see `time.monotonic`) for a job that starts
+        now based on `JOB_TIMEOUT` (or `None` if not limited).
+        """
+        if self.config.JOB_TIMEOUT is None:
+            return None
+        return monotonic() + self.config.JOB_TIMEOUT
+
+    def _get_runtime(self, **kwargs) -> PluginRuntime:
+        """
+        Returns `PluginRuntime` with the configured resource limits.
+        `kwargs` are passed into the constructor.
+        """
+        return PluginRuntime(
+            record_timeout=self.config.RECORD_TIMEOUT,
+            memory_limit=self.config.TOOL_MEMORY_LIMIT,
+            compact_records=self.config.COMPACT_RECORDS,
+            slowest_records=self.config.TIMING_SLOWEST_RECORDS,
+            record_order=self.config.RECORD_ORDER,
+            **kwargs,
+        )
+
+    def _get_profiler(self, info: JobInfo) -> Optional[JobProfiler]:
+        """
+        Returns `JobProfiler` for the job associated with `info` (or
+        `None` if profiling is disabled).
+        """
+        if self.config.PROFILING_DIR is None:
+            return None
+        return JobProfiler(
+            self.config.PROFILING_DIR,
+            info.token.value,
+            memory=self.config.PROFILING_MEMORY,
+            records=self.config.PROFILING_RECORDS,
+            retention=self.config.PROFILING_RETENTION,
+        )
+
+    def _get_tracer(self, info: JobInfo, name: str) -> Optional[JobTracer]:
+        """
+        Returns `JobTracer` for the job associated with `info` (or
+        `None` if tracing is disabled or the job has not been sampled).
+        """
+        if self.config.TRACING_DIR is None or (
+            random.random() >= self.config.TRACING_SAMPLE_RATE
+        ):
+            return None
+        return JobTracer(
+            self.config.TRACING_DIR / f"{info.token.value}.trace.json",
+            name,
+            {"token": info.token.value},
+            record_sample_rate=self.config.TRACING_RECORD_SAMPLE_RATE,
+            retention=self.config.TRACING_RETENTION,
+        )
+
+    def _configure_metrics(self) -> None:
+        """Enables metrics-collection in the current process."""
+        if self.config.METRICS:
+            REGISTRY.configure(self.config.METRICS_DIR)
+
     def validate(self, context: JobContext, info: JobInfo):
         """Job instructions for the '/validate' endpoint."""
+        self._configure_metrics()
+        time0 = time()
+        if "submitted" in info.config.request_body:
+            REGISTRY.observe(
+                "validator_queue_wait_seconds",
+                time0 - info.config.request_body["submitted"],
+            )
         os.chdir(self.config.FS_MOUNT_POINT)
-        validation_config = ValidationConfig.from_json(
-            info.config.request_body["validation"]
+        lanes = (
+            self._get_lanes() if "lane" in info.config.request_body else None
         )
-        info.report.log.set_default_origin("Object Validator")
+        if lanes is not None:
+            lanes.start(info.token.value)
+        checkpoint = self._get_checkpoint(info)
+        profiler = self._get_profiler(info)
+        tracer = self._get_tracer(info, "job")
+        cancellation = Cancellation()
+        try:
+            with profiler or nullcontext(), tracer or nullcontext(), (
+                self._cancel_on_abort(info.token.value, cancellation)
+            ):
+                self._validate(
+                    ValidationConfig.from_json(
+                        info.config.request_body["validation"]
+                    ),
+                    info.report,
+                    context.push,
+                    checkpoint,
+                    cancellation=cancellation,
+                    profiler=profiler,
+                    tracer=tracer,
+                    cost=(
+                        JobCost.from_json(info.config.request_body["cost"])
+                        if "cost" in info.config.request_body
+                        else None
+                    ),
+                )
+        finally:
+            if lanes is not None:
+                lanes.release(info.token.value)
+        if checkpoint is not None:
+            checkpoint.delete()
+        REGISTRY.observe("validator_job_duration_seconds", time() - time0)
+        REGISTRY.inc(
+            "validator_jobs_total",
+            labels={
+                "result": (
+                    "failed"
+                    if not info.report.data.success
+                    else ("valid" if info.report.data.valid else "invalid")
+                )
+            },
+        )
+        REGISTRY.write()
+
+        # make callback; rely on _run_callback to push progress-update
+        info.report.progress.complete()
+        self._store_report(info)
+        self._run_callback(
+            context, info, info.config.request_body.get("callback_url")
+        )
+
+    def _store_report(self, info: JobInfo) -> None:
+        """
+        Writes the report of the job associated with `info` into the
+        report store (if enabled). Errors are logged into the report
+        but do not fail the job (the report remains available via the
+        orchestra-controller).
+        """
+        store = get_report_store(self.config)
+        if store is None:
+            return
+        try:
+            store.write(info.token.value, info.report)
+        except OSError as exc_info:
+            info.report.log.log(
+                Context.WARNING,
+                body=f"Unable to write report into report store: {exc_info}",
+            )
+
+    @contextmanager
+    def _cancel_on_abort(self, token: str, cancellation: Cancellation):
+        """
+        Context manager that registers `cancellation` for the job
+        `token` while its body is executed. The cancellation is
+        requested
+        * by `DELETE-/validate` for this token (if the job runs in the
+          same process) or
+        * if the body is left with an exception (aborts are delivered
+          to a job as exception raised in the job's thread).
+        Work that checks the cancellation cooperatively then stops
+        (e.g., records are not processed further and the shard jobs
+        of a sharded validation are aborted).
+        """
+        self._cancellations[token] = cancellation
+        try:
+            yield
+        except BaseException:
+            cancellation.cancel()
+            raise
+        finally:
+            self._cancellations.pop(token, None)
+
+    def _validate(
+        self,
+        validation_config: ValidationConfig,
+        report: Report,
+        push: Callable[[], None],
+        checkpoint: Optional[Checkpoint] = None,
+        cancellation: Optional[Cancellation] = None,
+        profiler: Optional[JobProfiler] = None,
+        tracer: Optional[JobTracer] = None,
+        cost: Optional[JobCost] = None,
+    ) -> None:
+        """
+        Runs the plugins requested in `validation_config` and writes
+        the results into `report`.
+
+        Keyword arguments:
+        validation_config -- validation request
+        report -- report to be written to
+        push -- callback for pushing progress-updates of `report`
+        checkpoint -- store for completed records of this job
+                      (default None)
+        cancellation -- flag for cancelling this job
+                        (default None)
+        profiler -- profiler of this job (used for profiling individual
+                    records)
+                    (default None)
+        tracer -- tracer of this job
+                  (default None)
+        cost -- estimated cost of the target (used for the estimated
+                time of completion in `report.progress`)
+                (default None; estimated if required)
+        """
+        report.log.set_default_origin("Object Validator")
+        time0 = monotonic()
+        model = self._get_throughput_model()
+        plugin_names = [
+            self.config.validation_plugins[c.plugin].name
+            for c in validation_config.plugins.values()
+        ]
+        if cost is None and model is not None:
+            cost = estimate_cost(
+                Path(validation_config.target.path),
+                self.config.SCHEDULING_STAT_LIMIT,
+            )
+        progress = ProgressTracker(
+            report.progress,
+            plugin_names,
+            cost or JobCost(),
+            None if model is None else model.coefficients(plugin_names),
+        )
+        deadline = self._get_deadline()
+        # plugins push updates for every record; these are coalesced
+        push = ThrottledPush(
+            push, self.config.REPORT_PUSH_INTERVAL, tracer=tracer
+        )
+        timing = (
+            ValidationTiming() if validation_config.report.timing else None
+        )
+        tools = {}
 
         # set progress info
-        info.report.progress.verbose = (
+        report.progress.verbose = (
             f"preparing validation of '{validation_config.target.path}'"
         )
-        context.push()
+        push.force()
 
         # iterate requested plugins
         for id_, plugin_config in validation_config.plugins.items():
+            if cancellation is not None and cancellation.cancelled:
+                raise PluginCancelledError(
+                    "Validation has been cancelled before calling plugin "
+                    + f"'{plugin_config.plugin}'."
+                )
             # collect plugin-info
             plugin: ValidationPlugin = self.config.validation_plugins[
                 plugin_config.plugin
             ]
-            info.report.progress.verbose = (
-                f"calling plugin '{plugin.display_name}'"
-            )
-            info.report.log.log(
+            report.progress.verbose = f"calling plugin '{plugin.display_name}'"
+            report.log.log(
                 Context.INFO, body=f"Calling plugin '{plugin.display_name}'"
             )
-            context.push()
+            push.force()
 
             # configure execution context for plugin
             plugin_context = plugin.create_context(
-                info.report.progress.create_verbose_update_callback(
+                report.progress.create_verbose_update_callback(
                     plugin.display_name
                 ),
-                context.push,
+                push,
             )
-            info.report.data.details[id_] = plugin_context.result
+            report.data.details[id_] = plugin_context.result
 
             # run plugin logic
-            plugin.get(
-                plugin_context,
-                **(
-                    {"path": str(validation_config.target.path)}
-                    | plugin_config.args
-                ),
-            )
-            info.report.log.merge(
-                plugin_context.result.log.pick(Context.ERROR)
+            args = {
+                "path": str(validation_config.target.path)
+            } | plugin_config.args
+            sharded = (
+                self.config.SHARDING
+                and isinstance(plugin, ValidationPlugin)
+                and args.get("batch", True)
             )
+            progress.start(plugin.name)
+            with use_runtime(
+                self._get_runtime(
+                    checkpoint=(
+                        None if checkpoint is None else checkpoint.bind(id_)
+                    ),
+                    cancellation=cancellation,
+                    deadline=deadline,
+                    verbosity=validation_config.report.verbosity,
+                    timing=(
+                        ValidationTiming()
+                        if timing is not None
+                        and isinstance(plugin, ValidationPlugin)
+                        else None
+                    ),
+                    tool_usage=(
+                        {} if isinstance(plugin, ValidationPlugin) else None
+                    ),
+                    profiler=profiler,
+                    tracer=tracer,
+                    progress=progress,
+                    heartbeat=push.poll,
+                )
+            ) as runtime, runtime.traced(
+                f"plugin:{id_}", "plugin", plugin=plugin.name
+            ):
+                plugin_time0 = monotonic()
+                if sharded:
+                    self._run_sharded(
+                        plugin, plugin_context, args, report, runtime
+                    )
+                else:
+                    plugin.get(plugin_context, **args)
+                if runtime.checkpoint is not None:
+                    runtime.checkpoint.close()
+                duration = monotonic() - plugin_time0
+                REGISTRY.observe(
+                    "validator_plugin_duration_seconds",
+                    duration,
+                    labels={"plugin": plugin.name},
+                )
+            processed = progress.finish()
+            if (
+                model is not None
+                and plugin_context.result.success
+                and not sharded
+                and not runtime.cancelled
+                and processed is not None
+                and processed.files > 0
+            ):
+                model.observe(
+                    plugin.name, processed.files, processed.size, duration
+                )
+            if runtime.tool_usage:
+                plugin_context.result.tools = runtime.tool_usage
+                merge_tool_usage(tools, runtime.tool_usage)
+            if timing is not None:
+                timing.add(f"plugin:{id_}", duration)
+                if runtime.timing is not None:
+                    plugin_context.result.timing = runtime.timing
+                    timing.merge(
+                        runtime.timing, runtime.slowest_records, plugin=id_
+                    )
+            report.log.merge(plugin_context.result.log.pick(Context.ERROR))
             if not plugin_context.result.success:
-                info.report.log.log(
+                report.log.log(
                     Context.ERROR,
                     body=f"Call to plugin '{plugin.display_name}' failed.",
                 )
-            context.push()
+            push.force()
 
         # eval and log
-        info.report.data.success = all(
-            p.success for p in info.report.data.details.values()
+        if timing is not None:
+            timing.add("push", push.duration)
+            timing.add("total", monotonic() - time0)
+            report.data.timing = timing
+        if tools:
+            report.data.tools = tools
+        report.data.success = all(
+            p.success for p in report.data.details.values()
         )
-        if info.report.data.success:
-            info.report.data.valid = all(
-                p.valid for p in info.report.data.details.values()
+        if report.data.success:
+            report.data.valid = all(
+                p.valid for p in report.data.details.values()
             )
-            if info.report.data.valid:
-                info.report.log.log(
+            if report.data.valid:
+                report.log.log(
                     Context.INFO,
                     body="Target is valid.",
                 )
             else:
-                info.report.log.log(
+                report.log.log(
                     Context.ERROR,
                     # pylint: disable=consider-using-f-string
                     body="Target is invalid (got {} error(s)).".format(
                         sum(
                             not p.valid
-                            for p in info.report.data.details.values()
+                            for p in report.data.details.values()
                         )
                     ),
                 )
         else:
-            info.report.log.log(
+            report.log.log(
                 Context.ERROR,
                 # pylint: disable=consider-using-f-string
                 body=(
                     "Validation incomplete ({} plugin(s) gave bad response).".format(
                         sum(
                             not p.success
-                            for p in info.report.data.details.values()
+                            for p in report.data.details.values()
                         )
                     )
                 ),
             )
+        push.force()
+
+    def _run_sharded(
+        self,
+        plugin: ValidationPlugin,
+        context: ValidationPluginContext,
+        args: dict,
+        report: Report,
+        runtime: PluginRuntime,
+    ) -> None:
+        """
+        Runs `plugin` with its records split into shards of size
+        `SHARDING_SHARD_SIZE`. The first shard is processed locally
+        while the remaining shards are submitted as separate jobs.
+        Shards that have not been picked up by a worker within
+        `SHARDING_TIMEOUT` seconds after the local shard has been
+        completed, that are still running when the job's time budget
+        (`JOB_TIMEOUT`) is exhausted, or that did not complete are
+        aborted and processed locally. If this job fails, is cancelled,
+        or is aborted, all outstanding shard jobs are aborted.
+        Shard jobs receive their records and the request arguments
+        before hydration (see `ValidationPlugin.prepare`).
+
+        If the runtime defines a `record_order` other than 'discovery',
+        records are distributed over the same number of shards (of at
+        most `SHARDING_SHARD_SIZE` records each) such that the total
+        file sizes of the shards are balanced (and are processed in that
+        order within each shard).
+        """
+        with runtime.timed("collect"):
+            collected = plugin.collect(context, **args)
+        if collected is None:
+            return
+        records, kwargs = collected
+        size = self.config.SHARDING_SHARD_SIZE
+        if runtime.record_order == "discovery":
+            shards = {
+                offset: list(range(offset, min(offset + size, len(records))))
+                for offset in range(0, len(records), size)
+            }
+        else:
+            with runtime.timed("order"):
+                stats = stat_records(records)
+                shards = {
+                    n * size: [
+                        shard[p]
+                        for p in order_records(
+                            [stats[i] for i in shard], runtime.record_order
+                        )
+                    ]
+                    for n, shard in enumerate(
+                        balance_shards(
+                            [0 if s is None else s.st_size for s in stats],
+                            -(-len(records) // size),
+                            size,
+                        )
+                    )
+                }
+
+        # submit shards
+        tokens = {}
+        pending = shards.copy()
+        try:
+            for offset, shard in list(shards.items())[1:]:
+                request_body = {
+                    "plugin": plugin.name,
+                    # the hydrated arguments may be large (e.g., a bag's
+                    # manifest); shards repeat the preparation instead
+                    "args": args,
+                    "records": [str(records[i]) for i in shard],
+                    "offset": offset,
+                    "indices": shard,
+                    "verbosity": runtime.verbosity,
+                    "timing": runtime.timing is not None,
+                }
+                tokens[offset] = self.config.controller.queue_push(
+                    str(uuid4()),
+                    JobInfo(
+                        JobConfig(
+                            self.SHARD_NAME,
+                            original_body=request_body,
+                            request_body=request_body,
+                        ),
+                        report=Report(
+                            host=report.host,
+                            args={"plugin": plugin.name, "offset": offset},
+                        ),
+                    ),
+                ).value
+            if tokens:
+                context.result.log.log(
+                    Context.INFO,
+                    body=(
+                        f"Submitted {len(tokens)} shard(s) of up to "
+                        + f"{max(map(len, shards.values()))} record(s) as "
+                        + "separate jobs."
+                    ),
+                )
+
+            # process first shard locally
+            if pending:
+                offset, shard = next(iter(pending.items()))
+                with runtime.timed("process"):
+                    plugin.process(
+                        context,
+                        [records[i] for i in shard],
+                        indices=shard,
+                        **kwargs,
+                    )
+                del pending[offset]
+
+            # collect remaining shards
+            time0 = time()
+            monotonic0 = monotonic()
+            while pending:
+                if runtime.cancelled:
+                    raise PluginCancelledError(
+                        f"Plugin '{plugin.name}' has been cancelled while "
+                        + f"waiting for {len(pending)} shard(s)."
+                    )
+                for offset, shard in list(pending.items()):
+                    shard_report = (
+                        self.config.controller.get_report(tokens[offset])
+                        or {}
+                    )
+                    status = shard_report.get("progress", {}).get("status")
+                    if status == "completed" and not self._shard_prepared(
+                        shard_report
+                    ):
+                        # shard has rejected its arguments; retry locally
+                        status = "rejected"
+                    if status == "completed":
+                        self._merge_shard(
+                            plugin, context, shard_report, runtime
+                        )
+                    elif (
+                        status in ("queued", None)
+                        and time() - time0 < self.config.SHARDING_TIMEOUT
+                    ) or (
+                        status == "running"
+                        and (
+                            runtime.deadline is None
+                            or monotonic() < runtime.deadline
+                        )
+                    ):
+                        continue
+                    else:
+                        if status in ("queued", "running", None):
+                            self._abort_shard(
+                                tokens[offset], "Shard is processed locally."
+                            )
+                        context.result.log.log(
+                            Context.WARNING,
+                            body=(
+                                f"Processing shard at offset {offset} "
+                                + f"locally (job '{tokens[offset]}' has "
+                                + f"status '{status}')."
+                            ),
+                        )
+                        with runtime.timed("process"):
+                            plugin.process(
+                                context,
+                                [records[i] for i in shard],
+                                indices=shard,
+                                **kwargs,
+                            )
+                    del pending[offset]
+                if pending:
+                    context.set_progress(
+                        f"waiting for {len(pending)} shard(s)"
+                    )
+                    context.push()
+                    sleep(self.config.SHARDING_POLL_INTERVAL)
+        finally:
+            # do not leave shards behind if this job fails or is aborted
+            for offset in pending:
+                if offset in tokens:
+                    self._abort_shard(
+                        tokens[offset], "Parent job did not complete."
+                    )
+
+        if context.result.records is None:
+            context.result.records = {}
+        if isinstance(context.result.records, dict):
+            context.result.records = dict(
+                sorted(context.result.records.items())
+            )
+        if runtime.timing is not None:
+            runtime.timing.add("shards", monotonic() - monotonic0)
+        with runtime.timed("evaluate"):
+            plugin.evaluate(context)
+
+    def _abort_shard(self, token: str, reason: str) -> None:
+        """
+        Aborts the shard job `token` (like `DELETE-/validate`). Errors
+        are ignored since the shard may have finished in the meantime.
+        """
+        try:
+            self.config.controller.abort(
+                token, reason=reason, origin="Object Validator"
+            )
+        # pylint: disable=broad-exception-caught
+        except Exception:
+            pass
+
+    @staticmethod
+    def _shard_prepared(shard_report: dict) -> bool:
+        """
+        Returns `True` if the shard associated with `shard_report` has
+        accepted its arguments (see `ValidationPlugin.prepare`).
+        """
+        shard_result = (
+            (shard_report.get("data") or {}).get("details") or {}
+        ).get("shard") or {}
+        return shard_result.get("records") is not None
+
+    @staticmethod
+    def _merge_shard(
+        plugin: ValidationPlugin,
+        context: ValidationPluginContext,
+        shard_report: dict,
+        runtime: PluginRuntime,
+    ) -> None:
+        """
+        Merges records (as well as summary and timing) of a shard's
+        report into `context.result`.
+        """
+        if context.result.records is None:
+            context.result.records = {}
+        shard_result = shard_report["data"]["details"]["shard"]
+        for index, part_json in (shard_result.get("records") or {}).items():
+            part = plugin.load_part(part_json)
+            context.result.records[int(index)] = part
+            if runtime.verbosity == "full":
+                context.result.log.merge(part.log.pick(Context.ERROR))
+        if "summary" in shard_result:
+            if context.result.summary is None:
+                context.result.summary = ValidationPluginResultSummary()
+            context.result.summary.merge(
+                ValidationPluginResultSummary.from_json(
+                    shard_result["summary"]
+                )
+            )
+        if "tools" in shard_result and runtime.tool_usage is not None:
+            merge_tool_usage(
+                runtime.tool_usage,
+                {
+                    k: ToolUsage.from_json(v)
+                    for k, v in shard_result["tools"].items()
+                },
+            )
+        if "timing" in shard_result and runtime.timing is not None:
+            runtime.timing.merge(
+                ValidationTiming.from_json(shard_result["timing"]),
+                runtime.slowest_records,
+            )
         context.push()
 
-        # make callback; rely on _run_callback to push progress-update
-        info.report.progress.complete()
-        self._run_callback(
-            context, info, info.config.request_body.get("callback_url")
+    def validate_shard(self, context: JobContext, info: JobInfo):
+        """Job instructions for shards of a sharded validation."""
+        self._configure_metrics()
+        os.chdir(self.config.FS_MOUNT_POINT)
+        body = info.config.request_body
+        plugin: ValidationPlugin = self.config.validation_plugins[
+            body["plugin"]
+        ]
+        info.report.log.set_default_origin("Object Validator")
+
+        checkpoint = self._get_checkpoint(info)
+        profiler = self._get_profiler(info)
+        tracer = self._get_tracer(info, "shard")
+        push = ThrottledPush(
+            context.push, self.config.REPORT_PUSH_INTERVAL, tracer=tracer
+        )
+        plugin_context = plugin.create_context(
+            info.report.progress.create_verbose_update_callback(
+                plugin.display_name
+            ),
+            push,
         )
+        info.report.data.details["shard"] = plugin_context.result
+        kwargs = plugin.prepare(plugin_context, **body["args"])
+        if kwargs is None:
+            info.report.progress.complete()
+            context.push()
+            return
+        cancellation = Cancellation()
+        with profiler or nullcontext(), tracer or nullcontext(), (
+            self._cancel_on_abort(info.token.value, cancellation)
+        ), use_runtime(
+            self._get_runtime(
+                checkpoint=checkpoint,
+                cancellation=cancellation,
+                deadline=self._get_deadline(),
+                verbosity=body.get("verbosity", "full"),
+                timing=ValidationTiming() if body.get("timing") else None,
+                tool_usage={},
+                profiler=profiler,
+                tracer=tracer,
+                heartbeat=push.poll,
+            )
+        ) as runtime:
+            with runtime.timed("shard"):
+                plugin.process(
+                    plugin_context,
+                    list(map(Path, body["records"])),
+                    offset=body["offset"],
+                    indices=body.get("indices"),
+                    **kwargs,
+                )
+            if runtime.tool_usage:
+                plugin_context.result.tools = runtime.tool_usage
+        if checkpoint is not None:
+            checkpoint.delete()
+
+        info.report.progress.complete()
+        context.push()
+        REGISTRY.write()
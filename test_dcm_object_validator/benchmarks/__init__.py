@@ -0,0 +1,6 @@
+"""
+Benchmarks for the 'Object Validator'-app.
+
+The benchmarks are not part of the regular test-suite; they are run
+explicitly as modules (see README).
+"""
@@ -0,0 +1,143 @@
+"""Generator for synthetic BagIt-bags."""
+
+from typing import Optional
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+import hashlib
+import math
+import random
+
+
+DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+
+@dataclass
+class BagSpec:
+    """
+    Specification of a synthetic bag.
+
+    Keyword arguments:
+    files -- number of payload files
+             (default 100)
+    size -- (mean) size of payload files in bytes
+            (default 65536)
+    distribution -- size distribution of payload files; one of
+                    * 'fixed': all files have `size` bytes,
+                    * 'uniform': sizes are uniformly distributed in
+                      [0, 2 * `size`], and
+                    * 'lognormal': sizes follow a log-normal
+                      distribution with mean `size` (few large files,
+                      many small files)
+                    (default 'fixed')
+    algorithms -- manifest algorithms (one manifest and tag-manifest
+                  per algorithm)
+                  (default ['sha256'])
+    files_per_directory -- maximum number of payload files per
+                           directory
+                           (default 1000)
+    seed -- seed for the random generator (identical specs yield
+            identical bags)
+            (default 0)
+    """
+
+    files: int = 100
+    size: int = 65536
+    distribution: str = "fixed"
+    algorithms: list[str] = field(default_factory=lambda: ["sha256"])
+    files_per_directory: int = 1000
+    seed: int = 0
+
+    def sizes(self, rng: random.Random) -> Iterable[int]:
+        """Yields file sizes according to `distribution`."""
+        for _ in range(self.files):
+            match self.distribution:
+                case "fixed":
+                    yield self.size
+                case "uniform":
+                    yield rng.randint(0, 2 * self.size)
+                case "lognormal":
+                    # mean of lognormvariate is exp(mu + sigma**2 / 2)
+                    sigma = 1.0
+                    yield int(
+                        rng.lognormvariate(0, sigma)
+                        * self.size
+                        / math.exp(sigma**2 / 2)
+                    )
+                case _:
+                    raise ValueError(
+                        f"Unknown distribution '{self.distribution}', "
+                        + f"expected one of {DISTRIBUTIONS}."
+                    )
+
+
+@dataclass
+class Bag:
+    """
+    Generated bag.
+
+    Keyword arguments:
+    path -- path to the bag
+    files -- number of payload files
+    bytes_ -- total size of the payload in bytes
+    manifest -- checksums of payload files by path relative to the bag
+                (for the first of the requested algorithms)
+    """
+
+    path: Path
+    files: int
+    bytes_: int
+    manifest: dict[str, str]
+
+
+def _write_manifest(file: Path, checksums: dict[str, str]) -> None:
+    file.write_text(
+        "".join(f"{c} {p}\n" for p, c in checksums.items()),
+        encoding="utf-8",
+    )
+
+
+def generate_bag(path: Path, spec: Optional[BagSpec] = None) -> Bag:
+    """
+    Generates a BagIt-bag according to `spec` at `path` and returns the
+    `Bag`. The payload consists of random data.
+    """
+    spec = spec or BagSpec()
+    rng = random.Random(spec.seed)
+    payload = {algorithm: {} for algorithm in spec.algorithms}
+    total = 0
+    for i, size in enumerate(spec.sizes(rng)):
+        relative = (
+            f"data/{i // spec.files_per_directory:04d}/file_{i:08d}.bin"
+        )
+        file = path / relative
+        file.parent.mkdir(parents=True, exist_ok=True)
+        content = rng.randbytes(size)
+        file.write_bytes(content)
+        total += size
+        for algorithm, checksums in payload.items():
+            checksums[relative] = hashlib.new(algorithm, content).hexdigest()
+
+    (path / "bagit.txt").write_text(
+        "BagIt-Version: 1.0\nTag-File-Character-Encoding: UTF-8\n",
+        encoding="utf-8",
+    )
+    (path / "bag-info.txt").write_text(
+        "Bag-Software-Agent: dcm-object-validator benchmarks\n"
+        + f"Payload-Oxum: {total}.{spec.files}\n",
+        encoding="utf-8",
+    )
+    for algorithm, checksums in payload.items():
+        _write_manifest(path / f"manifest-{algorithm}.txt", checksums)
+    for algorithm in spec.algorithms:
+        _write_manifest(
+            path / f"tagmanifest-{algorithm}.txt",
+            {
+                name: hashlib.new(
+                    algorithm, (path / name).read_bytes()
+                ).hexdigest()
+                for name in ["bagit.txt", "bag-info.txt"]
+                + [f"manifest-{a}.txt" for a in spec.algorithms]
+            },
+        )
+    return Bag(path, spec.files, total, payload[spec.algorithms[0]])
@@ -0,0 +1,85 @@
+"""Shared helpers of the benchmarks."""
+
+from typing import Optional, Any
+from collections.abc import Callable
+from pathlib import Path
+from datetime import datetime
+from time import perf_counter
+from statistics import median
+import json
+import os
+import platform
+import subprocess
+import sys
+
+
+def environment() -> dict[str, Any]:
+    """
+    Returns information on the environment in which the benchmarks are
+    run (for comparing results over time).
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().astimezone().isoformat(),
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def measure(
+    target: Callable[[], Any],
+    runs: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+) -> tuple[list[float], Any]:
+    """
+    Runs `target` `runs` times and returns the list of durations (in
+    seconds) and the return value of the last run. If given, `setup`
+    is run before every run (not included in the durations).
+    """
+    durations = []
+    value = None
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        time0 = perf_counter()
+        value = target()
+        durations.append(perf_counter() - time0)
+    return durations, value
+
+
+def rates(
+    durations: list[float], files: int, bytes_: int
+) -> dict[str, float]:
+    """
+    Returns summary of `durations` with throughput (based on the
+    median).
+    """
+    duration = median(durations)
+    return {
+        "runs": durations,
+        "duration": duration,
+        "files_per_second": files / duration if duration else None,
+        "mb_per_second": bytes_ / 1e6 / duration if duration else None,
+    }
+
+
+def write_results(results: dict[str, Any], output: Optional[Path]) -> None:
+    """
+    Writes `results` as JSON to `output` (or stdout if `None`).
+    """
+    text = json.dumps(results, indent=2) + "\n"
+    if output is None:
+        sys.stdout.write(text)
+        return
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(text, encoding="utf-8")
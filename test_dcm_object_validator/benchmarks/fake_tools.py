@@ -0,0 +1,217 @@
+"""
+Deterministic stand-ins for the JHOVE- and fido-executables.
+
+The stand-ins emulate the command line interface and output formats
+used by the plugins (JHOVE's JSON-handler and fido's '-matchprintf')
+based on the file extension (without inspecting the file contents).
+They are used via the executables in the sibling-directory 'bin', e.g.,
+DEFAULT_JHOVE_CMD=test_dcm_object_validator/benchmarks/bin/jhove
+
+The behavior is configured via environment variables (prefix
+'FAKE_JHOVE_' or 'FAKE_FIDO_'):
+* '<prefix>STARTUP_LATENCY': delay per call in seconds (default 0)
+* '<prefix>FILE_LATENCY': delay per file in seconds (default 0)
+* '<prefix>ERROR_RATE': fraction of calls for files that fail with a
+  non-zero exit code (default 0)
+* 'FAKE_JHOVE_INVALID_RATE': fraction of files that are reported as
+  invalid (default 0)
+* 'FAKE_TOOLS_SEED': seed for the selection of failing calls and
+  invalid files (default '0')
+
+The selection of failing calls and invalid files only depends on the
+seed and the given arguments and is, hence, reproducible.
+"""
+
+from typing import Optional
+from collections.abc import Iterable
+from pathlib import Path
+from time import sleep
+import hashlib
+import json
+import os
+import sys
+
+
+JHOVE_RELEASE = "1.28.0"
+# JHOVE-module: (release, mimetype, file extensions)
+JHOVE_MODULES = {
+    "GIF-hul": ("1.4.3", "image/gif", [".gif"]),
+    "HTML-hul": ("1.4.3", "text/html", [".html", ".htm"]),
+    "JPEG-hul": ("1.5.4", "image/jpeg", [".jpg", ".jpeg"]),
+    "PDF-hul": ("1.12.4", "application/pdf", [".pdf"]),
+    "TIFF-hul": ("1.9.4", "image/tiff", [".tif", ".tiff"]),
+    "WAVE-hul": ("1.8.3", "audio/vnd.wave", [".wav"]),
+    "XML-hul": ("1.5.4", "text/xml", [".xml"]),
+    "PNG-gdm": ("1.0", "image/png", [".png"]),
+    "BYTESTREAM": ("1.4", "application/octet-stream", []),
+}
+# file extension: (mimetype, puid)
+FIDO_FORMATS = {
+    ".gif": ("image/gif", "fmt/4"),
+    ".html": ("text/html", "fmt/96"),
+    ".htm": ("text/html", "fmt/96"),
+    ".jpg": ("image/jpeg", "fmt/43"),
+    ".jpeg": ("image/jpeg", "fmt/43"),
+    ".pdf": ("application/pdf", "fmt/276"),
+    ".tif": ("image/tiff", "fmt/353"),
+    ".tiff": ("image/tiff", "fmt/353"),
+    ".wav": ("audio/vnd.wave", "fmt/141"),
+    ".xml": ("text/xml", "fmt/101"),
+    ".png": ("image/png", "fmt/12"),
+    # unlike fido, identify generic binary data (e.g., synthetic bags)
+    ".bin": ("application/octet-stream", "x-fmt/0"),
+}
+
+
+def _setting(prefix: str, name: str, default: float = 0) -> float:
+    return float(os.environ.get(f"FAKE_{prefix}_{name}") or default)
+
+
+def _selected(rate: float, *subject: str) -> bool:
+    """
+    Returns `True` for a reproducible fraction `rate` of subjects.
+    """
+    if rate <= 0:
+        return False
+    seed = os.environ.get("FAKE_TOOLS_SEED", "0")
+    digest = hashlib.sha256(
+        "\0".join((seed,) + subject).encode("utf-8")
+    ).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64 < rate
+
+
+def _delay(prefix: str, files: int) -> None:
+    sleep(
+        _setting(prefix, "STARTUP_LATENCY")
+        + files * _setting(prefix, "FILE_LATENCY")
+    )
+
+
+def _fail(prefix: str, args: Iterable[str]) -> bool:
+    if _selected(_setting(prefix, "ERROR_RATE"), prefix, *args):
+        print(f"injected error for arguments {list(args)}", file=sys.stderr)
+        return True
+    return False
+
+
+def _jhove_module(file: Path, module: Optional[str]) -> str:
+    if module is not None:
+        return module
+    return next(
+        (
+            m
+            for m, (_, _, extensions) in JHOVE_MODULES.items()
+            if file.suffix.lower() in extensions
+        ),
+        "BYTESTREAM",
+    )
+
+
+def jhove(argv: list[str]) -> int:
+    """
+    Emulates `jhove [-h JSON] [-m <module>] [<file>]`. Returns the exit
+    code.
+    """
+    args = list(argv)
+    handler = module = None
+    while args and args[0].startswith("-"):
+        option = args.pop(0)
+        if option == "-h":
+            handler = args.pop(0)
+        elif option == "-m":
+            module = args.pop(0)
+    _delay("JHOVE", len(args))
+    # errors are only injected into calls for files
+    if args and _fail("JHOVE", argv):
+        return 1
+    if handler != "JSON":
+        print(f"Jhove (Rel. {JHOVE_RELEASE}) [fake]")
+        return 0
+    if not args:
+        output = {
+            "app": {
+                "api": JHOVE_RELEASE,
+                "modules": [
+                    {"module": m, "release": release}
+                    for m, (release, _, _) in JHOVE_MODULES.items()
+                ],
+            }
+        }
+    else:
+        file = Path(args[0])
+        module = _jhove_module(file, module)
+        if module not in JHOVE_MODULES:
+            print(f"Module '{module}' not found", file=sys.stderr)
+            return 1
+        release, mimetype, _ = JHOVE_MODULES[module]
+        record = {
+            "uri": str(file),
+            "reportingModule": {"name": module, "release": release},
+            "mimeType": mimetype,
+        }
+        if not file.is_file():
+            record["status"] = "Not well-formed"
+            record["messages"] = [
+                {
+                    "message": "File not found",
+                    "severity": "error",
+                    "id": "JHOVE-1",
+                }
+            ]
+        elif _selected(
+            _setting("JHOVE", "INVALID_RATE"), "JHOVE-INVALID", str(file)
+        ):
+            record["status"] = "Well-Formed, but not valid"
+            record["size"] = file.stat().st_size
+            record["messages"] = [
+                {
+                    "message": "Injected validation error",
+                    "severity": "error",
+                    "id": "FAKE-1",
+                }
+            ]
+        else:
+            record["status"] = "Well-Formed and valid"
+            record["size"] = file.stat().st_size
+        output = {"repInfo": [record]}
+    print(
+        json.dumps(
+            {"jhove": {"name": "Jhove", "release": JHOVE_RELEASE} | output}
+        )
+    )
+    return 0
+
+
+def fido(argv: list[str]) -> int:
+    """
+    Emulates `fido [-h] [-q] [-matchprintf <format>] <file> ...`.
+    Returns the exit code.
+    """
+    args = list(argv)
+    matchprintf = "OK,%(info.puid)s,%(info.mimetype)s,%(info.filename)s\n"
+    files = []
+    while args:
+        option = args.pop(0)
+        if option == "-h":
+            print("usage: fido [-h] [-q] [-matchprintf FORMATSTRING] FILE")
+            return 0
+        if option == "-matchprintf":
+            matchprintf = args.pop(0)
+        elif not option.startswith("-"):
+            files.append(option)
+    _delay("FIDO", len(files))
+    if files and _fail("FIDO", argv):
+        return 1
+    for file in map(Path, files):
+        if not file.is_file() or file.suffix.lower() not in FIDO_FORMATS:
+            continue
+        mimetype, puid = FIDO_FORMATS[file.suffix.lower()]
+        sys.stdout.write(
+            matchprintf
+            % {
+                "info.puid": puid,
+                "info.mimetype": mimetype,
+                "info.filename": str(file),
+            }
+        )
+    return 0
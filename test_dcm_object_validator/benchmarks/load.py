@@ -0,0 +1,345 @@
+"""
+HTTP load test of the 'Object Validator'-service.
+
+The app is started via `app_factory` (with the orchestra running in
+the same process) and served on a local port. A number of concurrent
+clients submit validation jobs for a synthetic BagIt-bag via
+'POST-/validate', poll 'GET-/report' until the job is completed, and
+receive callbacks on a local callback sink. The results contain
+latency percentiles for submissions, polls, completed jobs, and
+callbacks as well as the overall throughput.
+
+The JHOVE- and fido-based plugins can be tested with the stand-ins
+from 'bin' (see `fake_tools`).
+
+Run with (see `--help` for options)
+python -m test_dcm_object_validator.benchmarks.load
+"""
+
+from typing import Any, Optional
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from tempfile import TemporaryDirectory
+from threading import Lock, Thread
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter, sleep
+from dataclasses import asdict
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+import argparse
+import json
+import os
+
+from werkzeug.serving import make_server
+from dcm_common.orchestra import dillignore
+
+from dcm_object_validator import app_factory
+from dcm_object_validator.config import AppConfig
+
+from test_dcm_object_validator.benchmarks.bags import (
+    DISTRIBUTIONS,
+    BagSpec,
+    generate_bag,
+)
+from test_dcm_object_validator.benchmarks.common import (
+    environment,
+    write_results,
+)
+from test_dcm_object_validator.benchmarks.throughput import PLUGINS
+
+
+class CallbackSink:
+    """
+    Context manager that serves a local HTTP-endpoint that records the
+    arrival time (see `time.perf_counter`) of callbacks by token.
+    """
+
+    def __init__(self) -> None:
+        self.received: dict[str, float] = {}
+        self._lock = Lock()
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Handler for callbacks."""
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                """Record callback."""
+                time0 = perf_counter()
+                body = self.rfile.read(
+                    int(self.headers.get("Content-Length") or 0)
+                )
+                try:
+                    token = json.loads(body).get("value")
+                except (ValueError, AttributeError):
+                    token = None
+                with sink._lock:  # pylint: disable=protected-access
+                    sink.received[token] = time0
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):  # silence access log
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}/callback"
+
+    def __enter__(self) -> "CallbackSink":
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def wait(self, tokens: list[str], timeout: float) -> None:
+        """Waits (up to `timeout` seconds) for callbacks of `tokens`."""
+        time0 = perf_counter()
+        while perf_counter() - time0 < timeout:
+            with self._lock:
+                if all(token in self.received for token in tokens):
+                    return
+            sleep(0.01)
+
+
+def percentiles(values: list[float]) -> Optional[dict[str, float]]:
+    """
+    Returns (nearest-rank) percentiles, mean, and maximum of `values`
+    (or `None` if empty).
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values),
+        **{
+            f"p{p}": values[max(0, -(-p * len(values) // 100) - 1)]
+            for p in (50, 90, 95, 99)
+        },
+        "max": values[-1],
+    }
+
+
+def _request(
+    method: str, url: str, body: Optional[dict] = None
+) -> tuple[int, Any, float]:
+    """Returns status, JSON-response (if any), and latency."""
+    request = Request(
+        url,
+        data=None if body is None else json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method=method,
+    )
+    time0 = perf_counter()
+    try:
+        with urlopen(request, timeout=60) as response:
+            status, content = response.status, response.read()
+    except HTTPError as exc_info:
+        status, content = exc_info.code, exc_info.read()
+    latency = perf_counter() - time0
+    try:
+        return status, json.loads(content), latency
+    except ValueError:
+        return status, None, latency
+
+
+def run_client(
+    url: str, body: dict, poll_interval: float, timeout: float
+) -> dict[str, Any]:
+    """
+    Submits a job with `body`, polls its report until it is completed
+    (or `timeout` seconds have passed), and returns the measurements.
+    """
+    time0 = perf_counter()
+    result = {"submitted": time0, "polls": [], "error": None}
+    try:
+        status, token, result["submit"] = _request(
+            "POST", f"{url}/validate", body
+        )
+        if status != 201:
+            result["error"] = f"submission returned {status}"
+            return result
+        result["token"] = token["value"]
+        while perf_counter() - time0 < timeout:
+            sleep(poll_interval)
+            status, report, latency = _request(
+                "GET", f"{url}/report?token={result['token']}"
+            )
+            result["polls"].append(latency)
+            if status not in (200, 503):
+                result["error"] = f"report returned {status}"
+                return result
+            if (report or {}).get("progress", {}).get("status") == (
+                "completed"
+            ):
+                result["job"] = perf_counter() - time0
+                result["valid"] = report.get("data", {}).get("valid")
+                return result
+        result["error"] = "timeout"
+    except (URLError, OSError) as exc_info:
+        result["error"] = str(exc_info)
+    return result
+
+
+def run_load_test(
+    jobs: int = 100,
+    concurrency: int = 10,
+    spec: Optional[BagSpec] = None,
+    plugin: str = "integrity-bagit",
+    poll_interval: float = 0.1,
+    timeout: float = 300,
+    directory: Optional[Path] = None,
+) -> dict[str, Any]:
+    """
+    Runs the load test and returns the results.
+
+    Keyword arguments:
+    jobs -- total number of jobs
+            (default 100)
+    concurrency -- number of concurrent clients
+                   (default 10)
+    spec -- specification of the bag that is validated in every job
+            (default None; uses `BagSpec` defaults)
+    plugin -- validation plugin (see `throughput.PLUGINS`)
+              (default 'integrity-bagit')
+    poll_interval -- interval between report-polls of a client in
+                     seconds
+                     (default 0.1)
+    timeout -- maximum duration of a single job in seconds
+               (default 300)
+    directory -- directory for generated data
+                 (default None; uses system tmp)
+    """
+    spec = spec or BagSpec()
+    plugin_type, target, args = PLUGINS[plugin]
+    with TemporaryDirectory(dir=directory) as tmp:
+        bag = generate_bag(Path(tmp) / "bag", spec)
+
+        @dillignore("controller", "worker_pool")
+        class LoadTestConfig(AppConfig):
+            FS_MOUNT_POINT = Path(tmp)
+            VALIDATION_PLUGINS = [plugin_type]
+            ORCHESTRA_DAEMON_INTERVAL = 0.01
+            ORCHESTRA_WORKER_INTERVAL = 0.01
+
+        app = app_factory(LoadTestConfig(), block=True)
+        server = make_server("127.0.0.1", 0, app, threaded=True)
+        Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}"
+        try:
+            with CallbackSink() as sink, ThreadPoolExecutor(
+                max_workers=concurrency
+            ) as executor:
+                body = {
+                    "validation": {
+                        "target": {
+                            "path": os.path.normpath(
+                                Path(bag.path.name) / target
+                            )
+                        },
+                        "plugins": {
+                            "0": {
+                                "plugin": plugin,
+                                "args": args(bag, spec.algorithms[0]),
+                            }
+                        },
+                    },
+                    "callbackUrl": sink.url,
+                }
+                time0 = perf_counter()
+                clients = list(
+                    executor.map(
+                        lambda _: run_client(
+                            url, body, poll_interval, timeout
+                        ),
+                        range(jobs),
+                    )
+                )
+                duration = perf_counter() - time0
+                tokens = [c["token"] for c in clients if "job" in c]
+                sink.wait(tokens, 10)
+                callbacks = [
+                    sink.received[c["token"]] - c["submitted"]
+                    for c in clients
+                    if c.get("token") in sink.received
+                ]
+        finally:
+            server.shutdown()
+            app.extensions["orchestra"].stop(stop_on_idle=True)
+
+    completed = [c for c in clients if "job" in c]
+    requests = sum(1 + len(c["polls"]) for c in clients)
+    return {
+        "benchmark": "load",
+        "environment": environment(),
+        "dataset": asdict(spec) | {"bytes": bag.bytes_},
+        "settings": {
+            "jobs": jobs,
+            "concurrency": concurrency,
+            "plugin": plugin,
+            "poll_interval": poll_interval,
+        },
+        "duration": duration,
+        "completed": len(completed),
+        "valid": sum(bool(c.get("valid")) for c in completed),
+        "errors": [c["error"] for c in clients if c["error"]],
+        "jobs_per_second": len(completed) / duration,
+        "requests_per_second": requests / duration,
+        "latency": {
+            "submit": percentiles(
+                [c["submit"] for c in clients if "submit" in c]
+            ),
+            "poll": percentiles([p for c in clients for p in c["polls"]]),
+            "job": percentiles([c["job"] for c in completed]),
+            "callback": percentiles(callbacks),
+        },
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--plugin", choices=list(PLUGINS), default="integrity-bagit"
+    )
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument(
+        "--size", type=int, default=65536, help="(mean) file size in bytes"
+    )
+    parser.add_argument(
+        "--distribution", choices=DISTRIBUTIONS, default="lognormal"
+    )
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        help="directory for generated data (default system tmp)",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="output file (default stdout)"
+    )
+    args = parser.parse_args(argv)
+
+    write_results(
+        run_load_test(
+            args.jobs,
+            args.concurrency,
+            BagSpec(
+                files=args.files,
+                size=args.size,
+                distribution=args.distribution,
+            ),
+            args.plugin,
+            args.poll_interval,
+            args.timeout,
+            args.directory,
+        ),
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Microbenchmark of the framework-overhead of `ValidationPlugin`s.
+
+A no-op plugin (that does not access any files) is run over a large
+number of synthetic records. Since there is no actual validation work,
+the duration of `ValidationPlugin.get` per record is the framework-
+overhead per record. This overhead is broken down into the creation of
+the result parts (including `Logger`s; measured by calling `_get_part`
+directly) and the remaining bookkeeping. The serialization of the
+result is measured separately.
+
+The command exits with a non-zero code if the per-record overhead
+exceeds the given threshold.
+
+Run with (see `--help` for options)
+python -m test_dcm_object_validator.benchmarks.overhead
+"""
+
+from typing import Any, Optional
+from pathlib import Path
+import argparse
+import sys
+
+from dcm_common.logger import LoggingContext as Context, Logger
+
+from dcm_object_validator.plugins.runtime import PluginRuntime, use_runtime
+from dcm_object_validator.plugins.validation import ValidationPlugin
+from dcm_object_validator.plugins.validation.interface import (
+    ValidationPluginResultPart,
+)
+
+from test_dcm_object_validator.benchmarks.common import (
+    environment,
+    measure,
+    write_results,
+)
+
+
+# default threshold for the framework-overhead per record in seconds
+THRESHOLD = 250e-6
+
+# name: runtime-settings
+VARIANTS = {
+    "default": {},
+    "summary": {"verbosity": "summary"},
+    "compact": {"compact_records": True},
+}
+
+
+class NoOpPlugin(ValidationPlugin):
+    """
+    Validation plugin that generates `records` synthetic records and
+    accepts all of them without accessing the file system. If `records`
+    is `None`, the records are discovered in the target directory
+    instead (like in regular plugins).
+    """
+
+    _NAME = "no-op"
+    _DISPLAY_NAME = "No-op-Plugin"
+    _DESCRIPTION = "Accepts every record."
+
+    def __init__(self, records: Optional[int] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.records = records
+
+    def _get_records(self, path: Path, /, **kwargs) -> list[Path]:
+        if self.records is None:
+            return super()._get_records(path, **kwargs)
+        return [
+            path / f"{i // 1000:04d}" / f"file_{i:08d}.bin"
+            for i in range(self.records)
+        ]
+
+    def _get_part(
+        self, record_path: Path, /, **kwargs
+    ) -> ValidationPluginResultPart:
+        result = self._PART_TYPE(
+            path=record_path, log=Logger(default_origin=self.display_name)
+        )
+        result.log.log(Context.INFO, body=f"Accepted '{record_path}'.")
+        result.success = True
+        result.valid = True
+        return result
+
+
+def bench_overhead(
+    records: int, variant: str = "default", runs: int = 1
+) -> dict[str, Any]:
+    """
+    Returns durations (best of `runs`) and per-record overhead (in
+    seconds) of running `NoOpPlugin` over `records` records with the
+    runtime-settings of `variant`.
+    """
+    plugin = NoOpPlugin(records)
+    paths = plugin._get_records(Path("."))  # pylint: disable=protected-access
+
+    def parts():
+        for path in paths:
+            plugin._get_part(path)  # pylint: disable=protected-access
+
+    def get():
+        with use_runtime(PluginRuntime(**VARIANTS[variant])):
+            return plugin.get(None, path=".")
+
+    parts_duration = min(measure(parts, runs)[0])
+    get_durations, result = measure(get, runs)
+    get_duration = min(get_durations)
+    serialize_duration = min(measure(lambda: result.json, runs)[0])
+    return {
+        "records": records,
+        "variant": variant,
+        "get": get_duration,
+        "parts": parts_duration,
+        "serialize": serialize_duration,
+        "overhead_per_record": get_duration / records,
+        "parts_per_record": parts_duration / records,
+        "bookkeeping_per_record": (get_duration - parts_duration) / records,
+        "serialize_per_record": serialize_duration / records,
+    }
+
+
+def run_benchmarks(
+    records: list[int],
+    variants: list[str],
+    runs: int = 1,
+    threshold: float = THRESHOLD,
+) -> dict[str, Any]:
+    """
+    Returns the results of the benchmarks for all combinations of
+    `records` and `variants`. A result passes if its per-record
+    overhead does not exceed `threshold` (in seconds).
+    """
+    results = []
+    for n in records:
+        for variant in variants:
+            result = bench_overhead(n, variant, runs)
+            result["passed"] = result["overhead_per_record"] <= threshold
+            results.append(result)
+    return {
+        "benchmark": "overhead",
+        "environment": environment(),
+        "threshold": threshold,
+        "results": results,
+        "passed": all(r["passed"] for r in results),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--records",
+        action="append",
+        type=int,
+        help="number of records (can be repeated; default 10000 and 100000)",
+    )
+    parser.add_argument(
+        "--variant",
+        dest="variants",
+        action="append",
+        choices=list(VARIANTS),
+        help="runtime-settings (can be repeated; default all)",
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD * 1e6,
+        help=(
+            "maximum overhead per record in microseconds "
+            + f"(default {THRESHOLD * 1e6:g})"
+        ),
+    )
+    parser.add_argument(
+        "--output", type=Path, help="output file (default stdout)"
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.records or [10000, 100000],
+        args.variants or list(VARIANTS),
+        args.runs,
+        args.threshold / 1e6,
+    )
+    write_results(results, args.output)
+    if not results["passed"]:
+        print(
+            "Framework-overhead exceeds threshold of "
+            + f"{args.threshold:g} microseconds per record.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Performance regression gate for key paths of the 'Object Validator'.
+
+The throughput of
+* hashing ('integrity.py'),
+* manifest parsing ('integrity_bagit.py'),
+* record discovery ('interface.py'), and
+* report serialization ('Report')
+is measured and compared against a stored baseline. The command exits
+with a non-zero code if the throughput of any path drops by more than
+the given tolerance.
+
+Baselines are machine-specific and should be recorded on the same
+(kind of) machine that runs the comparison. Refreshing the baseline is
+an explicit step (`--update-baseline`); the updated file is then
+committed. A missing baseline fails the gate (exit code 2) unless
+`--allow-missing-baseline` is given (e.g., while a baseline has not yet
+been recorded for a new machine type); then the comparison is skipped.
+
+Run with (see `--help` for options)
+python -m test_dcm_object_validator.benchmarks.regression
+"""
+
+from typing import Any, Optional
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import argparse
+import json
+import sys
+
+from dcm_object_validator.models import Report, ValidationResult
+from dcm_object_validator.plugins import BagItIntegrityPlugin
+from dcm_object_validator.plugins.validation import integrity
+
+from test_dcm_object_validator.benchmarks.bags import BagSpec, generate_bag
+from test_dcm_object_validator.benchmarks.common import (
+    environment,
+    measure,
+    write_results,
+)
+from test_dcm_object_validator.benchmarks.overhead import NoOpPlugin
+
+
+BASELINE = Path(__file__).parent / "baseline.json"
+TOLERANCE = 0.2
+
+
+def _bench_hashing(
+    directory: Path, size: int, runs: int
+) -> dict[str, tuple[float, str]]:
+    file = directory / "hashing.bin"
+    with open(file, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            f.write(b"\xab" * min(remaining, 2**20))
+            remaining -= 2**20
+    results = {}
+    for method in ("md5", "sha256", "sha512"):
+        function = getattr(integrity, method)
+        duration = min(measure(lambda: function(file), runs)[0])
+        results[f"hashing:{method}"] = (size / 1e6 / duration, "MB/s")
+    return results
+
+
+def _bench_manifest(
+    bag: Path, records: int, runs: int
+) -> dict[str, tuple[float, str]]:
+    plugin = BagItIntegrityPlugin()
+
+    def parse():
+        # pylint: disable=protected-access
+        return plugin._prepare(
+            plugin.create_context(lambda msg: None, lambda: None),
+            {"path": str(bag)},
+        )
+
+    return {
+        "manifest-parsing": (records / min(measure(parse, runs)[0]), "1/s")
+    }
+
+
+def _bench_discovery(
+    bag: Path, records: int, runs: int
+) -> dict[str, tuple[float, str]]:
+    plugin = NoOpPlugin()
+
+    def discover():
+        return plugin.collect(
+            plugin.create_context(lambda msg: None, lambda: None),
+            path=str(bag / "data"),
+        )
+
+    return {
+        "record-discovery": (records / min(measure(discover, runs)[0]), "1/s")
+    }
+
+
+def _bench_serialization(
+    records: int, runs: int
+) -> dict[str, tuple[float, str]]:
+    report = Report(
+        host="",
+        data=ValidationResult(
+            details={"0": NoOpPlugin(records).get(None, path=".")}
+        ),
+    )
+    return {
+        "report-serialization:json": (
+            records / min(measure(lambda: json.dumps(report.json), runs)[0]),
+            "1/s",
+        ),
+        "report-serialization:stream": (
+            records
+            / min(measure(lambda: "".join(report.iter_json()), runs)[0]),
+            "1/s",
+        ),
+    }
+
+
+def run_benchmarks(
+    size: int = 2**25,
+    records: int = 20000,
+    runs: int = 5,
+    directory: Optional[Path] = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Returns throughput (best of `runs`) of the key paths by name.
+
+    Keyword arguments:
+    size -- file size in bytes for hashing
+            (default 32MiB)
+    records -- number of records for the remaining paths
+               (default 20000)
+    runs -- number of repetitions per path
+            (default 5)
+    directory -- directory for generated data
+                 (default None; uses system tmp)
+    """
+    with TemporaryDirectory(dir=directory) as tmp:
+        bag = generate_bag(
+            Path(tmp) / "bag", BagSpec(files=records, size=0)
+        ).path
+        benchmarks: list[Callable[[], dict[str, tuple[float, str]]]] = [
+            lambda: _bench_hashing(Path(tmp), size, runs),
+            lambda: _bench_manifest(bag, records, runs),
+            lambda: _bench_discovery(bag, records, runs),
+            lambda: _bench_serialization(records, runs),
+        ]
+        results = {}
+        for benchmark in benchmarks:
+            for name, (value, unit) in benchmark().items():
+                results[name] = {"throughput": value, "unit": unit}
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float = TOLERANCE,
+) -> dict[str, dict[str, Any]]:
+    """
+    Returns `results` extended by a comparison with `baseline`. A
+    result fails if its throughput is less than the baseline's
+    throughput reduced by the fraction `tolerance`. Results without
+    baseline pass.
+    """
+    comparison = {}
+    for name, result in results.items():
+        reference = baseline.get(name, {}).get("throughput")
+        comparison[name] = result | {
+            "baseline": reference,
+            "ratio": (
+                None
+                if reference is None
+                else result["throughput"] / reference
+            ),
+            "passed": reference is None
+            or result["throughput"] >= reference * (1 - tolerance),
+        }
+    return comparison
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE,
+        help=f"baseline file (default '{BASELINE}')",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write results to baseline file instead of comparing",
+    )
+    parser.add_argument(
+        "--allow-missing-baseline",
+        action="store_true",
+        help="skip comparison (instead of failing) if baseline is missing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help=(
+            "acceptable relative drop in throughput "
+            + f"(default {TOLERANCE})"
+        ),
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=2**25,
+        help="file size in bytes for hashing (default 32MiB)",
+    )
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        help="directory for generated data (default system tmp)",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="output file (default stdout)"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.update_baseline and not args.baseline.is_file():
+        print(
+            f"Missing baseline '{args.baseline}' (create with "
+            + "'--update-baseline')"
+            + (
+                ", skipping comparison."
+                if args.allow_missing_baseline
+                else "."
+            ),
+            file=sys.stderr,
+        )
+        if args.allow_missing_baseline:
+            return
+        sys.exit(2)
+
+    results = run_benchmarks(
+        args.size, args.records, args.runs, args.directory
+    )
+    if args.update_baseline:
+        write_results(
+            {
+                "benchmark": "regression",
+                "environment": environment(),
+                "results": results,
+            },
+            args.baseline,
+        )
+        return
+
+    comparison = compare(
+        results,
+        json.loads(args.baseline.read_text(encoding="utf-8"))["results"],
+        args.tolerance,
+    )
+    failed = [name for name, c in comparison.items() if not c["passed"]]
+    write_results(
+        {
+            "benchmark": "regression",
+            "environment": environment(),
+            "tolerance": args.tolerance,
+            "results": comparison,
+            "passed": not failed,
+        },
+        args.output,
+    )
+    if failed:
+        print(
+            f"Throughput dropped by more than {args.tolerance:.0%} for: "
+            + ", ".join(failed),
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Throughput benchmark of the validation plugins based on synthetic
+BagIt-bags.
+
+Every requested plugin is benchmarked
+* directly via `ValidationPlugin.get` ('plugin') and
+* end-to-end via `app_factory` with the orchestra-worker ('app').
+
+Run with (see `--help` for options)
+python -m test_dcm_object_validator.benchmarks.throughput
+"""
+
+from typing import Any, Optional
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import argparse
+import os
+
+from dcm_object_validator.plugins import (
+    IntegrityPlugin,
+    BagItIntegrityPlugin,
+    JHOVEFidoMIMETypePlugin,
+    JHOVEFidoMIMETypeBagItPlugin,
+)
+from dcm_object_validator.plugins.validation import ValidationPlugin
+
+from test_dcm_object_validator.benchmarks.bags import (
+    DISTRIBUTIONS,
+    BagSpec,
+    Bag,
+    generate_bag,
+)
+from test_dcm_object_validator.benchmarks.common import (
+    environment,
+    measure,
+    rates,
+    write_results,
+)
+
+
+# plugin-name: (plugin-class, target (relative to bag), arguments)
+PLUGINS: dict[
+    str,
+    tuple[type[ValidationPlugin], str, Callable[[Bag, str], dict[str, Any]]],
+] = {
+    IntegrityPlugin.name: (
+        IntegrityPlugin,
+        ".",
+        lambda bag, method: {"method": method, "manifest": bag.manifest},
+    ),
+    BagItIntegrityPlugin.name: (
+        BagItIntegrityPlugin,
+        ".",
+        lambda bag, method: {"method": method},
+    ),
+    JHOVEFidoMIMETypePlugin.name: (
+        JHOVEFidoMIMETypePlugin,
+        "data",
+        lambda bag, method: {},
+    ),
+    JHOVEFidoMIMETypeBagItPlugin.name: (
+        JHOVEFidoMIMETypeBagItPlugin,
+        ".",
+        lambda bag, method: {},
+    ),
+}
+
+
+def _summarize(durations: list[float], bag: Bag, result: Any) -> dict:
+    return rates(durations, bag.files, bag.bytes_) | {
+        "success": result.get("success"),
+        "valid": result.get("valid"),
+    }
+
+
+def bench_plugin(
+    name: str, bag: Bag, method: str, runs: int = 1
+) -> dict[str, Any]:
+    """Benchmarks plugin `name` via `ValidationPlugin.get`."""
+    plugin_type, target, args = PLUGINS[name]
+    plugin = plugin_type()
+    durations, result = measure(
+        lambda: plugin.get(
+            None,
+            path=str((bag.path / target).resolve()),
+            **args(bag, method),
+        ),
+        runs,
+    )
+    return _summarize(
+        durations, bag, {"success": result.success, "valid": result.valid}
+    )
+
+
+def bench_app(
+    name: str, bag: Bag, method: str, runs: int = 1
+) -> dict[str, Any]:
+    """
+    Benchmarks plugin `name` end-to-end via `app_factory` (from
+    submission through completion of the job, including orchestration;
+    the app is created before and the report collected after the
+    timed section).
+    """
+    # pylint: disable=import-outside-toplevel
+    from dcm_common.orchestra import dillignore
+    from dcm_object_validator import app_factory
+    from dcm_object_validator.config import AppConfig
+
+    plugin_type, target, args = PLUGINS[name]
+
+    @dillignore("controller", "worker_pool")
+    class BenchmarkConfig(AppConfig):
+        FS_MOUNT_POINT = bag.path.parent
+        VALIDATION_PLUGINS = [plugin_type]
+        ORCHESTRA_DAEMON_INTERVAL = 0.01
+        ORCHESTRA_WORKER_INTERVAL = 0.01
+
+    app = None
+
+    def setup():
+        nonlocal app
+        app = app_factory(BenchmarkConfig(), block=True)
+
+    def run():
+        token = (
+            app.test_client()
+            .post(
+                "/validate",
+                json={
+                    "validation": {
+                        "target": {
+                            "path": os.path.normpath(
+                                Path(bag.path.name) / target
+                            )
+                        },
+                        "plugins": {
+                            "0": {"plugin": name, "args": args(bag, method)}
+                        },
+                    }
+                },
+            )
+            .json["value"]
+        )
+        app.extensions["orchestra"].stop(stop_on_idle=True)
+        return token
+
+    durations, token = measure(run, runs, setup)
+    result = app.test_client().get(f"/report?token={token}").json["data"]
+    return _summarize(durations, bag, result)
+
+
+def run_benchmarks(
+    spec: BagSpec,
+    plugins: list[str],
+    modes: list[str],
+    runs: int = 1,
+    directory: Optional[Path] = None,
+) -> dict[str, Any]:
+    """
+    Generates a bag according to `spec` (in `directory` or a temporary
+    directory) and returns the results of the benchmarks for `plugins`
+    in the given `modes` ('plugin' and/or 'app').
+    """
+    with TemporaryDirectory(dir=directory) as tmp:
+        bag = generate_bag(Path(tmp) / "bag", spec)
+        results = []
+        skipped = {}
+        for name in plugins:
+            ok, msg = PLUGINS[name][0].requirements_met()
+            if not ok:
+                skipped[name] = msg
+                continue
+            for mode in modes:
+                bench = bench_plugin if mode == "plugin" else bench_app
+                results.append(
+                    {"plugin": name, "mode": mode}
+                    | bench(name, bag, spec.algorithms[0], runs)
+                )
+    return {
+        "benchmark": "throughput",
+        "environment": environment(),
+        "dataset": asdict(spec) | {"bytes": bag.bytes_},
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command line interface."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument(
+        "--size", type=int, default=65536, help="(mean) file size in bytes"
+    )
+    parser.add_argument(
+        "--distribution", choices=DISTRIBUTIONS, default="lognormal"
+    )
+    parser.add_argument(
+        "--algorithm",
+        dest="algorithms",
+        action="append",
+        choices=["md5", "sha1", "sha256", "sha512"],
+        help="manifest algorithm (can be repeated; default sha256)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--plugin",
+        dest="plugins",
+        action="append",
+        choices=list(PLUGINS),
+        help="plugin to benchmark (can be repeated; default all)",
+    )
+    parser.add_argument(
+        "--mode",
+        dest="modes",
+        action="append",
+        choices=["plugin", "app"],
+        help="benchmark mode (can be repeated; default both)",
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        help="directory for the generated dataset (default system tmp)",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="output file (default stdout)"
+    )
+    args = parser.parse_args(argv)
+
+    write_results(
+        run_benchmarks(
+            BagSpec(
+                files=args.files,
+                size=args.size,
+                distribution=args.distribution,
+                algorithms=args.algorithms or ["sha256"],
+                seed=args.seed,
+            ),
+            args.plugins or list(PLUGINS),
+            args.modes or ["plugin", "app"],
+            args.runs,
+            args.directory,
+        ),
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Test module for the generator of synthetic bags."""
+
+import pytest
+
+from dcm_object_validator.plugins import BagItIntegrityPlugin
+
+from test_dcm_object_validator.benchmarks.bags import (
+    DISTRIBUTIONS,
+    BagSpec,
+    generate_bag,
+)
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_generate_bag(distribution, tmp_path):
+    """Test function `generate_bag`."""
+    bag = generate_bag(
+        tmp_path / "bag",
+        BagSpec(
+            files=25,
+            size=1024,
+            distribution=distribution,
+            algorithms=["md5", "sha512"],
+            files_per_directory=10,
+        ),
+    )
+
+    assert bag.files == 25
+    assert len(bag.manifest) == 25
+    assert len(list((bag.path / "data").glob("*/*"))) == 25
+    assert len(list((bag.path / "data").glob("*"))) == 3
+    assert bag.bytes_ == sum(
+        p.stat().st_size for p in (bag.path / "data").glob("*/*")
+    )
+    if distribution == "fixed":
+        assert bag.bytes_ == 25 * 1024
+
+    for method in ["md5", "sha512"]:
+        result = BagItIntegrityPlugin().get(
+            None, path=str(bag.path), method=method
+        )
+        assert result.success
+        assert result.valid
+        assert len(result.records) == 25 + 4
+
+
+def test_generate_bag_deterministic(tmp_path):
+    """Test that `generate_bag` is deterministic."""
+    spec = BagSpec(files=5, size=100, distribution="uniform")
+    assert (
+        generate_bag(tmp_path / "a", spec).manifest
+        == generate_bag(tmp_path / "b", spec).manifest
+    )
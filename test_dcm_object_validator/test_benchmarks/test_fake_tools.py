@@ -0,0 +1,142 @@
+"""Test module for the stand-ins of JHOVE and fido."""
+
+from pathlib import Path
+from time import perf_counter
+import json
+import os
+import subprocess
+
+import pytest
+
+from dcm_object_validator.plugins import FidoPUIDPlugin, FidoMIMETypePlugin
+
+
+BIN = Path("test_dcm_object_validator/benchmarks/bin")
+
+
+def _run(tool: str, *args: str, env=None):
+    return subprocess.run(
+        [str(BIN / tool), *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        env=os.environ | (env or {}),
+    )
+
+
+@pytest.fixture(name="files")
+def _files(tmp_path):
+    (tmp_path / "a.jpg").write_bytes(b"a")
+    (tmp_path / "b.bin").write_bytes(b"b")
+    return tmp_path
+
+
+def test_jhove_info():
+    """Test application info of fake JHOVE."""
+    assert _run("jhove").returncode == 0
+    info = json.loads(_run("jhove", "-h", "JSON").stdout)
+    modules = [m["module"] for m in info["jhove"]["app"]["modules"]]
+    assert "JPEG-hul" in modules
+    assert "release" in info["jhove"]
+
+
+@pytest.mark.parametrize(
+    ("file", "args", "module"),
+    [
+        ("a.jpg", [], "JPEG-hul"),
+        ("b.bin", [], "BYTESTREAM"),
+        ("b.bin", ["-m", "TIFF-hul"], "TIFF-hul"),
+    ],
+)
+def test_jhove_validate(files, file, args, module):
+    """Test validation with fake JHOVE."""
+    result = _run("jhove", "-h", "JSON", *args, str(files / file))
+    assert result.returncode == 0
+    record = json.loads(result.stdout)["jhove"]["repInfo"][0]
+    assert record["reportingModule"]["name"] == module
+    assert record["status"] == "Well-Formed and valid"
+    assert "messages" not in record
+
+
+def test_jhove_invalid(files):
+    """Test injection of invalid files with fake JHOVE."""
+    result = _run(
+        "jhove",
+        "-h",
+        "JSON",
+        str(files / "a.jpg"),
+        env={"FAKE_JHOVE_INVALID_RATE": "1"},
+    )
+    record = json.loads(result.stdout)["jhove"]["repInfo"][0]
+    assert record["messages"][0]["severity"] == "error"
+
+
+@pytest.mark.parametrize("tool", ["jhove", "fido"])
+def test_error_injection(files, tool):
+    """Test error injection with fake tools."""
+    env = {f"FAKE_{tool.upper()}_ERROR_RATE": "1"}
+    # application info is not affected
+    assert _run(tool, env=env).returncode == 0
+    result = _run(tool, str(files / "a.jpg"), env=env)
+    assert result.returncode != 0
+    assert "injected error" in result.stderr
+
+
+def test_error_injection_reproducible(tmp_path):
+    """Test that error injection is reproducible and rate-based."""
+    env = {"FAKE_FIDO_ERROR_RATE": "0.5", "FAKE_TOOLS_SEED": "1"}
+    files = [str(tmp_path / f"{i}.jpg") for i in range(20)]
+    codes = [_run("fido", file, env=env).returncode for file in files]
+    assert 0 < sum(c != 0 for c in codes) < 20
+    assert codes == [_run("fido", file, env=env).returncode for file in files]
+
+
+def test_fido(files):
+    """Test identification with fake fido."""
+    result = _run(
+        "fido",
+        "-q",
+        "-matchprintf",
+        "%(info.mimetype)s,%(info.puid)s ",
+        str(files / "a.jpg"),
+        str(files / "b.bin"),
+        str(files / "unknown.jpg"),
+    )
+    assert result.returncode == 0
+    assert result.stdout.split() == [
+        "image/jpeg,fmt/43",
+        "application/octet-stream,x-fmt/0",
+    ]
+
+
+def test_latency(files):
+    """Test latency settings of fake tools."""
+    time0 = perf_counter()
+    _run(
+        "fido",
+        str(files / "a.jpg"),
+        str(files / "b.bin"),
+        env={
+            "FAKE_FIDO_STARTUP_LATENCY": "0.1",
+            "FAKE_FIDO_FILE_LATENCY": "0.1",
+        },
+    )
+    assert perf_counter() - time0 >= 0.3
+
+
+@pytest.mark.parametrize(
+    ("plugin", "fmt"),
+    [(FidoPUIDPlugin, "fmt/43"), (FidoMIMETypePlugin, "image/jpeg")],
+)
+def test_fido_plugins(files, plugin, fmt):
+    """Test fido-plugins with fake fido."""
+
+    class FakeFidoPlugin(plugin):
+        """Plugin using fake fido."""
+
+        _DEFAULT_FIDO_CMD = str(BIN / "fido")
+
+    assert FakeFidoPlugin.requirements_met()[0]
+    result = FakeFidoPlugin().get(None, path=str(files / "a.jpg"))
+    assert result.success
+    assert result.fmt == [fmt]
@@ -0,0 +1,36 @@
+"""Test module for the HTTP load test."""
+
+from test_dcm_object_validator.benchmarks.bags import BagSpec
+from test_dcm_object_validator.benchmarks.load import (
+    percentiles,
+    run_load_test,
+)
+
+
+def test_percentiles():
+    """Test function `percentiles`."""
+    assert percentiles([]) is None
+    result = percentiles(list(range(100, 0, -1)))
+    assert result["count"] == 100
+    assert result["p50"] == 50
+    assert result["p99"] == 99
+    assert result["max"] == 100
+
+
+def test_run_load_test(tmp_path):
+    """Test function `run_load_test`."""
+    results = run_load_test(
+        jobs=4,
+        concurrency=2,
+        spec=BagSpec(files=5, size=100),
+        poll_interval=0.01,
+        timeout=30,
+        directory=tmp_path,
+    )
+
+    assert results["errors"] == []
+    assert results["completed"] == 4
+    assert results["valid"] == 4
+    assert results["jobs_per_second"] > 0
+    for kind in ["submit", "poll", "job", "callback"]:
+        assert results["latency"][kind]["count"] >= 4
@@ -0,0 +1,33 @@
+"""Test module for the framework-overhead microbenchmark."""
+
+import pytest
+
+from test_dcm_object_validator.benchmarks.overhead import (
+    VARIANTS,
+    NoOpPlugin,
+    run_benchmarks,
+)
+
+
+def test_no_op_plugin():
+    """Test `NoOpPlugin`."""
+    result = NoOpPlugin(10).get(None, path=".")
+
+    assert result.success
+    assert result.valid
+    assert len(result.records) == 10
+
+
+@pytest.mark.parametrize(
+    ("threshold", "passed"), [(1, True), (0, False)]
+)
+def test_run_benchmarks(threshold, passed):
+    """Test function `run_benchmarks`."""
+    results = run_benchmarks([100], list(VARIANTS), threshold=threshold)
+
+    assert results["passed"] is passed
+    assert len(results["results"]) == len(VARIANTS)
+    for result in results["results"]:
+        assert result["records"] == 100
+        assert result["overhead_per_record"] > 0
+        assert result["passed"] is passed
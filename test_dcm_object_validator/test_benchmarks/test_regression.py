@@ -0,0 +1,85 @@
+"""Test module for the performance regression gate."""
+
+import json
+
+import pytest
+
+from test_dcm_object_validator.benchmarks.regression import compare, main
+
+
+def test_compare():
+    """Test function `compare`."""
+    comparison = compare(
+        {
+            "a": {"throughput": 85.0},
+            "b": {"throughput": 75.0},
+            "c": {"throughput": 1.0},
+        },
+        {"a": {"throughput": 100.0}, "b": {"throughput": 100.0}},
+        0.2,
+    )
+
+    assert comparison["a"]["passed"]
+    assert comparison["a"]["ratio"] == 0.85
+    assert not comparison["b"]["passed"]
+    assert comparison["c"]["passed"]
+    assert comparison["c"]["baseline"] is None
+
+
+def test_main(tmp_path, capsys):
+    """Test command line interface of regression gate."""
+    baseline = tmp_path / "baseline.json"
+    output = tmp_path / "output.json"
+    args = [
+        "--baseline",
+        str(baseline),
+        "--size",
+        str(2**20),
+        "--records",
+        "100",
+        "--runs",
+        "1",
+        "--directory",
+        str(tmp_path),
+    ]
+
+    # missing baseline
+    with pytest.raises(SystemExit) as exc_info:
+        main(args)
+    assert exc_info.value.code == 2
+    main(args + ["--output", str(output), "--allow-missing-baseline"])
+    assert "skipping comparison" in capsys.readouterr().err
+    assert not output.exists()
+
+    # refresh baseline
+    main(args + ["--update-baseline"])
+    results = json.loads(baseline.read_text(encoding="utf-8"))["results"]
+    assert sorted(results) == [
+        "hashing:md5",
+        "hashing:sha256",
+        "hashing:sha512",
+        "manifest-parsing",
+        "record-discovery",
+        "report-serialization:json",
+        "report-serialization:stream",
+    ]
+
+    # compare (any drop is tolerated)
+    main(args + ["--tolerance", "1", "--output", str(output)])
+    assert json.loads(output.read_text(encoding="utf-8"))["passed"]
+
+    # compare against inflated baseline
+    baseline.write_text(
+        json.dumps(
+            {
+                "results": {
+                    name: {"throughput": 1e15} for name in results
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    with pytest.raises(SystemExit) as exc_info:
+        main(args + ["--output", str(output)])
+    assert exc_info.value.code == 1
+    assert not json.loads(output.read_text(encoding="utf-8"))["passed"]
@@ -0,0 +1,23 @@
+"""Test module for the throughput benchmark."""
+
+from test_dcm_object_validator.benchmarks.bags import BagSpec
+from test_dcm_object_validator.benchmarks.throughput import run_benchmarks
+
+
+def test_run_benchmarks(tmp_path):
+    """Test function `run_benchmarks`."""
+    results = run_benchmarks(
+        BagSpec(files=10, size=1024),
+        ["integrity", "integrity-bagit"],
+        ["plugin", "app"],
+        directory=tmp_path,
+    )
+
+    assert results["benchmark"] == "throughput"
+    assert results["dataset"]["bytes"] == 10 * 1024
+    assert len(results["results"]) == 4
+    for result in results["results"]:
+        assert result["success"]
+        assert result["valid"]
+        assert result["files_per_second"] > 0
+        assert result["mb_per_second"] > 0
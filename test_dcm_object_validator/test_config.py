@@ -104,3 +104,37 @@ def test_identify_jhove_version():
     assert "JHOVE" not in software_empty
     assert "JHOVE" in software_jhove
     assert "JHOVE_MODULES" in software_jhove
+
+
+def test_load_status_workers():
+    """Test default of `LOAD_STATUS_WORKERS`."""
+
+    class ThisAppConfig(AppConfig):
+        """Test config."""
+
+        IDENTIFICATION_PLUGINS = []
+        VALIDATION_PLUGINS = [IntegrityPlugin]
+        ORCHESTRATION_PROCESSES = 4
+
+    assert ThisAppConfig().LOAD_STATUS_WORKERS == 4
+
+    class ThisAppConfig2(ThisAppConfig):
+        """Test config."""
+
+        LOAD_STATUS_WORKERS = 2
+
+    assert ThisAppConfig2().LOAD_STATUS_WORKERS == 2
+
+
+def test_record_order_unknown():
+    """Test validation of `RECORD_ORDER`."""
+
+    class ThisAppConfig(AppConfig):
+        """Test config."""
+
+        IDENTIFICATION_PLUGINS = []
+        VALIDATION_PLUGINS = [IntegrityPlugin]
+        RECORD_ORDER = "unknown"
+
+    with pytest.raises(ValueError):
+        ThisAppConfig()
@@ -0,0 +1,93 @@
+"""Test module for the duration-estimates of validation jobs."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from dcm_object_validator.scheduling import JobCost
+from dcm_object_validator.estimation import (
+    ThroughputModel,
+    ProgressTracker,
+    file_size,
+    predict,
+)
+
+
+def test_file_size(tmp_path):
+    """Test function `file_size`."""
+    (tmp_path / "file").write_bytes(b"x" * 10)
+    assert file_size(tmp_path / "file") == 10
+    assert file_size(tmp_path / "unknown") == 0
+
+
+def test_throughput_model(tmp_path):
+    """Test fitting of `ThroughputModel`."""
+    model = ThroughputModel(tmp_path / "model.json", decay=1)
+    assert model.coefficients(["a"]) == {}
+
+    # duration = 0.5 * records + 0.001 * size
+    for records, size in [(1, 1000), (10, 1000), (2, 5000)]:
+        model.observe("a", records, size, 0.5 * records + 0.001 * size)
+    per_record, per_byte = model.coefficients(["a", "b"])["a"]
+    assert per_record == pytest.approx(0.5)
+    assert per_byte == pytest.approx(0.001)
+    assert predict(
+        model.coefficients(["a"]), "a", JobCost(4, 2000)
+    ) == pytest.approx(4)
+    assert predict({}, "a", JobCost(4, 2000)) is None
+
+
+def test_throughput_model_proportional(tmp_path):
+    """
+    Test fitting of `ThroughputModel` for proportional records and
+    sizes.
+    """
+    model = ThroughputModel(tmp_path / "model.json")
+    model.observe("a", 1, 100, 2)
+    model.observe("a", 2, 200, 4)
+    assert model.coefficients(["a"])["a"] == pytest.approx((2, 0))
+
+
+def test_progress_tracker():
+    """Test class `ProgressTracker`."""
+    progress = SimpleNamespace()
+    tracker = ProgressTracker(
+        progress, ["a", "b"], JobCost(10, 100), {"a": (1, 0), "b": (0, 1)}
+    )
+    tracker.update()
+    assert progress.processed_bytes == 0
+    assert tracker.predict_remaining() == pytest.approx(110)
+    assert progress.eta is not None
+
+    tracker.start("a")
+    tracker.plan([1, 2, 3])
+    assert tracker.predict_remaining() == pytest.approx(103)
+    tracker.advance(1)
+    assert progress.processed_bytes == 1
+    assert tracker.predict_remaining() == pytest.approx(102)
+    tracker.advance(2)
+    tracker.advance(3)
+    assert tracker.finish() == JobCost(3, 6)
+
+    tracker.start("a")
+    tracker.plan([1, 2, 3])
+    tracker.advance(1)
+    tracker.skip(2)  # e.g., restored from checkpoint
+    assert progress.processed_bytes == 9
+    assert tracker.predict_remaining() == pytest.approx(101)
+    assert tracker.finish() is None  # duration not representative
+
+    tracker.start("b")
+    assert tracker.finish() == JobCost(10, 100)
+    assert tracker.predict_remaining() == 0
+
+
+def test_progress_tracker_unknown():
+    """Test class `ProgressTracker` without coefficients."""
+    progress = SimpleNamespace()
+    tracker = ProgressTracker(progress, ["a"], JobCost())
+    tracker.start("a")
+    tracker.plan([5])
+    tracker.advance(5)
+    assert progress.processed_bytes == 5
+    assert progress.eta is None
@@ -76,6 +76,47 @@ from dcm_object_validator import handlers
                 },
                 Responses().GOOD.status,
             ),
+            (
+                {
+                    "validation": {
+                        "target": {"path": "dir"},
+                        "report": {"verbosity": "unknown"},
+                    },
+                },
+                422,
+            ),
+            (
+                {
+                    "validation": {
+                        "target": {"path": "dir"},
+                        "report": {"verbosity": "summary"},
+                    },
+                },
+                Responses().GOOD.status,
+            ),
+            (
+                {
+                    "validation": {
+                        "target": {"path": "dir"},
+                        "report": {"timing": True},
+                    },
+                },
+                Responses().GOOD.status,
+            ),
+            (
+                {
+                    "validation": {"target": {"path": "good"}},
+                    "sync": "yes",
+                },
+                Responses().BAD_TYPE.status,
+            ),
+            (
+                {
+                    "validation": {"target": {"path": "good"}},
+                    "sync": True,
+                },
+                Responses().GOOD.status,
+            ),
         ]
     ),
     ids=[f"stage {i+1}" for i in range(len(pytest_args))],
@@ -0,0 +1,109 @@
+"""Test module for the metrics-collection."""
+
+import os
+import sys
+import json
+import subprocess
+
+from dcm_object_validator.metrics import Registry, merge, aggregate, render
+
+
+def test_registry():
+    """Test collecting metrics with a `Registry`."""
+    registry = Registry()
+    registry.inc("a")
+    assert registry.snapshot == {
+        "counters": {},
+        "maxima": {},
+        "histograms": {},
+    }
+
+    registry.configure(None)
+    registry.inc("a", labels={"plugin": "p"})
+    registry.inc("a", 2, labels={"plugin": "p"})
+    registry.observe("b", 0.002)
+    registry.observe("b", 1000)
+    registry.maximum("c", 2)
+    registry.maximum("c", 1)
+
+    snapshot = registry.snapshot
+    assert list(snapshot["counters"].values()) == [3]
+    assert list(snapshot["maxima"].values()) == [2]
+    buckets, sum_, count = list(snapshot["histograms"].values())[0]
+    assert sum(buckets) == 2
+    assert buckets[1] == 1
+    assert sum_ == 1000.002
+    assert count == 2
+
+
+def test_merge():
+    """Test function `merge`."""
+    registry = Registry()
+    registry.configure(None)
+    registry.inc("a")
+    registry.maximum("c", 3)
+    registry.observe("b", 0.5)
+    merged = merge([registry.snapshot, registry.snapshot])
+
+    assert list(merged["counters"].values()) == [2]
+    assert list(merged["maxima"].values()) == [3]
+    buckets, sum_, count = list(merged["histograms"].values())[0]
+    assert sum(buckets) == 2
+    assert sum_ == 1.0
+    assert count == 2
+
+
+def test_aggregate_and_render(tmp_path):
+    """
+    Test functions `aggregate` and `render` with snapshots of
+    multiple processes.
+    """
+    registry = Registry()
+    registry.configure(tmp_path)
+    registry.inc("validator_records_total", labels={"plugin": "p"})
+    registry.observe("validator_record_duration_seconds", 0.5)
+    registry.write()
+    assert (tmp_path / f"{os.getpid()}.json").is_file()
+
+    # fake snapshot of another process
+    (tmp_path / f"{os.getppid()}.json").write_text(
+        json.dumps(registry.snapshot), encoding="utf-8"
+    )
+
+    output = render(aggregate(tmp_path))
+    print(output)
+    assert "# TYPE validator_records_total counter" in output
+    assert 'validator_records_total{plugin="p"} 2' in output
+    assert "# TYPE validator_record_duration_seconds histogram" in output
+    assert 'validator_record_duration_seconds_bucket{le="0.5"} 2' in output
+    assert 'validator_record_duration_seconds_bucket{le="+Inf"} 2' in output
+    assert "validator_record_duration_seconds_count 2" in output
+
+
+def test_aggregate_archives_dead_processes(tmp_path):
+    """
+    Test function `aggregate` with snapshots of exited processes being
+    archived (counters remain monotonic).
+    """
+    registry = Registry()
+    registry.configure(None)
+    registry.inc("validator_records_total")
+    registry.maximum("validator_tool_max_rss_bytes", 5)
+
+    for _ in range(2):
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        (tmp_path / f"{process.pid}.json").write_text(
+            json.dumps(registry.snapshot), encoding="utf-8"
+        )
+        snapshot = aggregate(tmp_path)
+        assert not (tmp_path / f"{process.pid}.json").exists()
+    assert (tmp_path / ".archive").is_file()
+
+    baseline = aggregate(tmp_path / "empty")
+    key = '["validator_records_total", {}]'
+    assert snapshot["counters"][key] == baseline["counters"].get(key, 0) + 2
+    assert snapshot["maxima"]['["validator_tool_max_rss_bytes", {}]'] >= 5
+
+    # archive is stable across aggregations
+    assert aggregate(tmp_path) == snapshot
@@ -1,12 +1,61 @@
 """Test module for the `Report` data model."""
 
+from pathlib import Path
+import json
+
+import pytest
 from dcm_common.models.data_model import get_model_serialization_test
 
-from dcm_object_validator.models import Report
+from dcm_object_validator.models import (
+    ValidationProgress,
+    Report,
+    ValidationResult,
+)
+from dcm_object_validator.plugins.validation.interface import (
+    ValidationPluginResult,
+    ValidationPluginResultPart,
+)
+from dcm_object_validator.plugins.validation.records import RecordStore
 
 
+test_validation_progress_json = get_model_serialization_test(
+    ValidationProgress, (
+        ((), {}),
+        ((), {"processed_bytes": 1, "eta": "2026-01-01T00:00:00+00:00"}),
+    )
+)
 test_report_json = get_model_serialization_test(
     Report, (
         ((), {"host": ""}),
     )
 )
+
+
+@pytest.mark.parametrize(
+    "records",
+    [None, {}, "dict", "store"],
+    ids=["no-records", "empty", "dict", "store"],
+)
+def test_report_iter_json(records):
+    """Test method `iter_json` of `Report`."""
+    parts = {
+        i: ValidationPluginResultPart(path=Path(f"dir/{i}"), success=True)
+        for i in range(3)
+    }
+    if records == "dict":
+        records = parts
+    elif records == "store":
+        records = RecordStore(ValidationPluginResultPart)
+        records.update(parts)
+    report = Report(
+        host="",
+        data=ValidationResult(
+            success=True,
+            details={
+                "0": ValidationPluginResult(success=True, records=records),
+                "1": ValidationPluginResult(),
+            },
+        ),
+    )
+
+    assert json.loads("".join(report.iter_json())) == report.json
@@ -3,13 +3,27 @@
 from pathlib import Path
 from dcm_common.models.data_model import get_model_serialization_test
 
-from dcm_object_validator.models import Target, ValidationConfig, PluginConfig
+from dcm_object_validator.models import (
+    Target,
+    ValidationConfig,
+    PluginConfig,
+    ReportConfig,
+)
 
 
 test_plugin_config_json = get_model_serialization_test(
     PluginConfig, ((("plugin-id", {}), {}),)
 )
 
+test_report_config_json = get_model_serialization_test(
+    ReportConfig,
+    (
+        ((), {}),
+        ((), {"verbosity": "summary"}),
+        ((), {"verbosity": "errors-only", "timing": True}),
+    ),
+)
+
 test_validation_config_json = get_model_serialization_test(
     ValidationConfig,
     (
@@ -21,5 +35,9 @@ test_validation_config_json = get_model_serialization_test(
             ),
             {},
         ),
+        (
+            (Target(Path(".")), {}),
+            {"report": ReportConfig("errors-only")},
+        ),
     ),
 )
@@ -5,9 +5,12 @@ from pathlib import Path
 from dcm_common.models.data_model import get_model_serialization_test
 
 from dcm_object_validator.models import ValidationResult
+from dcm_object_validator.plugins.tools import ToolUsage
 from dcm_object_validator.plugins.validation.interface import (
     ValidationPluginResult,
     ValidationPluginResultPart,
+    ValidationPluginResultSummary,
+    ValidationTiming,
 )
 
 
@@ -35,10 +38,60 @@ test_validation_plugin_result_json = get_model_serialization_test(
                 "records": {"0": ValidationPluginResultPart(path=Path("."))},
             },
         ),
+        (
+            (),
+            {
+                "success": True,
+                "valid": False,
+                "records": {},
+                "summary": ValidationPluginResultSummary(2, 0, 1),
+            },
+        ),
+        (
+            (),
+            {
+                "records": {
+                    "0": ValidationPluginResultPart(
+                        path=Path("."), duration=0.1
+                    )
+                },
+                "timing": ValidationTiming(
+                    {"process": 0.1},
+                    1,
+                    [{"index": 0, "path": ".", "duration": 0.1}],
+                ),
+            },
+        ),
     ),
 )
 
 
+def test_validation_timing():
+    """Test methods of `ValidationTiming`."""
+    timing = ValidationTiming()
+    timing.add("a", 1)
+    timing.add("a", 2)
+    for index, duration in enumerate([0.3, 0.1, 0.2, 0.4]):
+        timing.add_record(index, Path(str(index)), duration, 2)
+
+    assert timing.phases == {"a": 3}
+    assert timing.records == 4
+    assert [r["index"] for r in timing.slowest] == [3, 0]
+
+    other = ValidationTiming()
+    other.add("a", 1)
+    other.add("b", 1)
+    other.add_record(0, Path("0"), 0.35, 2)
+    timing.merge(other, 2, plugin="x")
+
+    assert timing.phases == {"a": 4, "b": 1}
+    assert timing.records == 5
+    assert [(r["index"], r.get("plugin")) for r in timing.slowest] == [
+        (3, None),
+        (0, "x"),
+    ]
+
+
 test_validation_result_json = get_model_serialization_test(
     ValidationResult,
     (
@@ -51,5 +104,7 @@ test_validation_result_json = get_model_serialization_test(
                 "details": {"0": ValidationPluginResult()},
             },
         ),
+        ((), {"timing": ValidationTiming({"total": 1.0})}),
+        ((), {"tools": {"jhove": ToolUsage(1, 1.0, 0.5, 0.1, 1024)}}),
     ),
 )
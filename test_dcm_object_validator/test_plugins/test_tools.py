@@ -0,0 +1,126 @@
+"""Test module for the tool-helpers of plugins."""
+
+from time import time, monotonic, sleep
+from pathlib import Path
+from threading import Timer
+
+import pytest
+
+from dcm_object_validator.plugins.runtime import (
+    PluginRuntime,
+    Cancellation,
+    PluginCancelledError,
+    PluginTimeoutError,
+    use_runtime,
+)
+from dcm_object_validator.plugins.tools import (
+    ToolUsage,
+    merge_tool_usage,
+    run_tool,
+)
+
+
+def test_run_tool():
+    """Test function `run_tool`."""
+    result = run_tool(["echo", "test"])
+    assert result.returncode == 0
+    assert result.stdout == "test\n"
+    assert result.stderr == ""
+
+
+def test_run_tool_cancel():
+    """Test function `run_tool` with cancellation."""
+    cancellation = Cancellation()
+    Timer(0.1, cancellation.cancel).start()
+    time0 = time()
+    with use_runtime(PluginRuntime(cancellation=cancellation)):
+        with pytest.raises(PluginCancelledError):
+            run_tool(["sleep", "10"])
+    assert time() - time0 < 1
+
+
+def _alive(pid: int) -> bool:
+    """Returns `True` if process `pid` exists (and is no zombie)."""
+    try:
+        status = Path(f"/proc/{pid}/status").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return False
+    return "\nState:\tZ" not in status
+
+
+def test_run_tool_cancel_descendants(tmp_path):
+    """
+    Test function `run_tool` terminating processes started by the tool
+    on cancellation.
+    """
+    pid_file = tmp_path / "pid"
+    cancellation = Cancellation()
+    Timer(0.2, cancellation.cancel).start()
+    with use_runtime(PluginRuntime(cancellation=cancellation)):
+        with pytest.raises(PluginCancelledError):
+            run_tool(["sh", "-c", f"sleep 10 & echo $! > {pid_file}; wait"])
+
+    pid = int(pid_file.read_text(encoding="utf-8"))
+    time0 = time()
+    while _alive(pid) and time() - time0 < 2:
+        sleep(0.01)
+    assert not _alive(pid)
+
+
+def test_run_tool_timeout():
+    """Test function `run_tool` with exhausted time budget."""
+    time0 = time()
+    with use_runtime(
+        PluginRuntime(record_timeout=0.1, record_deadline=monotonic() + 0.1)
+    ):
+        with pytest.raises(PluginTimeoutError) as exc_info:
+            run_tool(["sleep", "10"])
+    assert time() - time0 < 1
+    assert "per-record time budget" in str(exc_info.value)
+
+
+def test_run_tool_heartbeat():
+    """Test function `run_tool` calling the runtime's heartbeat."""
+    beats = []
+    with use_runtime(PluginRuntime(heartbeat=lambda: beats.append(None))):
+        run_tool(["sleep", "0.5"])
+    assert len(beats) >= 2
+
+
+def test_run_tool_memory_limit():
+    """Test function `run_tool` with memory limit."""
+    with use_runtime(PluginRuntime(memory_limit=2**30)):
+        result = run_tool(["sh", "-c", "ulimit -v"])
+    assert result.stdout.strip() == str(2**30 // 1024)
+
+
+def test_run_tool_usage():
+    """Test resource accounting of function `run_tool`."""
+    tool_usage = {}
+    with use_runtime(PluginRuntime(tool_usage=tool_usage)):
+        for _ in range(2):
+            result = run_tool(["sh", "-c", "sleep 0.1"])
+
+    assert result.usage is not None
+    assert result.usage.calls == 1
+    assert result.usage.wall >= 0.1
+    assert result.usage.max_rss > 0
+    assert list(tool_usage) == ["sh"]
+    assert tool_usage["sh"].calls == 2
+    assert tool_usage["sh"].wall >= 0.2
+    assert tool_usage["sh"].max_rss >= result.usage.max_rss
+
+
+def test_tool_usage_merge():
+    """Test function `merge_tool_usage`."""
+    target = {"a": ToolUsage(1, 1.0, 0.5, 0.25, 100)}
+    merge_tool_usage(
+        target,
+        {
+            "a": ToolUsage(1, 2.0, 0.5, 0.25, 50),
+            "b": ToolUsage(1, 1.0, 0.5, 0.25, 10),
+        },
+    )
+
+    assert target["a"].json == ToolUsage(2, 3.0, 1.0, 0.5, 100).json
+    assert target["b"].json == ToolUsage(1, 1.0, 0.5, 0.25, 10).json
@@ -0,0 +1,143 @@
+"""Test module for the `Checkpoint`-store."""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from dcm_common.logger import LoggingContext as Context
+
+from dcm_object_validator.plugins import IntegrityPlugin
+from dcm_object_validator.plugins.validation.integrity import (
+    IntegrityPluginResult,
+)
+from dcm_object_validator.plugins.runtime import PluginRuntime, use_runtime
+from dcm_object_validator.plugins.validation.checkpoint import (
+    Checkpoint,
+    cleanup_checkpoints,
+)
+from dcm_object_validator.estimation import ProgressTracker
+from dcm_object_validator.scheduling import JobCost
+
+
+def test_checkpoint_get_put(tmp_path: Path):
+    """Test methods `get` and `put` of `Checkpoint`."""
+    record = tmp_path / "file.txt"
+    record.write_text("a", encoding="utf-8")
+    checkpoint = Checkpoint(tmp_path / "checkpoint.sqlite")
+
+    assert checkpoint.get(record) is None
+    checkpoint.put(record, {"path": str(record)})
+    assert checkpoint.get(record) == {"path": str(record)}
+
+    # different namespace
+    assert checkpoint.bind("other").get(record) is None
+
+    # changed file
+    record.write_text("ab", encoding="utf-8")
+    assert checkpoint.get(record) is None
+
+
+def test_checkpoint_persistence(tmp_path: Path):
+    """Test persistence and deletion of `Checkpoint`."""
+    record = tmp_path / "file.txt"
+    record.write_text("a", encoding="utf-8")
+    checkpoint = Checkpoint(tmp_path / "checkpoint.sqlite", "0")
+    checkpoint.put(record, {"path": str(record)})
+    checkpoint.close()
+
+    assert Checkpoint(tmp_path / "checkpoint.sqlite", "0").get(record) == {
+        "path": str(record)
+    }
+
+    checkpoint.delete()
+    assert not (tmp_path / "checkpoint.sqlite").exists()
+
+
+def test_cleanup_checkpoints(tmp_path: Path):
+    """Test function `cleanup_checkpoints`."""
+    record = tmp_path / "file.txt"
+    record.write_text("a", encoding="utf-8")
+    for name in ["old", "new"]:
+        checkpoint = Checkpoint(tmp_path / "checkpoints" / f"{name}.sqlite")
+        checkpoint.put(record, {"path": str(record)})
+        checkpoint.close()
+    for file in (tmp_path / "checkpoints").glob("old.sqlite*"):
+        os.utime(file, (0, 0))
+
+    cleanup_checkpoints(tmp_path / "checkpoints", 3600)
+    assert sorted(
+        p.name for p in (tmp_path / "checkpoints").glob("*.sqlite")
+    ) == ["new.sqlite"]
+    assert not list((tmp_path / "checkpoints").glob("old.sqlite*"))
+
+    # missing directory
+    cleanup_checkpoints(tmp_path / "missing", 3600)
+
+
+def test_process_restore_from_checkpoint(
+    tmp_path: Path, file_storage: Path, object_good: Path, object_good_md5
+):
+    """
+    Test method `process` of `ValidationPlugin` restoring records from
+    `Checkpoint`.
+    """
+    plugin = IntegrityPlugin()
+    record = file_storage / object_good
+    checkpoint = Checkpoint(tmp_path / "checkpoint.sqlite")
+    # write fake result
+    checkpoint.put(
+        record,
+        IntegrityPluginResult(path=record, success=True, valid=False).json,
+    )
+
+    context = plugin.create_context(lambda msg: None, lambda: None)
+    progress = ProgressTracker(SimpleNamespace(), [plugin.name], JobCost())
+    progress.start(plugin.name)
+    with use_runtime(PluginRuntime(checkpoint=checkpoint, progress=progress)):
+        plugin.process(
+            context, [record], method="md5", value=object_good_md5
+        )
+    result = plugin.evaluate(context)
+
+    # restored records do not count as processed cost
+    assert progress.progress.processed_bytes == record.stat().st_size
+    assert progress.finish() is None
+
+    # result has been restored instead of recomputed
+    assert result.success
+    assert not result.valid
+    assert any(
+        "Restored 1 record(s)" in msg.body for msg in result.log[Context.INFO]
+    )
+
+    # without checkpoint
+    context = plugin.create_context(lambda msg: None, lambda: None)
+    plugin.process(context, [record], method="md5", value=object_good_md5)
+    assert plugin.evaluate(context).valid
+
+
+def test_process_timeout_not_checkpointed(
+    tmp_path: Path, file_storage: Path, object_good: Path, object_good_md5
+):
+    """
+    Test method `process` of `ValidationPlugin` not storing records
+    that exceeded their time budget in `Checkpoint`.
+    """
+    plugin = IntegrityPlugin()
+    record = file_storage / object_good
+    checkpoint = Checkpoint(tmp_path / "checkpoint.sqlite")
+
+    context = plugin.create_context(lambda msg: None, lambda: None)
+    progress = ProgressTracker(SimpleNamespace(), [plugin.name], JobCost())
+    progress.start(plugin.name)
+    with use_runtime(
+        PluginRuntime(
+            checkpoint=checkpoint, record_timeout=0, progress=progress
+        )
+    ):
+        plugin.process(
+            context, [record], method="md5", value=object_good_md5
+        )
+    assert not plugin.evaluate(context).success
+    assert checkpoint.get(record) is None
+    assert progress.finish() is None
@@ -2,11 +2,22 @@
 
 import hashlib
 from pathlib import Path
+from time import monotonic
 
 from dcm_common.logger import LoggingContext as Context
 import pytest
 
 from dcm_object_validator.plugins import IntegrityPlugin
+from dcm_object_validator.plugins.runtime import (
+    PluginRuntime,
+    Cancellation,
+    PluginCancelledError,
+    use_runtime,
+)
+from dcm_object_validator.plugins.validation.interface import (
+    ValidationTiming,
+)
+from dcm_object_validator.plugins.validation.records import RecordStore
 
 
 @pytest.fixture(name="default_plugin")
@@ -47,6 +58,262 @@ def test_get_invalid_path_batch(
         print(msg.body)
 
 
+def test_collect_process_evaluate_shards(
+    default_plugin: IntegrityPlugin,
+    file_storage: Path,
+    object_good: Path,
+    object_bad: Path,
+    object_good_md5,
+    object_bad_md5,
+):
+    """
+    Test methods `collect`, `process`, and `evaluate` of
+    `IntegrityPlugin` when processing records in separate shards.
+    """
+    context = default_plugin.create_context(lambda msg: None, lambda: None)
+    records, kwargs = default_plugin.collect(
+        context,
+        path=str((file_storage / object_good).parent),
+        method="md5",
+        manifest={
+            object_good.name: object_good_md5,
+            object_bad.name: object_bad_md5,
+        },
+    )
+    assert len(records) == 2
+    assert kwargs["method"] == "md5"
+
+    # process in reverse order
+    default_plugin.process(context, records[1:], offset=1, **kwargs)
+    default_plugin.process(context, records[:1], offset=0, **kwargs)
+    result = default_plugin.evaluate(context)
+
+    assert result.success
+    assert result.valid
+    assert sorted(result.records.keys()) == [0, 1]
+    assert result.records[0].path == records[0]
+    assert result.records[1].path == records[1]
+    assert isinstance(
+        default_plugin.load_part(result.records[0].json),
+        type(result.records[0]),
+    )
+
+
+def test_process_cancelled(
+    default_plugin: IntegrityPlugin, file_storage: Path, object_good: Path
+):
+    """Test method `process` of `IntegrityPlugin` after cancellation."""
+    cancellation = Cancellation()
+    cancellation.cancel()
+    context = default_plugin.create_context(lambda msg: None, lambda: None)
+    with use_runtime(PluginRuntime(cancellation=cancellation)):
+        with pytest.raises(PluginCancelledError):
+            default_plugin.process(
+                context, [file_storage / object_good], value=""
+            )
+    assert len(context.result.records) == 0
+
+
+def test_process_record_timeout(
+    default_plugin: IntegrityPlugin,
+    file_storage: Path,
+    object_good: Path,
+    object_good_md5,
+):
+    """
+    Test method `process` of `IntegrityPlugin` with exhausted record
+    time budget.
+    """
+    context = default_plugin.create_context(lambda msg: None, lambda: None)
+    with use_runtime(PluginRuntime(record_timeout=0)):
+        default_plugin.process(
+            context, [file_storage / object_good], value=object_good_md5
+        )
+    result = default_plugin.evaluate(context)
+
+    assert not result.success
+    assert not result.records[0].success
+    assert Context.ERROR in result.records[0].log
+    assert "time budget" in result.records[0].log[Context.ERROR][0].body
+
+
+def test_process_job_timeout(
+    default_plugin: IntegrityPlugin,
+    file_storage: Path,
+    object_good: Path,
+    object_bad: Path,
+    object_good_md5,
+):
+    """
+    Test method `process` of `IntegrityPlugin` with exhausted job time
+    budget.
+    """
+    context = default_plugin.create_context(lambda msg: None, lambda: None)
+    with use_runtime(PluginRuntime(deadline=monotonic())):
+        default_plugin.process(
+            context,
+            [file_storage / object_good, file_storage / object_bad],
+            value=object_good_md5,
+        )
+    result = default_plugin.evaluate(context)
+
+    assert not result.success
+    assert list(result.records.keys()) == [0]
+    assert "skipped 2 record(s)" in (
+        result.records[0].log[Context.ERROR][0].body
+    )
+
+
+def test_get_timing(
+    default_plugin: IntegrityPlugin,
+    file_storage: Path,
+    object_good: Path,
+    object_bad: Path,
+    object_good_md5,
+    object_bad_md5,
+):
+    """Test method `get` of `IntegrityPlugin` with timing."""
+    timing = ValidationTiming()
+    with use_runtime(PluginRuntime(timing=timing, slowest_records=1)):
+        result = default_plugin.get(
+            None,
+            path=str((file_storage / object_good).parent),
+            method="md5",
+            manifest={
+                object_good.name: object_good_md5,
+                object_bad.name: object_bad_md5,
+            },
+        )
+
+    assert result.timing is timing
+    assert sorted(timing.phases) == [
+        "collect", "evaluate", "hashing", "process"
+    ]
+    assert timing.records == 2
+    assert len(timing.slowest) == 1
+    assert all(
+        record.duration is not None for record in result.records.values()
+    )
+    assert "timing" in result.json
+
+
+def test_process_compact_records(
+    default_plugin: IntegrityPlugin,
+    file_storage: Path,
+    object_good: Path,
+    object_bad: Path,
+    object_good_md5,
+):
+    """
+    Test method `process` of `IntegrityPlugin` with compact records.
+    """
+    records = [file_storage / object_good, file_storage / object_bad]
+    results = []
+    for compact_records in (False, True):
+        context = default_plugin.create_context(
+            lambda msg: None, lambda: None
+        )
+        with use_runtime(PluginRuntime(compact_records=compact_records)):
+            default_plugin.process(
+                context, records, method="md5", value=object_good_md5
+            )
+        results.append(default_plugin.evaluate(context))
+
+    assert isinstance(results[1].records, RecordStore)
+    assert results[1].success
+    assert not results[1].valid
+    assert [
+        (r["path"], r["success"], r["valid"], r["method"])
+        for r in results[0].json["records"].values()
+    ] == [
+        (r["path"], r["success"], r["valid"], r["method"])
+        for r in results[1].json["records"].values()
+    ]
+
+
+@pytest.mark.parametrize(
+    ("verbosity", "records"),
+    [("full", [0, 1]), ("errors-only", [1]), ("summary", [])],
+    ids=["full", "errors-only", "summary"],
+)
+def test_process_verbosity(
+    verbosity,
+    records,
+    default_plugin: IntegrityPlugin,
+    file_storage: Path,
+    object_good: Path,
+    object_bad: Path,
+    object_good_md5,
+):
+    """
+    Test method `process` of `IntegrityPlugin` for different
+    verbosities.
+    """
+    context = default_plugin.create_context(lambda msg: None, lambda: None)
+    with use_runtime(PluginRuntime(verbosity=verbosity)):
+        default_plugin.process(
+            context,
+            [file_storage / object_good, file_storage / object_bad],
+            method="md5",
+            value=object_good_md5,
+        )
+    result = default_plugin.evaluate(context)
+
+    assert result.success
+    assert not result.valid
+    assert sorted(result.records.keys()) == records
+    if verbosity == "full":
+        assert result.summary is None
+        assert Context.ERROR in result.log
+    else:
+        assert result.summary.json == {"total": 2, "failed": 0, "invalid": 1}
+        assert Context.ERROR not in result.log
+        assert "summary" in result.json
+
+
+@pytest.mark.parametrize(
+    "record_order", ["largest-first", "smallest-first", "physical"]
+)
+def test_get_record_order(
+    record_order,
+    default_plugin: IntegrityPlugin,
+    file_storage: Path,
+    object_good: Path,
+    object_bad: Path,
+    object_good_md5,
+    object_bad_md5,
+):
+    """
+    Test method `get` of `IntegrityPlugin` with record order-policies.
+    """
+    result_default = default_plugin.get(
+        None,
+        path=str((file_storage / object_good).parent),
+        method="md5",
+        manifest={
+            object_good.name: object_good_md5,
+            object_bad.name: object_bad_md5,
+        },
+    )
+    with use_runtime(PluginRuntime(record_order=record_order)):
+        result = default_plugin.get(
+            None,
+            path=str((file_storage / object_good).parent),
+            method="md5",
+            manifest={
+                object_good.name: object_good_md5,
+                object_bad.name: object_bad_md5,
+            },
+        )
+
+    assert result.valid
+    # records keep the indices of the discovery-order
+    assert list(result.records.keys()) == [0, 1]
+    assert [r.path for r in result.records.values()] == [
+        r.path for r in result_default.records.values()
+    ]
+
+
 # --------------------------------------------------------------------
 # ------ integrity-specific tests
 
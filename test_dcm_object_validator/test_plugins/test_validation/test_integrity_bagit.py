@@ -185,3 +185,24 @@ def test_get_bad_bag(
     assert Context.ERROR in result.log
     for msg in result.log[Context.ERROR]:
         print(msg.body)
+
+
+def test_prepare(
+    default_plugin: BagItIntegrityPlugin,
+    file_storage: Path,
+    bag_good: Path,
+):
+    """
+    Test method `prepare` of `BagItIntegrityPlugin` (hydration without
+    record collection).
+    """
+    context = default_plugin.create_context(lambda msg: None, lambda: None)
+    kwargs = default_plugin.prepare(context, path=str(file_storage / bag_good))
+    assert len(kwargs["manifest"]) == 7
+    assert context.result.records is None
+
+    assert (
+        default_plugin.prepare(context, path=str(file_storage / "unknown"))
+        is None
+    )
+    assert context.result.success is False
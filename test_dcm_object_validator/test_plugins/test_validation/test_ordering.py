@@ -0,0 +1,92 @@
+"""Test module for the ordering of records."""
+
+import pytest
+
+from dcm_object_validator.plugins.validation.ordering import (
+    stat_records,
+    order_records,
+    balance_shards,
+)
+
+
+@pytest.fixture(name="records")
+def _records(tmp_path):
+    records = []
+    for name, size in [("a", 20), ("b", 30), ("c", 10)]:
+        (tmp_path / name).write_bytes(b"x" * size)
+        records.append(tmp_path / name)
+    return records + [tmp_path / "missing"]
+
+
+def test_stat_records(records):
+    """Test function `stat_records`."""
+    stats = stat_records(records)
+    assert [s.st_size for s in stats[:3]] == [20, 30, 10]
+    assert stats[3] is None
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [
+        ("discovery", [0, 1, 2, 3]),
+        ("largest-first", [1, 0, 2, 3]),
+        ("smallest-first", [2, 0, 1, 3]),
+    ],
+)
+def test_order_records(records, policy, expected):
+    """Test function `order_records`."""
+    assert order_records(stat_records(records), policy) == expected
+
+
+def test_order_records_physical(records):
+    """Test function `order_records` for policy 'physical'."""
+    stats = stat_records(records)
+    order = order_records(stats, "physical")
+    assert order[-1] == 3
+    assert [stats[p].st_ino for p in order[:-1]] == sorted(
+        s.st_ino for s in stats[:-1]
+    )
+
+
+def test_order_records_unknown():
+    """Test function `order_records` for unknown policy."""
+    with pytest.raises(ValueError):
+        order_records([], "unknown")
+
+
+def test_balance_shards():
+    """Test function `balance_shards`."""
+    sizes = [100, 1, 1, 1, 50, 50]
+    shards = balance_shards(sizes, 2)
+    assert sorted(p for shard in shards for p in shard) == list(range(6))
+    assert sorted(sum(sizes[p] for p in shard) for shard in shards) == [
+        101,
+        102,
+    ]
+    assert balance_shards([0] * 4, 2) == [[0, 2], [1, 3]]
+    assert balance_shards([1], 3) == [[0]]
+    assert balance_shards([], 3) == []
+
+
+@pytest.mark.parametrize(
+    "sizes",
+    [
+        [100, 1, 1, 1],
+        [1000] + [1] * 9,
+        list(range(25)),
+        [0] * 7,
+    ],
+)
+def test_balance_shards_capacity(sizes):
+    """Test function `balance_shards` with `capacity`."""
+    shards = balance_shards(sizes, -(-len(sizes) // 2), 2)
+    assert sorted(p for shard in shards for p in shard) == list(
+        range(len(sizes))
+    )
+    assert all(len(shard) <= 2 for shard in shards)
+
+
+def test_balance_shards_capacity_exceeded():
+    """Test function `balance_shards` with insufficient `capacity`."""
+    with pytest.raises(ValueError):
+        balance_shards([1] * 5, 2, 2)
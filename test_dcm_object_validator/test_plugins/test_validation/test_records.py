@@ -0,0 +1,38 @@
+"""Test module for the `RecordStore`."""
+
+from pathlib import Path
+
+from dcm_common.logger import LoggingContext as Context, Logger
+
+from dcm_object_validator.plugins.validation.integrity import (
+    IntegrityPluginResult,
+)
+from dcm_object_validator.plugins.validation.records import RecordStore
+
+
+def test_record_store():
+    """Test basic functionality of `RecordStore`."""
+    store = RecordStore(IntegrityPluginResult)
+    parts = {
+        1: IntegrityPluginResult(
+            path=Path("a/b/c.txt"), success=True, valid=False, method="md5"
+        ),
+        0: IntegrityPluginResult(path=Path("d.txt"), log=Logger()),
+    }
+    parts[1].log.log(Context.ERROR, body="error")
+    for index, part in parts.items():
+        store[index] = part
+
+    assert len(store) == 2
+    assert list(store) == [0, 1]
+    assert list(store.states()) == [(True, False), (None, None)]
+    for index, part in parts.items():
+        assert isinstance(store[index], IntegrityPluginResult)
+        assert store[index].json == part.json
+    assert store.json == {str(k): v.json for k, v in sorted(parts.items())}
+
+    # overwrite and delete
+    store[1] = parts[0]
+    assert store[1].path == Path("d.txt")
+    del store[0]
+    assert list(store) == [1]
@@ -0,0 +1,89 @@
+"""Test module for the profiling of jobs."""
+
+import os
+import pstats
+import tracemalloc
+
+from dcm_object_validator.profiling import JobProfiler
+
+
+def _work():
+    return sum(range(1000))
+
+
+def _functions(file):
+    return {f[2] for f in pstats.Stats(str(file)).stats}
+
+
+def test_job_profiler(tmp_path):
+    """Test `JobProfiler` for an entire job."""
+    with JobProfiler(tmp_path, "job", memory=True):
+        _work()
+
+    assert "_work" in _functions(tmp_path / "job.prof")
+    assert tracemalloc.Snapshot.load(str(tmp_path / "job.tracemalloc"))
+    assert not tracemalloc.is_tracing()
+
+
+def test_job_profiler_records(tmp_path):
+    """Test `JobProfiler` for records."""
+
+    def _other_work():
+        return sum(range(1000))
+
+    with JobProfiler(tmp_path, "job", records=True) as profiler:
+        _other_work()
+        with profiler.record():
+            _work()
+
+    functions = _functions(tmp_path / "job.prof")
+    assert "_work" in functions
+    assert "_other_work" not in functions
+    assert not (tmp_path / "job.tracemalloc").exists()
+
+
+def test_job_profiler_retention(tmp_path):
+    """Test retention of `JobProfiler`."""
+    for i in range(3):
+        with JobProfiler(tmp_path, str(i), retention=2):
+            _work()
+        # ensure distinct modification times
+        os.utime(tmp_path / f"{i}.prof", (i, i))
+
+    with JobProfiler(tmp_path, "3", retention=2):
+        _work()
+
+    assert sorted(p.name for p in tmp_path.glob("*.prof")) == [
+        "2.prof",
+        "3.prof",
+    ]
+
+
+def test_job_profiler_overlapping_memory(tmp_path):
+    """
+    Test that overlapping `JobProfiler`s keep tracing memory until the
+    last one exits.
+    """
+    first = JobProfiler(tmp_path, "first", memory=True, records=True)
+    second = JobProfiler(tmp_path, "second", memory=True, records=True)
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    assert tracemalloc.is_tracing()
+    second.__exit__(None, None, None)
+    assert not tracemalloc.is_tracing()
+    assert tracemalloc.Snapshot.load(str(tmp_path / "second.tracemalloc"))
+
+
+def test_job_profiler_external_tracemalloc(tmp_path):
+    """
+    Test that `JobProfiler` does not stop tracing memory if it has been
+    started elsewhere.
+    """
+    tracemalloc.start()
+    try:
+        with JobProfiler(tmp_path, "job", memory=True, records=True):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
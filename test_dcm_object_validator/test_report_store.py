@@ -0,0 +1,63 @@
+"""Test module for the file-based report store."""
+
+from types import SimpleNamespace
+import os
+
+from dcm_object_validator.report_store import ReportStore
+
+
+class _Part:
+    def __init__(self, path):
+        self.json = {"path": path}
+
+
+def _report(records):
+    return SimpleNamespace(
+        iter_json=lambda: iter(['{"data": ', '"x"}']),
+        data=SimpleNamespace(
+            details={"0": SimpleNamespace(records=records), "1": None}
+        ),
+    )
+
+
+def test_report_store(tmp_path):
+    """Test writing and reading reports with `ReportStore`."""
+    store = ReportStore(tmp_path)
+    store.write("job", _report({1: _Part("b"), 0: _Part("a")}))
+
+    assert "".join(store.iter_report("job", chunk_size=2)) == '{"data": "x"}'
+    assert list(store.iter_records("job")) == [
+        {"plugin": "0", "index": 0, "record": {"path": "a"}},
+        {"plugin": "0", "index": 1, "record": {"path": "b"}},
+    ]
+    assert not list(tmp_path.glob(".*"))
+
+
+def test_report_store_unknown(tmp_path):
+    """Test `ReportStore` for unknown and invalid tokens."""
+    store = ReportStore(tmp_path / "reports")
+    store.write("job", _report({}))
+
+    assert store.iter_report("other") is None
+    assert store.iter_records("other") is None
+    for token in ["", "..", ".job", "../reports/job", "a/job"]:
+        store.write(token, _report({}))
+        assert store.iter_report(token) is None
+        assert store.iter_records(token) is None
+    assert sorted(p.name for p in (tmp_path / "reports").iterdir()) == [
+        "job.json",
+        "job.records.ndjson",
+    ]
+
+
+def test_report_store_retention(tmp_path):
+    """Test retention of `ReportStore`."""
+    store = ReportStore(tmp_path, retention=2)
+    for i in range(3):
+        store.write(f"job{i}", _report({}))
+        os.utime(tmp_path / f"job{i}.records.ndjson", (i, i))
+    store.apply_retention()
+
+    assert store.iter_report("job0") is None
+    assert store.iter_report("job1") is not None
+    assert store.iter_report("job2") is not None
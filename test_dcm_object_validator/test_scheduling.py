@@ -0,0 +1,187 @@
+"""Test module for the job-size-aware scheduling."""
+
+from time import time
+import json
+
+import pytest
+
+from dcm_object_validator.scheduling import (
+    EXPRESS,
+    BULK,
+    JobCost,
+    AdmissionError,
+    LaneRegistry,
+    estimate_cost,
+    classify,
+)
+
+
+@pytest.fixture(name="target")
+def _target(tmp_path):
+    target = tmp_path / "target"
+    (target / "a" / "b").mkdir(parents=True)
+    (target / "file0").write_bytes(b"x" * 10)
+    (target / "a" / "file1").write_bytes(b"x" * 20)
+    (target / "a" / "b" / "file2").write_bytes(b"x" * 30)
+    return target
+
+
+def test_estimate_cost(target):
+    """Test function `estimate_cost`."""
+    assert estimate_cost(target) == JobCost(3, 60)
+    assert estimate_cost(target / "file0") == JobCost(1, 10)
+    assert estimate_cost(target / "unknown") == JobCost()
+    assert not estimate_cost(target, limit=2).complete
+
+
+@pytest.mark.parametrize(
+    ("cost", "expected"),
+    [
+        (JobCost(3, 60), EXPRESS),
+        (JobCost(4, 60), BULK),
+        (JobCost(3, 61), BULK),
+        (JobCost(1, 1, complete=False), BULK),
+    ],
+    ids=["express", "files", "size", "incomplete"],
+)
+def test_classify(cost, expected):
+    """Test function `classify`."""
+    assert classify(cost, 3, 60) == expected
+
+
+def test_lane_registry(tmp_path):
+    """Test capacities of `LaneRegistry`."""
+    lanes = LaneRegistry(tmp_path, {EXPRESS: None, BULK: 1})
+
+    assert lanes.admit("a", BULK, JobCost(1, 1))
+    assert not lanes.admit("a", BULK, JobCost(1, 1))
+    with pytest.raises(AdmissionError) as exc_info:
+        lanes.admit("b", BULK, JobCost(1, 1))
+    assert exc_info.value.status == 429
+    assert exc_info.value.retry_after is None
+    for token in ["c", "d"]:
+        lanes.admit(token, EXPRESS, JobCost(1, 1))
+    assert len(lanes.entries()) == 3
+    assert [e["token"] for e in lanes.entries(BULK)] == ["a"]
+
+    lanes.start("a")
+    assert lanes.entries(BULK)[0]["started"] <= time()
+    lanes.release("a")
+    lanes.admit("b", BULK, JobCost(1, 1))
+
+
+def test_lane_registry_stale(tmp_path):
+    """Test removal of stale entries in `LaneRegistry`."""
+    lanes = LaneRegistry(tmp_path, {BULK: 1})
+    lanes.admit("a", BULK, JobCost())
+
+    # within grace period
+    with pytest.raises(AdmissionError):
+        lanes.admit("b", BULK, JobCost(), lambda token: True)
+
+    lanes.grace = 0
+    with pytest.raises(AdmissionError):
+        lanes.admit("b", BULK, JobCost(), lambda token: False)
+    lanes.admit("b", BULK, JobCost(), lambda token: token == "a")
+    assert [e["token"] for e in lanes.entries()] == ["b"]
+
+
+def test_lane_registry_throughput(tmp_path):
+    """Test history and throughput of `LaneRegistry`."""
+    lanes = LaneRegistry(tmp_path, {}, history=2)
+    assert lanes.throughput() is None
+
+    for token in ["a", "b", "c"]:
+        lanes.admit(token, EXPRESS, JobCost(1, 100))
+        lanes.start(token)
+        lanes.release(token)
+    # released without start
+    lanes.admit("d", EXPRESS, JobCost(1, 100))
+    lanes.release("d")
+
+    assert len(lanes.completed()) == 2
+    jobs, size = lanes.throughput()
+    assert jobs > 0
+    assert size == pytest.approx(100 * jobs)
+    assert lanes.throughput(BULK) is None
+
+    # completions outside of window
+    history = lanes.completed()
+    for c in history:
+        c["started"] -= 3600
+        c["finished"] -= 3600
+    (tmp_path / ".history").write_text(json.dumps(history), encoding="utf-8")
+    assert lanes.throughput() is None
+
+    # long-running job within window
+    history[-1]["started"] = time() - 7200
+    history[-1]["finished"] = time() - 60
+    (tmp_path / ".history").write_text(json.dumps(history), encoding="utf-8")
+    jobs, _ = lanes.throughput(window=600)
+    assert jobs == pytest.approx(1 / 600, rel=0.01)
+
+
+def test_lane_registry_queue_depth(tmp_path):
+    """Test admission control by queue depth in `LaneRegistry`."""
+    lanes = LaneRegistry(tmp_path, {}, max_queue_depth=1)
+    lanes.admit("a", EXPRESS, JobCost())
+    with pytest.raises(AdmissionError) as exc_info:
+        lanes.admit("b", BULK, JobCost())
+    assert exc_info.value.status == 503
+
+    # running jobs do not count
+    lanes.start("a")
+    lanes.admit("b", BULK, JobCost())
+
+
+def test_lane_registry_queued_size(tmp_path):
+    """Test admission control by queued size in `LaneRegistry`."""
+    lanes = LaneRegistry(tmp_path, {}, max_queued_size=100)
+
+    # always admitted into empty queue
+    lanes.admit("a", BULK, JobCost(1, 200))
+    with pytest.raises(AdmissionError) as exc_info:
+        lanes.admit("b", EXPRESS, JobCost(1, 1))
+    assert exc_info.value.status == 503
+    assert exc_info.value.retry_after is None
+
+    # retry-after based on throughput
+    lanes.start("a")
+    lanes.release("a")
+    lanes.admit("b", BULK, JobCost(1, 60))
+    with pytest.raises(AdmissionError) as exc_info:
+        lanes.admit("c", BULK, JobCost(1, 60))
+    assert exc_info.value.retry_after > 0
+
+
+def test_lane_registry_load(tmp_path):
+    """Test method `LaneRegistry.load`."""
+    lanes = LaneRegistry(tmp_path, {BULK: 2})
+    load = lanes.load(2)
+    assert load["queued"] == 0
+    assert load["running"] == 0
+    assert load["busy_ratio"] == 0
+    assert load["lanes"][BULK]["capacity"] == 2
+    assert load["lanes"][EXPRESS]["mean_wait"] is None
+
+    lanes.admit("a", EXPRESS, JobCost())
+    lanes.start("a")
+    lanes.release("a")
+    lanes.admit("b", BULK, JobCost())
+    lanes.start("b")
+    lanes.admit("c", BULK, JobCost())
+
+    load = lanes.load(2)
+    assert load["queued"] == 1
+    assert load["running"] == 1
+    assert 0 < load["busy_ratio"] < 1
+    assert load["lanes"][BULK] == {
+        "queued": 1,
+        "running": 1,
+        "capacity": 2,
+        "max_wait": load["lanes"][BULK]["max_wait"],
+        "mean_wait": None,
+    }
+    assert load["lanes"][BULK]["max_wait"] >= 0
+    assert load["lanes"][EXPRESS]["mean_wait"] >= 0
+    assert lanes.load(0)["busy_ratio"] is None
@@ -0,0 +1,51 @@
+"""Test module for the streaming JSON-serialization."""
+
+import json
+import gzip
+
+import pytest
+
+from dcm_object_validator.serialization import iter_json, iter_bytes
+
+
+@pytest.fixture(name="report")
+def _report():
+    return {
+        "host": "",
+        "data": {
+            "details": {
+                "0": {
+                    "records": {
+                        str(i): {"path": f"dir/{i}", "success": True}
+                        for i in range(100)
+                    }
+                },
+                "1": {},
+            }
+        },
+    }
+
+
+@pytest.mark.parametrize("depth", [0, 1, 5])
+def test_iter_json(report, depth):
+    """Test function `iter_json`."""
+    chunks = list(iter_json(report, depth))
+
+    assert json.loads("".join(chunks)) == report
+    if depth == 0:
+        assert len(chunks) == 1
+    if depth == 5:
+        assert len(chunks) > 100
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_iter_bytes(report, compress):
+    """Test function `iter_bytes`."""
+    blocks = list(iter_bytes(iter_json(report, 5), compress, 1000))
+
+    if not compress:
+        assert len(blocks) > 1
+    data = b"".join(blocks)
+    if compress:
+        data = gzip.decompress(data)
+    assert json.loads(data) == report
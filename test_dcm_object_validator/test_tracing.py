@@ -0,0 +1,97 @@
+"""Test module for the tracing of jobs."""
+
+import json
+import os
+from threading import Thread
+
+from dcm_object_validator.tracing import JobTracer
+
+
+def test_job_tracer(tmp_path):
+    """Test `JobTracer`."""
+    file = tmp_path / "job.trace.json"
+    with JobTracer(file, args={"token": "abc"}) as tracer:
+        with tracer.span("a", "plugin", plugin="p"):
+            with tracer.span("b", "record"):
+                pass
+
+        def _worker():
+            with tracer.span("c", "tool"):
+                pass
+
+        thread = Thread(target=_worker, name="worker")
+        thread.start()
+        thread.join()
+
+    events = json.loads(file.read_text(encoding="utf-8"))
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert sorted(spans) == ["a", "b", "c", "job"]
+    assert spans["a"]["cat"] == "plugin"
+    assert spans["a"]["args"] == {"plugin": "p"}
+    assert spans["job"]["args"] == {"token": "abc"}
+    assert spans["a"]["ts"] <= spans["b"]["ts"]
+    assert spans["job"]["dur"] >= spans["a"]["dur"] >= spans["b"]["dur"]
+    assert spans["c"]["tid"] != spans["a"]["tid"]
+    assert sorted(e["args"]["name"] for e in events if e["ph"] == "M") == [
+        "MainThread",
+        "worker",
+    ]
+
+
+def test_job_tracer_incomplete(tmp_path):
+    """Test that spans of `JobTracer` are written incrementally."""
+    file = tmp_path / "job.trace.json"
+    tracer = JobTracer(file)
+    tracer.__enter__()
+    with tracer.span("a", "plugin"):
+        pass
+    tracer._file.flush()
+
+    # trace viewers accept unterminated arrays
+    events = json.loads(file.read_text(encoding="utf-8") + "]")
+    assert [e["name"] for e in events if e["ph"] == "X"] == ["a"]
+
+    tracer.__exit__(None, None, None)
+    events = json.loads(file.read_text(encoding="utf-8"))
+    assert [e["name"] for e in events if e["ph"] == "X"] == ["a", "job"]
+
+
+def test_job_tracer_exception(tmp_path):
+    """Test that `JobTracer` completes the file on exception."""
+    file = tmp_path / "job.trace.json"
+    try:
+        with JobTracer(file):
+            raise ValueError("test")
+    except ValueError:
+        pass
+
+    assert json.loads(file.read_text(encoding="utf-8"))[-1]["name"] == "job"
+
+
+def test_job_tracer_sample_record(tmp_path):
+    """Test method `sample_record` of `JobTracer`."""
+    assert all(
+        JobTracer(tmp_path, record_sample_rate=1).sample_record()
+        for _ in range(100)
+    )
+    assert not any(
+        JobTracer(tmp_path, record_sample_rate=0).sample_record()
+        for _ in range(100)
+    )
+
+
+def test_job_tracer_retention(tmp_path):
+    """Test retention of `JobTracer`."""
+    for i in range(3):
+        with JobTracer(tmp_path / f"{i}.trace.json", retention=2):
+            pass
+        # ensure distinct modification times
+        os.utime(tmp_path / f"{i}.trace.json", (i, i))
+
+    with JobTracer(tmp_path / "3.trace.json", retention=2):
+        pass
+
+    assert sorted(p.name for p in tmp_path.glob("*.trace.json")) == [
+        "2.trace.json",
+        "3.trace.json",
+    ]
@@ -0,0 +1,56 @@
+"""'Object Validator'-app test-module for metrics-endpoint."""
+
+from dcm_object_validator import app_factory
+
+
+def test_metrics(testing_config, tmp_path, object_good, object_good_md5):
+    """Test the GET-/metrics-endpoint."""
+
+    class ThisAppConfig(testing_config):
+        METRICS = True
+        METRICS_DIR = tmp_path
+
+    app = app_factory(ThisAppConfig())
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "value": object_good_md5,
+                            "batch": False,
+                        },
+                    }
+                },
+            }
+        },
+    )
+    assert response.status_code == 201
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    output = response.get_data(as_text=True)
+    print(output)
+    for line in (
+        'validator_records_total{plugin="integrity"}',
+        'validator_hashed_bytes_total{method="md5"}',
+        'validator_jobs_total{result="valid"}',
+        "validator_job_duration_seconds_count",
+        "validator_queue_wait_seconds_count",
+    ):
+        assert line in output
+
+
+def test_metrics_disabled(testing_config):
+    """Test the GET-/metrics-endpoint if disabled."""
+    client = app_factory(testing_config()).test_client()
+
+    assert client.get("/metrics").status_code == 404
@@ -0,0 +1,62 @@
+"""Test module for the `ThrottledPush`-class."""
+
+from time import sleep
+
+from dcm_object_validator.views.push import ThrottledPush
+
+
+def test_throttled_push():
+    """Test coalescing of calls by `ThrottledPush`."""
+    calls = []
+    push = ThrottledPush(lambda: calls.append(None), 0.1)
+
+    # first call is forwarded, subsequent calls are coalesced
+    for _ in range(10):
+        push()
+    assert len(calls) == 1
+    assert push.pending
+
+    # flush pending update
+    push.flush()
+    assert len(calls) == 2
+    assert not push.pending
+    push.flush()
+    assert len(calls) == 2
+
+    # forwarded again after interval
+    sleep(0.1)
+    push()
+    assert len(calls) == 3
+
+
+def test_throttled_push_poll():
+    """Test forwarding of pending updates by `ThrottledPush.poll`."""
+    calls = []
+    push = ThrottledPush(lambda: calls.append(None), 0.1)
+
+    # nothing pending
+    push.poll()
+    assert len(calls) == 0
+
+    push()
+    push()
+    assert len(calls) == 1
+
+    # pending but within interval
+    push.poll()
+    assert len(calls) == 1
+
+    # pending and interval passed
+    sleep(0.1)
+    push.poll()
+    assert len(calls) == 2
+    assert not push.pending
+
+
+def test_throttled_push_no_interval():
+    """Test `ThrottledPush` without throttling."""
+    calls = []
+    push = ThrottledPush(lambda: calls.append(None), 0)
+    for _ in range(10):
+        push()
+    assert len(calls) == 10
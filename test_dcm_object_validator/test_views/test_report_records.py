@@ -0,0 +1,202 @@
+"""'Object Validator'-app test-module for report-records-endpoint."""
+
+import json
+import gzip
+
+import pytest
+
+from dcm_object_validator import app_factory
+from dcm_object_validator.views.report import iter_records
+
+
+@pytest.fixture(name="report")
+def _report():
+    return {
+        "data": {
+            "details": {
+                "0": {
+                    "records": {
+                        "1": {"path": "a/2", "success": True, "valid": False},
+                        "0": {"path": "a/1", "success": True, "valid": True},
+                    }
+                },
+                "1": {
+                    "records": {
+                        "0": {"path": "b/1", "success": False},
+                    }
+                },
+                "2": {},
+            }
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({}, [("0", 0), ("0", 1), ("1", 0)]),
+        ({"plugin": "0"}, [("0", 0), ("0", 1)]),
+        ({"success": False}, [("1", 0)]),
+        ({"valid": False}, [("0", 1)]),
+        ({"path_prefix": "b/"}, [("1", 0)]),
+        ({"plugin": "1", "valid": True}, []),
+    ],
+    ids=["none", "plugin", "success", "valid", "path-prefix", "combined"],
+)
+def test_iter_records(report, filters, expected):
+    """Test function `iter_records`."""
+    assert [
+        (r["plugin"], r["index"]) for r in iter_records(report, **filters)
+    ] == expected
+
+
+def test_report_records(
+    testing_config, object_good, object_bad, object_good_md5
+):
+    """Test the GET-/report/records-endpoint."""
+    app = app_factory(testing_config())
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good.parent)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "manifest": {
+                                object_good.name: object_good_md5,
+                                object_bad.name: object_good_md5,
+                            },
+                        },
+                    }
+                },
+            }
+        },
+    )
+    assert response.status_code == 201
+    token = response.json["value"]
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+
+    # pages
+    page = client.get(f"/report/records?token={token}&limit=1").json
+    assert page["total"] == 2
+    assert page["offset"] == 0
+    assert len(page["records"]) == 1
+    page = client.get(f"/report/records?token={token}&offset=1").json
+    assert page["total"] == 2
+    assert len(page["records"]) == 1
+    assert page["records"][0]["index"] == 1
+
+    # filter
+    page = client.get(f"/report/records?token={token}&valid=false").json
+    assert page["total"] == 1
+    assert page["records"][0]["record"]["path"] == str(object_bad)
+
+    # ndjson
+    response = client.get(
+        f"/report/records?token={token}&format=ndjson&valid=true"
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = response.get_data(as_text=True).splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["record"]["path"] == str(object_good)
+
+
+def test_report_stream(testing_config, object_good, object_good_md5):
+    """Test the GET-/report/stream-endpoint."""
+    app = app_factory(testing_config())
+    client = app.test_client()
+
+    token = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "value": object_good_md5,
+                            "batch": False,
+                        },
+                    }
+                },
+            }
+        },
+    ).json["value"]
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+    report = client.get(f"/report?token={token}").json
+
+    response = client.get(f"/report/stream?token={token}")
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.json == report
+
+    response = client.get(
+        f"/report/stream?token={token}",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.data)) == report
+
+
+def test_report_store(testing_config, tmp_path, object_good, object_good_md5):
+    """Test report-endpoints with `REPORT_STORE_DIR`."""
+
+    class ThisConfig(testing_config):
+        REPORT_STORE_DIR = tmp_path
+
+    app = app_factory(ThisConfig())
+    client = app.test_client()
+
+    token = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "value": object_good_md5,
+                            "batch": False,
+                        },
+                    }
+                },
+            }
+        },
+    ).json["value"]
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+    assert (tmp_path / f"{token}.json").is_file()
+    assert (tmp_path / f"{token}.records.ndjson").is_file()
+
+    report = client.get(f"/report?token={token}").json
+    assert client.get(f"/report/stream?token={token}").json == report
+
+    page = client.get(f"/report/records?token={token}&valid=true").json
+    assert page["total"] == 1
+    assert page["records"] == list(iter_records(report, valid=True))
+
+
+def test_report_records_bad_requests(testing_config):
+    """Test the GET-/report/records-endpoint with bad requests."""
+    client = app_factory(testing_config()).test_client()
+
+    assert client.get("/report/records").status_code == 400
+    assert (
+        client.get("/report/records?token=unknown&offset=-1").status_code
+        == 422
+    )
+    assert client.get("/report/records?token=unknown").status_code == 404
+    assert client.get("/report/stream?token=unknown").status_code == 404
@@ -0,0 +1,62 @@
+"""'Object Validator'-app test-module for load-status-endpoint."""
+
+from dcm_object_validator import app_factory
+
+
+def test_load_status(testing_config):
+    """Test the GET-/status/load-endpoint without scheduling."""
+    config = testing_config()
+    app = app_factory(config, block=True)
+    client = app.test_client()
+
+    response = client.get("/status/load")
+    assert response.status_code == 200
+    assert response.json == {
+        "ready": True,
+        "workers": config.LOAD_STATUS_WORKERS,
+        "queued": None,
+        "running": None,
+        "busy_ratio": None,
+        "lanes": None,
+    }
+
+
+def test_load_status_scheduling(
+    testing_config, tmp_path, object_good, object_good_md5
+):
+    """Test the GET-/status/load-endpoint with scheduling."""
+
+    class ThisAppConfig(testing_config):
+        SCHEDULING_DIR = tmp_path / "scheduling"
+
+    app = app_factory(ThisAppConfig(), block=True)
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "value": object_good_md5,
+                            "batch": False,
+                        },
+                    }
+                },
+            }
+        },
+    )
+    assert response.status_code == 201
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+
+    response = client.get("/status/load")
+    assert response.status_code == 200
+    assert sorted(response.json["lanes"]) == ["bulk", "express"]
+    assert response.json["queued"] == 0
+    assert response.json["running"] == 0
+    assert response.json["lanes"]["express"]["mean_wait"] is not None
@@ -2,13 +2,21 @@
 
 from typing import Optional
 from dataclasses import dataclass
+from threading import Event
+from time import sleep
+from uuid import uuid4
+import json
 
 import pytest
+from flask import Flask
 from dcm_common import LoggingContext as Context
 from dcm_common.plugins.demo import DemoPlugin, DemoPluginResult
 
 from dcm_object_validator import app_factory
 from dcm_object_validator.config import AppConfig
+from dcm_object_validator.views import ValidationView
+from dcm_object_validator.plugins.runtime import Cancellation
+from dcm_object_validator.scheduling import EXPRESS, JobCost, get_lanes
 
 
 @dataclass
@@ -43,12 +51,28 @@ class _DemoPluginInvalid(DemoPlugin):
         return super().get(context, **kwargs)
 
 
+class _DemoPluginBlocking(DemoPlugin):
+    _NAME = "demo-blocking"
+    _CONTEXT = "validation"
+    _RESULT_TYPE = _DemoPluginResult
+    release = Event()
+
+    def get(self, context, /, **kwargs):
+        self.release.wait(10)
+        context.result.valid = True
+        return super().get(context, **kwargs)
+
+
 @pytest.fixture(name="testing_config_w_test_plugins")
 def _testing_config_w_test_plugins(testing_config):
     """Create instance of 'Object Validator'-app in TESTING-state."""
 
     class TestingConfig(testing_config):
-        VALIDATION_PLUGINS = [_DemoPluginValid, _DemoPluginInvalid]
+        VALIDATION_PLUGINS = [
+            _DemoPluginValid,
+            _DemoPluginInvalid,
+            _DemoPluginBlocking,
+        ]
 
     return TestingConfig
 
@@ -207,3 +231,534 @@ def test_validate_explicit_path_in_args(
     assert str(object_good) in str(report["data"]["details"]["0"]["log"])
     assert str(object_bad) not in str(report["data"]["details"]["0"]["log"])
     assert str(object_bad) in str(report["data"]["details"]["1"]["log"])
+
+
+def test_validate_sync(testing_config_w_test_plugins, object_good):
+    """Test the synchronous mode of the POST-/validate-endpoint."""
+
+    class ThisAppConfig(testing_config_w_test_plugins):
+        SYNC_VALIDATION = True
+
+    app = app_factory(ThisAppConfig())
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": _DemoPluginValid.name,
+                        "args": {
+                            "success": True,
+                        },
+                    }
+                },
+            },
+            "sync": True,
+        },
+    )
+    assert response.status_code == 200
+    assert response.json["progress"]["status"] == "completed"
+    assert response.json["data"]["success"]
+    assert response.json["data"]["valid"]
+    assert str(object_good) in str(response.json["data"]["details"]["0"])
+
+
+def test_validate_sync_busy(testing_config_w_test_plugins, object_good):
+    """
+    Test the synchronous mode of the POST-/validate-endpoint rejecting
+    requests while a (timed out) synchronous validation is running.
+    """
+
+    class ThisAppConfig(testing_config_w_test_plugins):
+        SYNC_VALIDATION = True
+        SYNC_VALIDATION_TIMEOUT = 0.1
+
+    app = app_factory(ThisAppConfig())
+    client = app.test_client()
+    json_ = {
+        "validation": {
+            "target": {"path": str(object_good)},
+            "plugins": {"0": {"plugin": _DemoPluginBlocking.name}},
+        },
+        "sync": True,
+    }
+
+    _DemoPluginBlocking.release.clear()
+    response = client.post("/validate", json=json_)
+    assert response.status_code == 503
+    assert "timeout" in response.text
+    response = client.post("/validate", json=json_)
+    assert response.status_code == 503
+    assert "busy" in response.text
+
+    _DemoPluginBlocking.release.set()
+    for _ in range(100):
+        response = client.post("/validate", json=json_)
+        if response.status_code == 200:
+            break
+        sleep(0.05)
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize(
+    ("sync_validation", "max_size"),
+    [(False, 10485760), (True, 0)],
+    ids=["disabled", "too-large"],
+)
+def test_validate_sync_fallback(
+    testing_config_w_test_plugins, object_good, sync_validation, max_size
+):
+    """
+    Test the POST-/validate-endpoint falling back to asynchronous mode
+    if the synchronous mode is not applicable.
+    """
+
+    class ThisAppConfig(testing_config_w_test_plugins):
+        SYNC_VALIDATION = sync_validation
+        SYNC_VALIDATION_MAX_SIZE = max_size
+
+    app = app_factory(ThisAppConfig())
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": _DemoPluginValid.name,
+                        "args": {
+                            "success": True,
+                        },
+                    }
+                },
+            },
+            "sync": True,
+        },
+    )
+    assert response.status_code == 201
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+    report = client.get(f"/report?token={response.json['value']}").json
+    assert report["data"]["valid"]
+
+
+def test_validate_sharding(
+    testing_config, object_good, object_bad, object_good_md5, object_bad_md5
+):
+    """Test the POST-/validate-endpoint with sharding enabled."""
+
+    class ThisAppConfig(testing_config):
+        SHARDING = True
+        SHARDING_SHARD_SIZE = 1
+        SHARDING_TIMEOUT = 0.1
+        SHARDING_POLL_INTERVAL = 0.01
+
+    app = app_factory(ThisAppConfig())
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good.parent)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "manifest": {
+                                object_good.name: object_good_md5,
+                                object_bad.name: object_bad_md5,
+                            },
+                        },
+                    }
+                },
+            }
+        },
+    )
+    assert response.status_code == 201
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+    report = client.get(f"/report?token={response.json['value']}").json
+
+    assert report["data"]["success"]
+    assert report["data"]["valid"]
+    records = report["data"]["details"]["0"]["records"]
+    assert list(records.keys()) == ["0", "1"]
+    assert sorted(r["path"] for r in records.values()) == sorted(
+        [str(object_good), str(object_bad)]
+    )
+
+
+def test_validate_timing(testing_config, object_good, object_good_md5):
+    """Test the POST-/validate-endpoint with timing-breakdown."""
+    app = app_factory(testing_config())
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "value": object_good_md5,
+                            "batch": False,
+                        },
+                    }
+                },
+                "report": {"timing": True},
+            }
+        },
+    )
+    assert response.status_code == 201
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+    report = client.get(f"/report?token={response.json['value']}").json
+
+    assert report["data"]["valid"]
+    timing = report["data"]["timing"]
+    assert {"plugin:0", "push", "total", "process", "hashing"} <= set(
+        timing["phases"]
+    )
+    assert timing["records"] == 1
+    assert timing["slowest"][0]["plugin"] == "0"
+    assert report["data"]["details"]["0"]["timing"]["records"] == 1
+    assert "duration" in report["data"]["details"]["0"]["records"]["0"]
+
+
+@pytest.mark.parametrize("records", [False, True], ids=["job", "records"])
+def test_validate_profiling(
+    records, testing_config, tmp_path, object_good, object_good_md5
+):
+    """Test the POST-/validate-endpoint with profiling."""
+
+    class ThisAppConfig(testing_config):
+        PROFILING_DIR = tmp_path
+        PROFILING_RECORDS = records
+
+    app = app_factory(ThisAppConfig())
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "value": object_good_md5,
+                            "batch": False,
+                        },
+                    }
+                },
+            }
+        },
+    )
+    assert response.status_code == 201
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+
+    assert (tmp_path / f"{response.json['value']}.prof").is_file()
+
+
+def test_validate_tracing(
+    testing_config, tmp_path, object_good, object_good_md5
+):
+    """Test the POST-/validate-endpoint with tracing."""
+
+    class ThisAppConfig(testing_config):
+        TRACING_DIR = tmp_path
+
+    app = app_factory(ThisAppConfig())
+    client = app.test_client()
+
+    response = client.post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": {
+                            "method": "md5",
+                            "value": object_good_md5,
+                            "batch": False,
+                        },
+                    }
+                },
+            }
+        },
+    )
+    assert response.status_code == 201
+
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+
+    token = response.json["value"]
+    events = json.loads(
+        (tmp_path / f"{token}.trace.json").read_text(encoding="utf-8")
+    )
+    categories = {e["cat"] for e in events if e["ph"] == "X"}
+    assert {"job", "plugin", "record", "report"} <= categories
+    assert next(e for e in events if e["cat"] == "job")["args"] == {
+        "token": token
+    }
+
+
+def test_validate_scheduling(
+    testing_config, tmp_path, object_good, object_good_md5
+):
+    """Test the POST-/validate-endpoint with scheduling lanes."""
+
+    class ThisAppConfig(testing_config):
+        SCHEDULING_DIR = tmp_path
+        SCHEDULING_BULK_CAPACITY = 0
+
+    json_ = {
+        "validation": {
+            "target": {"path": str(object_good)},
+            "plugins": {
+                "0": {
+                    "plugin": "integrity",
+                    "args": {
+                        "method": "md5",
+                        "value": object_good_md5,
+                        "batch": False,
+                    },
+                }
+            },
+        }
+    }
+
+    # express lane
+    app = app_factory(ThisAppConfig())
+    client = app.test_client()
+    response = client.post("/validate", json=json_)
+    assert response.status_code == 201
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+    assert client.get(
+        f"/report?token={response.json['value']}"
+    ).json["data"]["valid"]
+    assert not list(tmp_path.glob("*.json"))
+
+    # bulk lane (no capacity)
+    class ThisAppConfig2(ThisAppConfig):
+        SCHEDULING_EXPRESS_MAX_FILES = 0
+
+    app = app_factory(ThisAppConfig2())
+    response = app.test_client().post("/validate", json=json_)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == str(
+        ThisAppConfig2.SCHEDULING_RETRY_AFTER
+    )
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+
+
+def test_validate_scheduling_failed_submission(
+    testing_config, tmp_path, monkeypatch, object_good, object_good_md5
+):
+    """
+    Test that a failed submission via POST-/validate only releases the
+    lane-entry that has been created by the same request.
+    """
+
+    class ThisAppConfig(testing_config):
+        SCHEDULING_DIR = tmp_path
+
+    def queue_push(*args, **kwargs):
+        raise RuntimeError("queue unavailable")
+
+    config = ThisAppConfig()
+    monkeypatch.setattr(config.controller, "queue_push", queue_push)
+    client = app_factory(config).test_client()
+    json_ = {
+        "validation": {
+            "target": {"path": str(object_good)},
+            "plugins": {
+                "0": {
+                    "plugin": "integrity",
+                    "args": {
+                        "method": "md5",
+                        "value": object_good_md5,
+                        "batch": False,
+                    },
+                }
+            },
+        }
+    }
+
+    # new job
+    response = client.post("/validate", json=json_)
+    assert response.status_code == 500
+    assert not get_lanes(config).entries()
+
+    # job that has been registered before
+    token = str(uuid4())
+    get_lanes(config).admit(token, EXPRESS, JobCost(1, 1))
+    response = client.post("/validate", json=json_ | {"token": token})
+    assert response.status_code == 500
+    assert [e["token"] for e in get_lanes(config).entries()] == [token]
+
+
+def test_validate_estimate(
+    testing_config, tmp_path, file_storage, object_good, object_good_md5
+):
+    """
+    Test the POST-/validate/estimate-endpoint and the estimates in the
+    job progress.
+    """
+
+    class ThisAppConfig(testing_config):
+        ESTIMATION_FILE = tmp_path / "model.json"
+
+    json_ = {
+        "validation": {
+            "target": {"path": str(object_good)},
+            "plugins": {
+                "0": {
+                    "plugin": "integrity",
+                    "args": {
+                        "method": "md5",
+                        "value": object_good_md5,
+                        "batch": False,
+                    },
+                }
+            },
+        }
+    }
+    size = (file_storage / object_good).stat().st_size
+
+    config = ThisAppConfig()
+    app = app_factory(config)
+    client = app.test_client()
+
+    # no history
+    response = client.post("/validate/estimate", json=json_)
+    assert response.status_code == 200
+    assert response.json == {
+        "plugins": {
+            "0": {
+                "plugin": "integrity",
+                "records": 1,
+                "size": size,
+                "complete": True,
+                "duration": None,
+            }
+        },
+        "records": 1,
+        "size": size,
+        "duration": None,
+        "complete": True,
+    }
+
+    # path in plugin-args (relative to FS_MOUNT_POINT)
+    response = client.post(
+        "/validate/estimate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good.parent)},
+                "plugins": {
+                    "0": {
+                        "plugin": "integrity",
+                        "args": json_["validation"]["plugins"]["0"]["args"]
+                        | {"path": str(object_good)},
+                    }
+                },
+            }
+        },
+    )
+    assert response.status_code == 200
+    assert response.json["plugins"]["0"]["records"] == 1
+    assert response.json["plugins"]["0"]["size"] == size
+
+    # target exceeds SCHEDULING_STAT_LIMIT (not collected)
+    config.SCHEDULING_STAT_LIMIT = 0
+    response = client.post(
+        "/validate/estimate",
+        json=json_
+        | {
+            "validation": json_["validation"]
+            | {"target": {"path": str(object_good.parent)}}
+        },
+    )
+    del config.SCHEDULING_STAT_LIMIT
+    assert response.status_code == 200
+    assert response.json["plugins"]["0"]["complete"] is False
+    assert response.json["complete"] is False
+
+    # run job to collect history
+    token = client.post("/validate", json=json_).json["value"]
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+    progress = client.get(f"/report?token={token}").json["progress"]
+    assert progress["processed_bytes"] == size
+    assert progress["eta"] is None
+    assert ThisAppConfig.ESTIMATION_FILE.is_file()
+
+    response = client.post("/validate/estimate", json=json_)
+    assert response.json["plugins"]["0"]["duration"] >= 0
+    assert response.json["duration"] >= 0
+
+
+def test_validate_admission_control(testing_config, tmp_path, object_good):
+    """Test the POST-/validate-endpoint with admission control."""
+
+    class ThisAppConfig(testing_config):
+        SCHEDULING_DIR = tmp_path
+        ADMISSION_MAX_QUEUE_DEPTH = 0
+
+    app = app_factory(ThisAppConfig())
+    response = app.test_client().post(
+        "/validate",
+        json={
+            "validation": {
+                "target": {"path": str(object_good)},
+                "plugins": {
+                    "0": {"plugin": "integrity", "args": {"value": ""}}
+                },
+            }
+        },
+    )
+    assert response.status_code == 503
+    assert "queue depth" in response.text
+    assert response.headers["Retry-After"] == str(
+        ThisAppConfig.SCHEDULING_RETRY_AFTER
+    )
+    app.extensions["orchestra"].stop(stop_on_idle=True)
+
+
+def test_validate_cancel_on_abort(testing_config):
+    """
+    Test cancellation of jobs that are aborted via DELETE-/validate.
+    """
+    view = ValidationView(testing_config())
+    app = Flask(__name__)
+    app.register_blueprint(view.get_blueprint(), url_prefix="/")
+    client = app.test_client()
+
+    # abort-request while the job is registered
+    cancellation = Cancellation()
+    with view._cancel_on_abort("a", cancellation):
+        client.delete("/validate?token=b")
+        assert not cancellation.cancelled
+        client.delete("/validate?token=a")
+        assert cancellation.cancelled
+    assert "a" not in view._cancellations
+
+    # abort delivered as exception
+    cancellation = Cancellation()
+    with pytest.raises(KeyboardInterrupt):
+        with view._cancel_on_abort("a", cancellation):
+            raise KeyboardInterrupt()
+    assert cancellation.cancelled